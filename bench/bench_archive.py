@@ -0,0 +1,119 @@
+"""Offline archive against the local HTTP stand-in, which goes offline mid-run.
+
+Usage:
+    python bench/bench_archive.py [--pages 5] [--latency-ms 150]
+
+Makes --pages stand-in pages start-page favorites and loads each one
+(snapshot 1), then loads them again with the refresh interval at zero
+(same content, so no new file). Then the server goes offline: each page is
+opened again and must end up on its snapshot. The time until the
+snapshot has loaded is recorded, once through the failed-load fallback
+and once directly while the archive knows the network is down. Finally
+it compares archive_fast_open against the network with the server back
+online.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from standin import StandInServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--latency-ms", type=int, default=150)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    os.environ["VOID_DATA_DIR"] = tempfile.mkdtemp(prefix="void-bench-")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QEventLoop, QUrl
+    from PySide6.QtWidgets import QApplication
+    import void
+
+    server = StandInServer().start()
+    server.latency = args.latency_ms / 1000
+    app = QApplication(sys.argv)
+    browser = void.Browser("Void Bench")
+    browser.resize(1280, 800)
+    browser.show()
+    archive = browser.archive
+    tab = browser.current_tab()
+    urls = [server.page_url(f"fav{i}", resources=20, dom=600, trackers=0) for i in range(args.pages)]
+    browser.settings_data.set("sites", [{"name": f"Fav {i}", "url": u} for i, u in enumerate(urls)])
+
+    def spin(until, timeout=args.timeout):
+        deadline = time.perf_counter() + timeout
+        while not until() and time.perf_counter() < deadline:
+            app.processEvents(QEventLoop.AllEvents, 10)
+        return until()
+
+    def open_page(url):
+        """Seconds until the tab shows ``url`` or its snapshot, loaded."""
+        done = []
+        def finished(ok):
+            if ok and (archive.is_snapshot(tab.url()) or void.archive_key(tab.url()) == void.archive_key(QUrl(url))):
+                done.append(time.perf_counter())
+        tab.loadFinished.connect(finished)
+        start = time.perf_counter()
+        tab.setUrl(QUrl(url))
+        spin(lambda: done)
+        tab.loadFinished.disconnect(finished)
+        return (done[0] - start) if done else None
+
+    def snapshot_round():
+        before = archive.stats["snapshots"] + archive.stats["unchanged"] + archive.stats["failed"]
+        for url in urls:
+            open_page(url)
+            spin(lambda: False, archive.SNAPSHOT_DELAY_MS / 1000 + 0.1)
+        total = lambda: archive.stats["snapshots"] + archive.stats["unchanged"] + archive.stats["failed"]
+        spin(lambda: total() - before >= len(urls))
+
+    snapshot_round()
+    first = dict(archive.stats)
+    void.OfflineArchive.REFRESH_S = 0
+    snapshot_round()
+    void.OfflineArchive.REFRESH_S = 600
+    print(f"{args.pages} favorites, {args.latency_ms} ms server latency")
+    print(f"snapshots written {first['snapshots']}, second round: "
+          f"{archive.stats['snapshots'] - first['snapshots']} new, {archive.stats['unchanged']} unchanged, "
+          f"{archive.stats['failed']} failed; {archive.snapshot()['bytes'] / 1024:.0f} KiB on disk")
+
+    def open_all(forget_offline=False):
+        samples, served = [], 0
+        for url in urls:
+            if forget_offline:
+                archive.offline_since = None
+            seconds = open_page(url)
+            if seconds is not None:
+                samples.append(seconds * 1000)
+            served += archive.is_snapshot(tab.url())
+        return samples, served
+
+    server.offline = True
+    results = {"fallback": open_all(forget_offline=True), "known offline": open_all()}
+    server.offline = False
+    archive.offline_since = None
+    results["network"] = open_all()
+    browser.settings_data.set("archive_fast_open", True)
+    results["fast open"] = open_all()
+    browser.settings_data.set("archive_fast_open", False)
+
+    print(f"{'open':<14} {'median ms':>10} {'max ms':>10}  from snapshot")
+    for label, (samples, served) in results.items():
+        if samples:
+            print(f"{label:<14} {statistics.median(samples):>10.1f} {max(samples):>10.1f}  {served}/{args.pages}")
+    browser.close()
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Bridge round trips and latency per start-page open, plus what remote pages still see of it.
+
+Usage:
+    python bench/bench_bridge.py [--opens 20] [--updates 20]
+
+Opens void://start/ --opens times. For each open it records how many
+bridge slots the page called (every call is a round trip through the
+channel), and when the page had its settings (the "void-bridge-ready"
+performance mark, in ms since navigation start). Then it times
+--updates settings changes from the page: setSettings() until the
+pushed settingsChanged arrives back. Finally it loads a page from the
+local HTTP stand-in and checks whether a channel transport exists there.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from standin import StandInServer
+
+READY_JS = "(performance.getEntriesByName('void-bridge-ready')[0] || {}).startTime || null"
+UPDATE_JS = """(function() {
+  window.__benchPushed = null;
+  const start = performance.now();
+  const done = function() { bridge.settingsChanged.disconnect(done); window.__benchPushed = performance.now() - start; };
+  bridge.settingsChanged.connect(done);
+  bridge.setSettings(JSON.stringify({sidebar_width: %d}));
+})()"""
+TRANSPORT_JS = "typeof qt !== 'undefined' && !!qt.webChannelTransport"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--opens", type=int, default=20)
+    parser.add_argument("--updates", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=15)
+    args = parser.parse_args()
+
+    os.environ["VOID_DATA_DIR"] = tempfile.mkdtemp(prefix="void-bench-")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QEventLoop, QUrl
+    from PySide6.QtWidgets import QApplication
+    import void
+
+    app = QApplication(sys.argv)
+    browser = void.Browser("Void Bench")
+    browser.resize(1280, 800)
+    browser.show()
+    tab = browser.current_tab()
+    page = tab.page()
+    loaded = []
+    tab.loadFinished.connect(lambda ok: loaded.append(ok))
+
+    def spin(until, timeout=args.timeout):
+        deadline = time.perf_counter() + timeout
+        while not until() and time.perf_counter() < deadline:
+            app.processEvents(QEventLoop.AllEvents, 10)
+        return until()
+
+    def evaluate(code):
+        result = []
+        page.runJavaScript(code, 0, result.append)
+        spin(lambda: result)
+        return result[0] if result else None
+
+    def load(url):
+        loaded.clear()
+        tab.setUrl(QUrl(url))
+        return spin(lambda: loaded)
+
+    trips, ready = [], []
+    for i in range(args.opens):
+        before = sum(browser.bridge.calls.values())
+        if not load("void://start/"):
+            print(f"start page did not load (open {i})", file=sys.stderr)
+            continue
+        mark = None
+        deadline = time.perf_counter() + args.timeout
+        while mark is None and time.perf_counter() < deadline:
+            mark = evaluate(READY_JS)
+        # Nachzügler (Statistik-Abfrage) mitzählen
+        spin(lambda: False, 0.2)
+        trips.append(sum(browser.bridge.calls.values()) - before)
+        if mark is not None:
+            ready.append(mark)
+
+    pushed, pushes_before = [], browser.bridge.pushes
+    for i in range(args.updates):
+        page.runJavaScript(UPDATE_JS % (200 + i % 2 * 40), 0)
+        if spin(lambda: evaluate("window.__benchPushed") is not None):
+            pushed.append(evaluate("window.__benchPushed"))
+
+    print(f"{args.opens} start-page opens, {args.updates} settings updates")
+    print(f"round trips per open: {statistics.mean(trips) if trips else float('nan'):.1f} "
+          f"({dict(browser.bridge.calls)})")
+    if ready:
+        print(f"settings on page after: median {statistics.median(ready):.1f} ms, max {max(ready):.1f} ms")
+    if pushed:
+        print(f"setSettings -> settingsChanged: median {statistics.median(pushed):.1f} ms, "
+              f"max {max(pushed):.1f} ms, {browser.bridge.pushes - pushes_before} pushes")
+
+    server = StandInServer().start()
+    if load(server.page_url("remote", resources=0, dom=30, trackers=0)):
+        print(f"channel transport on a remote page: {json.dumps(evaluate(TRANSPORT_JS))}")
+    browser.close()
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
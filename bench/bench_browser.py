@@ -0,0 +1,268 @@
+"""Scripted Browser scenarios against a local HTTP stand-in, under the offscreen QPA.
+
+Usage:
+    python bench/bench_browser.py [--tabs 100] [--resources 60] [--dom 3000]
+                                  [--out run.json] [--baseline old.json] [--tolerance 0.15]
+    python bench/bench_browser.py --compare old.json new.json [--tolerance 0.15]
+
+Scenarios, in order: open --tabs heavy pages (time of add_tab and until
+loadFinished), switch through all tabs round-robin, toggle the sidebar
+collapse --toggles times, close all tabs, then --new-tabs start-page tabs
+the way Ctrl+T opens them, with an idle pause in between for the spare
+tab pool to refill (--spare-tabs 0 measures without the pool). Sidebar
+toggles also report the frame intervals of the animation
+(--sidebar-overlay 0 measures the old in-layout sidebar). Each reports wall time and
+per-event latency; renderer RSS is sampled at the peak (all tabs open)
+and after closing, and the interceptor counters are taken from the
+tracker blocker. Settings, session and web profile live in a temporary
+VOID_DATA_DIR. --baseline/--compare exit 1 when a run regressed.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from standin import StandInServer, TRACKER_HOSTS
+
+
+def summary(samples):
+    if not samples:
+        return {"events": 0}
+    ordered = sorted(samples)
+    return {"events": len(ordered), "mean_ms": round(statistics.mean(ordered), 2),
+            "p50_ms": round(ordered[len(ordered) // 2], 2),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+            "max_ms": round(ordered[-1], 2)}
+
+
+class Runner:
+    """Drives one Browser instance; every helper spins the event loop itself."""
+
+    def __init__(self, app, browser, timeout):
+        self.app = app
+        self.browser = browser
+        self.timeout = timeout
+        self.result = {"scenarios": {}, "raw": {}}
+
+    def spin(self, until=lambda: False, timeout=None):
+        from PySide6.QtCore import QEventLoop
+        deadline = time.perf_counter() + (self.timeout if timeout is None else timeout)
+        while not until() and time.perf_counter() < deadline:
+            self.app.processEvents(QEventLoop.AllEvents, 10)
+        return until()
+
+    def scenario(self, name, wall, samples):
+        self.result["scenarios"][name] = {"wall_ms": round(wall * 1000, 2), **summary(samples)}
+        self.result["raw"][name] = [round(s, 3) for s in samples]
+
+    def renderer_rss(self):
+        monitor = self.browser.renderer_monitor
+        monitor.sample()
+        rss = [s["rss"] for s in monitor.samples.values()]
+        return {"processes": len(rss), "rss_mb": round(sum(rss) / 2**20, 1)}
+
+    def open_tabs(self, urls):
+        opened, loaded, started = [], [], {}
+
+        def finished(tab):
+            t0 = started.pop(tab, None)
+            if t0 is not None:
+                loaded.append((time.perf_counter() - t0) * 1000)
+        start = time.perf_counter()
+        for url in urls:
+            t0 = time.perf_counter()
+            tab = self.browser.add_tab(url, activate=False)
+            opened.append((time.perf_counter() - t0) * 1000)
+            started[tab] = t0
+            tab.loadFinished.connect(lambda ok, t=tab: finished(t))
+            self.app.processEvents()
+        self.spin(lambda: not started)
+        wall = time.perf_counter() - start
+        self.scenario("open_tabs", wall, opened)
+        self.scenario("load", wall, loaded)
+        self.result["timeouts"] = len(started)
+
+    def switch_round_robin(self):
+        samples = []
+        start = time.perf_counter()
+        for row in range(self.browser.tab_count()):
+            t0 = time.perf_counter()
+            self.browser.switch_tab(row)
+            self.app.processEvents()
+            samples.append((time.perf_counter() - t0) * 1000)
+        self.scenario("switch", time.perf_counter() - start, samples)
+
+    def toggle_sidebar(self, toggles):
+        import void
+        browser, samples = self.browser, []
+        start = time.perf_counter()
+        for i in range(toggles):
+            collapse = i % 2 == 0
+            target = void.SIDEBAR_COLLAPSED_WIDTH if collapse else browser.settings_data.get("sidebar_width", 220)
+            t0 = time.perf_counter()
+            browser._collapse_sidebar() if collapse else browser._expand_sidebar()
+            self.spin(lambda: browser._sidebar.width() == target, timeout=2)
+            samples.append((time.perf_counter() - t0) * 1000)
+        self.scenario("sidebar_toggle", time.perf_counter() - start, samples)
+        runs = list(browser.sidebar_frames.runs)[-toggles:]
+        intervals = [run["p95_ms"] for run in runs]
+        self.result["sidebar_frames"] = {
+            "runs": len(runs), "frames": sum(run["frames"] for run in runs),
+            "janky": sum(run["janky"] for run in runs),
+            "p95_ms": round(max(intervals), 2) if intervals else None,
+        }
+
+    def close_all(self):
+        samples = []
+        start = time.perf_counter()
+        while self.browser.tab_count() > 1:
+            t0 = time.perf_counter()
+            self.browser.close_tab(self.browser.tab_count() - 1)
+            self.app.processEvents()
+            samples.append((time.perf_counter() - t0) * 1000)
+        self.spin(timeout=0.5)  # deleteLater der Views abarbeiten
+        self.scenario("close_all", time.perf_counter() - start, samples)
+
+    def new_tabs(self, count):
+        import void
+        samples = []
+        start = time.perf_counter()
+        for _ in range(count):
+            self.spin(timeout=void.SpareTabPool.REFILL_DELAY_MS / 1000 + 0.5)
+            t0 = time.perf_counter()
+            self.browser.add_tab()
+            self.app.processEvents()
+            samples.append((time.perf_counter() - t0) * 1000)
+            self.browser.close_tab(self.browser.tab_count() - 1)
+        self.scenario("new_tab", time.perf_counter() - start, samples)
+
+
+def run(args):
+    data_dir = Path(tempfile.mkdtemp(prefix="void-bench-"))
+    os.environ["VOID_DATA_DIR"] = str(data_dir)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QUrl
+    from PySide6.QtWidgets import QApplication
+    import void
+
+    server = StandInServer().start()
+    app = QApplication(sys.argv)
+    browser = void.Browser("Void Bench")
+    browser.settings_data.set("spare_tabs", args.spare_tabs)
+    browser.settings_data.set("sidebar_overlay", bool(args.sidebar_overlay))
+    browser.resize(1280, 800)
+    browser.show()
+    browser.tracker.matcher.update(TRACKER_HOSTS)
+    runner = Runner(app, browser, args.timeout)
+    runner.spin(timeout=1)
+    browser.tracker.metrics.reset()
+    server.reset_counters()
+
+    start = time.perf_counter()
+    runner.open_tabs([QUrl(server.page_url(i, args.resources, args.dom, args.trackers)) for i in range(args.tabs)])
+    peak = runner.renderer_rss()
+    runner.switch_round_robin()
+    runner.toggle_sidebar(args.toggles)
+    runner.close_all()
+    after = runner.renderer_rss()
+    runner.new_tabs(args.new_tabs)
+
+    result = runner.result
+    result["wall_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    result["params"] = {k: getattr(args, k) for k in ("tabs", "resources", "dom", "trackers", "toggles",
+                                                     "new_tabs", "spare_tabs", "sidebar_overlay")}
+    result["renderer"] = {"peak_processes": peak["processes"], "peak_rss_mb": peak["rss_mb"],
+                          "after_close_rss_mb": after["rss_mb"]}
+    stats = browser.tracker.metrics.snapshot()
+    result["interceptor"] = {k: stats[k] for k in ("allowed", "blocked", "by_type", "latency")}
+    result["server"] = {"requests": server.count(), "bytes": server.bytes_sent,
+                        "tracker_leaks": sum(server.count(host=h) for h in TRACKER_HOSTS)}
+    browser.close()
+    server.stop()
+    return result
+
+
+def compare(current, baseline, tolerance):
+    regressions = []
+    for name, now in current["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name, {})
+        for key in ("wall_ms", "p95_ms"):
+            # Unter 5 ms Differenz ist Rauschen
+            if old.get(key) and now.get(key, 0) > old[key] * (1 + tolerance) and now[key] - old[key] > 5:
+                regressions.append(f"{name} {key}: {old[key]:.1f} → {now[key]:.1f} ms "
+                                   f"(+{(now[key] / old[key] - 1) * 100:.0f}%)")
+    old_janky = baseline.get("sidebar_frames", {}).get("janky")
+    janky = current.get("sidebar_frames", {}).get("janky")
+    if old_janky is not None and janky is not None and janky > old_janky * (1 + tolerance) + 2:
+        regressions.append(f"janky sidebar frames: {old_janky} → {janky}")
+    old_rss, rss = baseline.get("renderer", {}).get("peak_rss_mb"), current["renderer"]["peak_rss_mb"]
+    if old_rss and rss > old_rss * (1 + tolerance) and rss - old_rss > 20:
+        regressions.append(f"renderer peak RSS: {old_rss:.0f} → {rss:.0f} MB")
+    old_blocked, blocked = baseline.get("interceptor", {}).get("blocked"), current["interceptor"]["blocked"]
+    if old_blocked and blocked < old_blocked:
+        regressions.append(f"blocked requests: {old_blocked} → {blocked}")
+    if current["server"]["tracker_leaks"] > baseline.get("server", {}).get("tracker_leaks", 0):
+        regressions.append(f"tracker requests reached the server: {current['server']['tracker_leaks']}")
+    return regressions
+
+
+def report(result):
+    print(f"{result['params']['tabs']} tabs, wall {result['wall_ms'] / 1000:.1f} s"
+          + (f", {result['timeouts']} loads timed out" if result.get("timeouts") else ""))
+    print(f"{'scenario':<16} {'wall ms':>10} {'events':>7} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for name, s in result["scenarios"].items():
+        print(f"{name:<16} {s['wall_ms']:>10.1f} {s['events']:>7} {s.get('mean_ms', 0):>9.2f} "
+              f"{s.get('p95_ms', 0):>9.2f} {s.get('max_ms', 0):>9.2f}")
+    frames = result.get("sidebar_frames")
+    if frames and frames["frames"]:
+        print(f"sidebar animation: {frames['frames']} frames in {frames['runs']} toggles, "
+              f"{frames['janky']} over 1.5 frame budgets, worst p95 {frames['p95_ms']:.1f} ms")
+    r, i, srv = result["renderer"], result["interceptor"], result["server"]
+    print(f"renderer: {r['peak_processes']} processes, {r['peak_rss_mb']:.0f} MB RSS at peak, "
+          f"{r['after_close_rss_mb']:.0f} MB after closing")
+    print(f"interceptor: {i['allowed']} allowed, {i['blocked']} blocked; "
+          f"server: {srv['requests']} requests, {srv['tracker_leaks']} from tracker hosts")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, default=100)
+    parser.add_argument("--resources", type=int, default=60)
+    parser.add_argument("--dom", type=int, default=3000)
+    parser.add_argument("--trackers", type=int, default=10)
+    parser.add_argument("--toggles", type=int, default=20)
+    parser.add_argument("--new-tabs", type=int, default=10)
+    parser.add_argument("--spare-tabs", type=int, default=2)
+    parser.add_argument("--sidebar-overlay", type=int, choices=(0, 1), default=1)
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--out", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--compare", type=Path, nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, result = (json.loads(p.read_text()) for p in args.compare)
+    else:
+        result = run(args)
+        report(result)
+        if args.out:
+            args.out.write_text(json.dumps(result, indent=2))
+        baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    if baseline is not None:
+        regressions = compare(result, baseline, args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
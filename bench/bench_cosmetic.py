@@ -0,0 +1,126 @@
+"""Cost of cosmetic filtering: compile, host lookup and injection per navigation.
+
+Usage:
+    python bench/bench_cosmetic.py [--generic 20000] [--domains 5000] [--loads 10]
+
+Writes a synthetic EasyList with --generic generic ``##`` selectors and
+--domains domains with a few selectors each, plus one rule that hides
+every other row on the stand-in's first-party site. It times the compile
+and CosmeticFilter.delta_for_host(). Then it loads stand-in pages with
+cosmetic_filtering off and on. For each load it reports the time to
+loadFinished and what the injected scripts measured themselves (sheet
+parse and adopt, generic and host delta). It also checks that the rows
+really are hidden.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from standin import FIRST_PARTY, StandInServer
+
+TIMINGS_JS = "JSON.stringify(window.__voidCosmetic || {})"
+HIDDEN_JS = "[...document.querySelectorAll('.row')].filter(e => getComputedStyle(e).display === 'none').length"
+
+
+def synthetic_list(path, generic, domains):
+    lines = ["! Title: Void bench cosmetic list"]
+    lines += [f"##.ad-slot-{i}" if i % 3 else f"##div[id^=\"sponsor-{i}\"]" for i in range(generic)]
+    lines += [f"site{i}.example##.banner-{i}, .popup-{i}" for i in range(domains)]
+    lines += [f"site{i}.example#@#.ad-slot-{i + 1}" for i in range(0, domains, 50)]
+    lines.append(f"{FIRST_PARTY}##main > .row:nth-child(2n)")
+    path.write_text("\n".join(lines) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--generic", type=int, default=20_000)
+    parser.add_argument("--domains", type=int, default=5_000)
+    parser.add_argument("--loads", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp(prefix="void-bench-"))
+    os.environ["VOID_DATA_DIR"] = str(tmp)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QEventLoop, QUrl
+    from PySide6.QtWebEngineCore import QWebEngineScript
+    from PySide6.QtWidgets import QApplication
+    import void
+
+    source = tmp / "easylist.txt"
+    synthetic_list(source, args.generic, args.domains)
+    start = time.perf_counter()
+    cosmetic = void.CosmeticFilter.compile(tmp / "cosmetic-bench.json", [source])
+    compile_ms = (time.perf_counter() - start) * 1000
+    hosts = [f"www.site{i}.example" for i in range(0, args.domains, max(1, args.domains // 200))]
+    start = time.perf_counter()
+    for host in hosts:
+        cosmetic.delta_for_host(host)
+    cold_us = (time.perf_counter() - start) * 1e6 / len(hosts)
+    start = time.perf_counter()
+    for host in hosts:
+        cosmetic.delta_for_host(host)
+    warm_us = (time.perf_counter() - start) * 1e6 / len(hosts)
+    stats = cosmetic.snapshot()
+    print(f"{args.generic} generic, {args.domains} domains: compile {compile_ms:.0f} ms, "
+          f"generic sheet {stats['generic_css_bytes'] / 1024:.0f} KiB ({stats['generic']} selectors), "
+          f"delta_for_host {cold_us:.1f} µs cold / {warm_us:.2f} µs cached")
+
+    server = StandInServer().start()
+    app = QApplication(sys.argv)
+    browser = void.Browser("Void Bench")
+    browser.resize(1280, 800)
+    browser.show()
+    tab = browser.current_tab()
+    page = tab.page()
+    loaded = []
+    tab.loadFinished.connect(lambda ok: loaded.append(time.perf_counter()))
+
+    def spin(until, timeout=args.timeout):
+        deadline = time.perf_counter() + timeout
+        while not until() and time.perf_counter() < deadline:
+            app.processEvents(QEventLoop.AllEvents, 10)
+        return until()
+
+    def evaluate(code, world=0):
+        result = []
+        page.runJavaScript(code, world, result.append)
+        spin(lambda: result)
+        return result[0] if result else None
+
+    browser.settings_data.set("filter_lists", [str(source)])
+    spin(lambda: browser.cosmetic is not None)
+
+    print(f"{'cosmetic':<9} {'load ms':>9} {'generic ms':>11} {'host ms':>9}  rows hidden")
+    for mode in ("off", "on"):
+        browser.settings_data.set("cosmetic_filtering", mode == "on")
+        if mode == "on":
+            spin(lambda: browser.cosmetic is not None)
+        loads, generic, host, hidden = [], [], [], 0
+        for i in range(args.loads):
+            loaded.clear()
+            start = time.perf_counter()
+            tab.setUrl(QUrl(server.page_url(f"cos{mode}{i}", resources=0, dom=600, trackers=0)))
+            if not spin(lambda: loaded):
+                continue
+            loads.append((loaded[0] - start) * 1000)
+            timings = json.loads(evaluate(TIMINGS_JS, QWebEngineScript.ApplicationWorld) or "{}")
+            generic += [timings["generic"]] if "generic" in timings else []
+            host += [timings["host"]] if "host" in timings else []
+            hidden = evaluate(HIDDEN_JS)
+        median = lambda xs: f"{statistics.median(xs):.2f}" if xs else "-"
+        print(f"{mode:<9} {median(loads):>9} {median(generic):>11} {median(host):>9}  {hidden}/200")
+    browser.close()
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Inserts 1M visits through HistoryStore and times the queries the viewer runs.
+
+Usage:
+    python bench/bench_history.py [--visits 1000000] [--urls 100000] [--queries 50]
+
+"enqueue" is what the GUI thread pays per visit(); "flush" is the writer
+thread's throughput until close() returns. The queries run against the
+filled database: paging newest-first, a deep page via keyset, and FTS
+searches for a common word, a rare word and a prefix.
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from void import HistoryStore
+
+WORDS = ("news", "wiki", "video", "python", "rust", "wetter", "karte", "musik", "forum", "blog",
+         "shop", "docs", "issue", "release", "galaxy", "nebula", "void", "sterne", "kochen", "reise")
+
+
+def synthetic_urls(n, seed=1):
+    rnd = random.Random(seed)
+    urls = []
+    for i in range(n):
+        words = rnd.sample(WORDS, 3)
+        host = f"{words[0]}{i % 5000}.example"
+        urls.append((f"https://{host}/{words[1]}/{i}", f"{words[1].title()} {words[2]} #{i}"))
+    return urls
+
+
+def timed_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.mean(samples), samples[int(len(samples) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--visits", type=int, default=1_000_000)
+    parser.add_argument("--urls", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    db = Path(tempfile.mkdtemp(prefix="void-bench-")) / "history.sqlite"
+    urls = synthetic_urls(args.urls)
+    rnd = random.Random(2)
+    now = time.time() - args.visits
+
+    store = HistoryStore(db)
+    enqueue = []
+    start = time.perf_counter()
+    for i in range(args.visits):
+        url, title = urls[rnd.randrange(len(urls))]
+        t0 = time.perf_counter_ns()
+        store.visit(url, title, now + i)
+        enqueue.append(time.perf_counter_ns() - t0)
+    queued = time.perf_counter() - start
+    store.close()
+    total = time.perf_counter() - start
+    enqueue.sort()
+    print(f"{args.visits} visits over {args.urls} urls")
+    print(f"enqueue: mean {statistics.mean(enqueue):6.0f} ns   p99 {enqueue[int(len(enqueue) * 0.99)]:6.0f} ns"
+          f"   max {enqueue[-1] / 1000:7.1f} µs   ({queued:.1f} s for all)")
+    print(f"flush:   {total:.1f} s until close() returned  ({args.visits / total:,.0f} visits/s)")
+    size = sum(p.stat().st_size for p in db.parent.glob("history.sqlite*"))
+    print(f"db size: {size / 2**20:.1f} MiB")
+
+    store = HistoryStore(db)
+    deep_cursor = store.page(limit=10_000)[-1][0]
+    queries = [
+        ("first page (200)", lambda: store.page(limit=200)),
+        ("page after 10k rows (keyset)", lambda: store.page(before_id=deep_cursor, limit=200)),
+        ("viewer search 'news'", lambda: store.page("news", limit=200)),
+        ("viewer search 'galaxy rust'", lambda: store.page("galaxy rust", limit=200)),
+        ("search prefix 'neb'", lambda: store.search("neb")),
+        ("search rare '#99991'", lambda: store.search("99991")),
+    ]
+    print(f"{'query':<30} {'mean ms':>9} {'p95 ms':>9}")
+    for name, fn in queries:
+        mean, p95 = timed_ms(fn, args.queries)
+        print(f"{name:<30} {mean:>9.2f} {p95:>9.2f}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Page weight with and without a lite-mode rule, against the local HTTP stand-in.
+
+Usage:
+    python bench/bench_lite.py [--loads 10] [--resources 60] [--dom 3000]
+
+Loads the same heavy stand-in page --loads times without a rule and
+--loads times with LITE_DEFAULT_RULE for the stand-in's first-party
+domain. It reports what the server actually sent (requests, bytes), the
+time to loadFinished, and what LiteRules counted as saved. Every load
+uses a fresh page id (and so fresh asset URLs), so nothing comes from the
+HTTP cache.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from standin import FIRST_PARTY, StandInServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loads", type=int, default=10)
+    parser.add_argument("--resources", type=int, default=60)
+    parser.add_argument("--dom", type=int, default=3000)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    os.environ["VOID_DATA_DIR"] = tempfile.mkdtemp(prefix="void-bench-")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QEventLoop, QUrl
+    from PySide6.QtWidgets import QApplication
+    import void
+
+    server = StandInServer().start()
+    app = QApplication(sys.argv)
+    browser = void.Browser("Void Bench")
+    browser.resize(1280, 800)
+    browser.show()
+    tab = browser.current_tab()
+    loaded = []
+    tab.loadFinished.connect(lambda ok: loaded.append(time.perf_counter()))
+
+    def spin(until, timeout=args.timeout):
+        deadline = time.perf_counter() + timeout
+        while not until() and time.perf_counter() < deadline:
+            app.processEvents(QEventLoop.AllEvents, 10)
+        return until()
+
+    results = {}
+    for mode in ("off", "on"):
+        rules = {FIRST_PARTY.split(".", 1)[1]: dict(void.LITE_DEFAULT_RULE)} if mode == "on" else {}
+        browser.settings_data.set("lite_rules", rules)
+        server.reset_counters()
+        samples = []
+        for i in range(args.loads):
+            loaded.clear()
+            start = time.perf_counter()
+            tab.setUrl(QUrl(server.page_url(f"lite{mode}{i}", resources=args.resources, dom=args.dom, trackers=0)))
+            if spin(lambda: loaded):
+                samples.append((loaded[0] - start) * 1000)
+        # Nachzügler (z. B. Bilder nach loadFinished) abwarten
+        spin(lambda: False, 0.5)
+        results[mode] = (samples, sum(server.requests.values()), server.bytes_sent)
+
+    print(f"{args.loads} loads, {args.resources} subresources, {args.dom} elements; rule: {void.LITE_DEFAULT_RULE}")
+    print(f"{'lite':<6} {'median ms':>10} {'requests/load':>14} {'KiB/load':>10}")
+    for mode, (samples, requests, sent) in results.items():
+        median = statistics.median(samples) if samples else float("nan")
+        print(f"{mode:<6} {median:>10.1f} {requests / args.loads:>14.1f} {sent / 1024 / args.loads:>10.1f}")
+    print(f"counted as saved: {browser.tracker.lite.snapshot()}")
+    browser.close()
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
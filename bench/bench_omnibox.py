@@ -0,0 +1,70 @@
+"""Per-keystroke latency of OmniboxIndex.search with a large history.
+
+Usage:
+    python bench/bench_omnibox.py [--entries 300000] [--repeat 20]
+
+Builds the index the way Browser does at startup, then "types" each query
+one character at a time and times every search. A keystroke should stay
+well inside a 16 ms frame. Also reports the cost of an incremental visit.
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from void import OmniboxIndex
+
+WORDS = ("news", "wiki", "video", "python", "rust", "wetter", "karte", "musik", "forum", "blog",
+         "shop", "docs", "issue", "release", "galaxy", "nebula", "void", "sterne", "kochen", "reise")
+QUERIES = ("github.com/void", "wetter berlin", "nebula rel", "py", "docs.python", "#123457", "zzqx")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=300_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rnd = random.Random(1)
+    now = time.time()
+    rows = []
+    for i in range(args.entries):
+        words = rnd.sample(WORDS, 3)
+        url = f"https://{words[0]}{i % 5000}.example/{words[1]}/{i}"
+        rows.append((url, f"{words[1].title()} {words[2]} #{i}",
+                     int(rnd.paretovariate(1.2)), now - rnd.random() * 180 * 86400))
+    rows.append(("https://github.com/void/browser", "Void Browser", 40, now))
+    rows.append(("https://docs.python.org/3/", "Python Docs", 12, now - 86400))
+
+    start = time.perf_counter()
+    index = OmniboxIndex()
+    for row in rows:
+        index.add(*row)
+    index.sort()
+    print(f"build: {len(index)} entries, {len(index._grams)} grams in {time.perf_counter() - start:.1f} s")
+
+    print(f"{'query':<18} {'keys':>5} {'mean ms':>9} {'max ms':>9}  top hit")
+    worst = 0.0
+    for query in QUERIES:
+        samples = []
+        for _ in range(args.repeat):
+            for n in range(1, len(query) + 1):
+                t0 = time.perf_counter()
+                results = index.search(query[:n])
+                samples.append((time.perf_counter() - t0) * 1000)
+        worst = max(worst, max(samples))
+        top = results[0][0] if results else "-"
+        print(f"{query:<18} {len(query):>5} {sum(samples) / len(samples):>9.3f} {max(samples):>9.3f}  {top}")
+    print(f"worst keystroke: {worst:.2f} ms (frame budget 16 ms)")
+
+    t0 = time.perf_counter()
+    for i in range(10_000):
+        index.visit(f"https://new{i}.example/page", now)
+    print(f"incremental visit: {(time.perf_counter() - t0) / 10_000 * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Opens and closes 500 tabs in the sidebar and reports per-operation cost.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python bench/bench_sidebar.py [--tabs 500]
+
+Tabs are added the way session restore adds them (sidebar row only, no
+renderer), so the numbers isolate the sidebar model/view cost from
+QtWebEngine. Settings and the session journal go to a temp directory.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtWidgets import QApplication
+import void
+
+
+def timed(app, fn):
+    start = time.perf_counter()
+    fn()
+    app.processEvents()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, default=500)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp(prefix="void-bench-"))
+    void.SETTINGS_FILE = tmp / "settings.json"
+    void.SESSION_FILE = tmp / "session.jsonl"
+
+    app = QApplication(sys.argv)
+    browser = void.Browser("Void Bench")
+    browser.resize(1200, 800)
+    browser.show()
+    app.processEvents()
+
+    n = args.tabs
+    records = [{"url": f"https://site{i}.example/", "title": f"Seite {i}"} for i in range(n)]
+
+    t_open = timed(app, lambda: [browser.add_tab(restore=r, activate=False) for r in records])
+    t_switch = timed(app, lambda: [browser.switch_tab(i) for i in range(1, n, max(1, n // 50))])
+    t_collapse = timed(app, browser._collapse_sidebar)
+    t_expand = timed(app, browser._show_expanded_content)
+
+    def close_all():
+        # Immer aus der Mitte schließen – der teuerste Fall für index-basierte Listen
+        while browser.tab_count() > 1:
+            browser.close_tab(browser.tab_count() // 2)
+    t_close = timed(app, close_all)
+
+    print(f"open   {n} tabs: {t_open * 1000:8.1f} ms  ({t_open / n * 1e6:6.1f} µs/tab)")
+    print(f"switch  50 tabs: {t_switch * 1000:8.1f} ms  (includes creating 50 BrowserTabs)")
+    print(f"collapse sidebar: {t_collapse * 1000:7.1f} ms")
+    print(f"expand sidebar:   {t_expand * 1000:7.1f} ms")
+    print(f"close  {n} tabs: {t_close * 1000:8.1f} ms  ({t_close / n * 1e6:6.1f} µs/tab)")
+
+    browser.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Click-to-load latency with and without hover speculation, against the local HTTP stand-in.
+
+Usage:
+    python bench/bench_speculation.py [--clicks 20] [--dwell-ms 400] [--latency-ms 150]
+
+For every click the hub page is loaded, a link is "hovered" for --dwell-ms
+(the same call linkHovered makes) and then clicked from JavaScript; the
+time from click to loadFinished is recorded. The round runs once with
+speculative_loading off and once on. The stand-in adds --latency-ms to
+every response, and its request log shows whether the click was served
+from the prefetch: a prefetched target is requested exactly once.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from standin import StandInServer
+
+CLICK_JS = "document.querySelector('a[href=%s]').click()"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clicks", type=int, default=20)
+    parser.add_argument("--dwell-ms", type=int, default=400)
+    parser.add_argument("--latency-ms", type=int, default=150)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    os.environ["VOID_DATA_DIR"] = tempfile.mkdtemp(prefix="void-bench-")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QEventLoop, QUrl
+    from PySide6.QtWidgets import QApplication
+    import void
+
+    server = StandInServer().start()
+    server.latency = args.latency_ms / 1000
+    app = QApplication(sys.argv)
+    browser = void.Browser("Void Bench")
+    browser.resize(1280, 800)
+    browser.show()
+    tab = browser.current_tab()
+    loaded = []
+    tab.loadFinished.connect(lambda ok: loaded.append(time.perf_counter()))
+
+    def spin(until, timeout):
+        deadline = time.perf_counter() + timeout
+        while not until() and time.perf_counter() < deadline:
+            app.processEvents(QEventLoop.AllEvents, 10)
+        return until()
+
+    def load(url):
+        loaded.clear()
+        tab.setUrl(QUrl(url))
+        return spin(lambda: loaded, args.timeout)
+
+    results = {}
+    for mode in ("off", "on"):
+        browser.settings_data.set("speculative_loading", mode == "on")
+        server.reset_counters()
+        hub = f"hub{mode}"
+        samples, once = [], 0
+        for i in range(args.clicks):
+            if not load(server.page_url(hub, resources=0, dom=3 * args.clicks, trackers=0)):
+                print(f"hub page did not load ({mode}, click {i})", file=sys.stderr)
+                continue
+            href = f"/page/{hub}-{i}"
+            browser.speculation.hovered(tab.page(), server.url(href))
+            spin(lambda: False, args.dwell_ms / 1000)
+            loaded.clear()
+            start = time.perf_counter()
+            tab.page().runJavaScript(CLICK_JS % json.dumps(href), 0)
+            if spin(lambda: loaded, args.timeout):
+                samples.append((loaded[0] - start) * 1000)
+            browser.speculation.hovered(tab.page(), "")
+            once += server.paths[href] == 1
+        results[mode] = (samples, once)
+
+    print(f"{args.clicks} clicks, {args.dwell_ms} ms hover, {args.latency_ms} ms server latency")
+    print(f"{'speculation':<12} {'median ms':>10} {'p95 ms':>10}  served once")
+    for mode, (samples, once) in results.items():
+        samples.sort()
+        if samples:
+            print(f"{mode:<12} {statistics.median(samples):>10.1f} "
+                  f"{samples[min(len(samples) - 1, int(len(samples) * 0.95))]:>10.1f}  {once}/{args.clicks}")
+    stats = browser.speculation.snapshot()
+    print(f"preconnects {stats['preconnects']}, prefetches {stats['prefetches']}, hits {stats['hits']}, "
+          f"misses {stats['misses']}, hit rate {stats['hit_rate']}, skipped {stats['skipped']}")
+    browser.close()
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Cold and warm startup runs of void.py --profile-startup under the offscreen QPA.
+
+Usage:
+    python bench/bench_startup.py [--runs 5] [--out startup.json]
+                                  [--baseline old.json] [--tolerance 0.15]
+
+Cold: every run gets a fresh VOID_DATA_DIR (no settings, session, HTTP
+cache or favicons); as root the page cache is dropped before each run too.
+Warm: one priming run, then every run reuses that data directory.
+Prints the median ms of every phase; --out saves medians and raw runs, and
+--baseline compares against such a file and exits 1 on a regression.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+VOID = Path(__file__).resolve().parent.parent / "void.py"
+DROP_CACHES = Path("/proc/sys/vm/drop_caches")
+
+
+def drop_page_cache():
+    try:
+        os.sync()
+        DROP_CACHES.write_text("3\n")
+        return True
+    except OSError:
+        return False
+
+
+def run_once(data_dir, timeout):
+    report = data_dir / "startup-profile.json"
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", VOID_DATA_DIR=str(data_dir))
+    start = time.perf_counter()
+    subprocess.run([sys.executable, str(VOID), "--profile-startup", str(report)],
+                   env=env, timeout=timeout, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    wall = (time.perf_counter() - start) * 1000
+    result = json.loads(report.read_text())
+    report.unlink()
+    phases = result["phases"]
+    if result.get("interpreter_ms") is not None:
+        phases = {"interpreter": result["interpreter_ms"], **phases}
+    phases["process_exit"] = round(wall, 2)
+    return phases
+
+
+def medians(runs):
+    names = []
+    for run in runs:
+        names += [n for n in run if n not in names]
+    return {n: round(statistics.median(r[n] for r in runs if n in r), 2) for n in names}
+
+
+def compare(current, baseline, tolerance):
+    regressions = []
+    for mode in ("cold", "warm"):
+        for phase, ms in current[mode].items():
+            old = baseline.get(mode, {}).get(phase)
+            # Unter 5 ms Differenz ist Rauschen
+            if old and ms > old * (1 + tolerance) and ms - old > 5:
+                regressions.append(f"{mode} {phase}: {old:.1f} → {ms:.1f} ms (+{(ms / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--out", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    cold, warm = [], []
+    dropped = False
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory(prefix="void-cold-") as tmp:
+            dropped = drop_page_cache()
+            cold.append(run_once(Path(tmp), args.timeout))
+    with tempfile.TemporaryDirectory(prefix="void-warm-") as tmp:
+        run_once(Path(tmp), args.timeout)
+        for _ in range(args.runs):
+            warm.append(run_once(Path(tmp), args.timeout))
+
+    result = {"cold": medians(cold), "warm": medians(warm), "runs": {"cold": cold, "warm": warm}}
+    print(f"{args.runs} runs each, page cache {'dropped' if dropped else 'not dropped (needs root)'} for cold runs")
+    print(f"{'phase':<22} {'cold ms':>10} {'warm ms':>10}")
+    for phase in result["cold"]:
+        print(f"{phase:<22} {result['cold'][phase]:>10.1f} {result['warm'].get(phase, float('nan')):>10.1f}")
+
+    if args.out:
+        args.out.write_text(json.dumps(result, indent=2))
+    if args.baseline:
+        regressions = compare(result, json.loads(args.baseline.read_text()), args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Per-hover styling cost of the sidebar with 100 tabs, before and after.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python bench/bench_styling.py [--tabs 100] [--hovers 200]
+
+"before" rebuilds the old widget-per-tab sidebar (one TabEntry widget tree
+per tab, fresh setStyleSheet strings on every collapse/expand). "after"
+drives the real Browser sidebar, which flips the ``collapsed`` theme
+property and repaints the delegate. One hover = expand + collapse; each
+step is flushed through polish, layout and paint before timing stops.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtWidgets import QApplication, QHBoxLayout, QLabel, QPushButton, QStyle, QVBoxLayout, QWidget
+import void
+
+BUTTON_EXPANDED = """
+    QPushButton {
+        background-color: #0a0a14; color: #5a3a7a; border: none;
+        border-bottom: 1px solid #1a1020; font-size: 12px;
+        text-align: left; padding-left: 14px;
+    }
+    QPushButton:hover { background-color: #12101e; color: #c8a8e8; }
+"""
+BUTTON_COLLAPSED = """
+    QPushButton {
+        background-color: #0a0a14; color: #5a3a7a; border: none;
+        border-bottom: 1px solid #1a1020; font-size: 16px;
+        text-align: center; padding: 0;
+    }
+    QPushButton:hover { background-color: #12101e; color: #c8a8e8; }
+"""
+
+
+class LegacyTabEntry(QWidget):
+    """The pre-model/view sidebar row, reduced to what a hover touches."""
+
+    def __init__(self, label, active):
+        super().__init__()
+        self.setFixedHeight(36)
+        self._layout = QHBoxLayout(self)
+        box = QWidget()
+        box.setFixedSize(28, 28)
+        box.setStyleSheet("background-color: #12101e; border: 1px solid #2a1f3d; border-radius: 6px;")
+        fav = QLabel(box)
+        fav.setPixmap(QApplication.style().standardIcon(QStyle.SP_DriveNetIcon).pixmap(16, 16))
+        self._layout.addWidget(box)
+        self.label = QLabel(label)
+        self._layout.addWidget(self.label)
+        self._layout.addStretch()
+        self.close_btn = QPushButton("✕")
+        self.close_btn.setFixedSize(18, 18)
+        self._layout.addWidget(self.close_btn)
+        self.setStyleSheet(f"background-color: {'#2a1f3d' if active else '#0a0a14'}; "
+                           f"color: {'#e8d0f8' if active else '#6a5080'};")
+
+    def set_collapsed(self, collapsed):
+        self.label.setVisible(not collapsed)
+        self.close_btn.setVisible(not collapsed)
+        self._layout.setContentsMargins(*((10, 0, 10, 0) if collapsed else (8, 0, 6, 0)))
+        self._layout.setSpacing(0 if collapsed else 8)
+
+
+def measure(app, widget, steps, hovers):
+    samples = []
+    for _ in range(hovers):
+        for step in steps:
+            start = time.perf_counter()
+            step()
+            app.processEvents()
+            widget.repaint()
+            samples.append(time.perf_counter() - start)
+    samples.sort()
+    per_hover = sum(samples) / hovers
+    return per_hover, samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+
+
+def legacy_sidebar(tabs):
+    sidebar = QWidget()
+    sidebar.resize(220, 800)
+    layout = QVBoxLayout(sidebar)
+    button = QPushButton("＋  Neuer Tab")
+    button.setStyleSheet(BUTTON_EXPANDED)
+    layout.addWidget(button)
+    entries = [LegacyTabEntry(f"Seite {i}", i == 0) for i in range(tabs)]
+    for entry in entries:
+        layout.addWidget(entry)
+    sidebar.show()
+
+    def collapse():
+        button.setText("＋")
+        button.setStyleSheet(BUTTON_COLLAPSED)
+        for entry in entries:
+            entry.set_collapsed(True)
+
+    def expand():
+        button.setText("＋  Neuer Tab")
+        button.setStyleSheet(BUTTON_EXPANDED)
+        for entry in entries:
+            entry.set_collapsed(False)
+
+    return sidebar, (expand, collapse)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, default=100)
+    parser.add_argument("--hovers", type=int, default=200)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp(prefix="void-bench-"))
+    void.SETTINGS_FILE = tmp / "settings.json"
+    void.SESSION_FILE = tmp / "session.jsonl"
+    app = QApplication(sys.argv)
+
+    sidebar, steps = legacy_sidebar(args.tabs)
+    before = measure(app, sidebar, steps, args.hovers)
+    sidebar.close()
+
+    browser = void.Browser("Void Bench")
+    browser.resize(1200, 800)
+    browser.show()
+    for i in range(args.tabs - 1):
+        browser.add_tab(label=f"Seite {i}", restore={"url": f"https://site{i}.example/"}, activate=False)
+    app.processEvents()
+    after = measure(app, browser._sidebar, (browser._show_expanded_content, browser._collapse_sidebar), args.hovers)
+    browser.close()
+
+    print(f"{args.tabs} tabs, {args.hovers} hovers (expand + collapse)")
+    for name, (per_hover, p50, p99) in (("before", before), ("after", after)):
+        print(f"{name:>7}: {per_hover * 1e6:9.0f} µs/hover   step p50 {p50 * 1e6:7.0f} µs   p99 {p99 * 1e6:7.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
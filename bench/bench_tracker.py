@@ -0,0 +1,110 @@
+"""Replays a recorded request stream through SimpleTrackerBlocker.interceptRequest.
+
+Usage:
+    python bench/bench_tracker.py [--stream bench/data/request_stream.txt] [--rounds 200]
+
+Reports ns per request for block lists of growing size. The matcher should
+stay flat across sizes; the old substring scan is measured as a baseline.
+"""
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtCore import QUrl
+from PySide6.QtWebEngineCore import QWebEngineUrlRequestInfo
+from void import SimpleTrackerBlocker
+
+DEFAULT_STREAM = Path(__file__).parent / "data" / "request_stream.txt"
+LIST_SIZES = (5, 1_000, 20_000, 200_000)
+
+
+class RecordedRequest:
+    """Stand-in for QWebEngineUrlRequestInfo, which cannot be constructed from Python."""
+    __slots__ = ("_url", "_first_party", "_type", "blocked")
+
+    def __init__(self, url, first_party):
+        self._url = QUrl(url)
+        self._first_party = QUrl(first_party)
+        self._type = (QWebEngineUrlRequestInfo.ResourceType.ResourceTypeMainFrame if url == first_party
+                      else QWebEngineUrlRequestInfo.ResourceType.ResourceTypeSubResource)
+        self.blocked = False
+
+    def requestUrl(self):
+        return self._url
+
+    def firstPartyUrl(self):
+        return self._first_party
+
+    def resourceType(self):
+        return self._type
+
+    def block(self, should_block):
+        self.blocked = should_block
+
+
+def synthetic_domains(n, seed=1):
+    rnd = random.Random(seed)
+    tlds = ("com", "net", "org", "io", "de")
+    return ["".join(rnd.choices(string.ascii_lowercase, k=12)) + "." + rnd.choice(tlds) for _ in range(n)]
+
+
+def substring_scan(domains, url):
+    for domain in domains:
+        if domain in url:
+            return True
+    return False
+
+
+def replay(blocker, requests, rounds):
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        for req in requests:
+            blocker.interceptRequest(req)
+    return (time.perf_counter_ns() - start) / (rounds * len(requests))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stream", type=Path, default=DEFAULT_STREAM)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    urls = [line.strip() for line in args.stream.read_text().splitlines() if line.strip()]
+    # Eine Zeile, die auf "/" endet, ist ein Seitenaufruf und wird First Party
+    requests = []
+    first_party = urls[0]
+    for url in urls:
+        if url.endswith("/") and url.count("/") == 3:
+            first_party = url
+        requests.append(RecordedRequest(url, first_party))
+    print(f"{len(urls)} requests x {args.rounds} rounds")
+    print(f"{'domains':>10} {'matcher ns/req':>16} {'substring ns/req':>18} {'blocked':>8}")
+
+    for size in LIST_SIZES:
+        domains = SimpleTrackerBlocker.BLOCKED_DOMAINS + synthetic_domains(max(0, size - 5))
+        blocker = SimpleTrackerBlocker()
+        blocker.matcher.update(domains)
+        matcher_ns = replay(blocker, requests, args.rounds)
+        blocked = sum(r.blocked for r in requests)
+
+        # Baseline nur über wenige Runden – bei 200k Domains sonst minutenlang
+        base_rounds = max(1, args.rounds // max(1, size // 1000))
+        start = time.perf_counter_ns()
+        for _ in range(base_rounds):
+            for url in urls:
+                substring_scan(domains, url)
+        substring_ns = (time.perf_counter_ns() - start) / (base_rounds * len(urls))
+        print(f"{size:>10} {matcher_ns:>16.0f} {substring_ns:>18.0f} {blocked:>8}")
+
+    lat = blocker.metrics.snapshot()["latency"]
+    print(f"interceptRequest latency (last list): mean {lat['mean_us']} µs, "
+          f"p99 <= {lat['p99_us']} µs, max {lat['max_us']} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Build, refresh and query times of WikiIndex on a large single-file wiki.
+
+Usage:
+    python bench/bench_wiki_index.py [--tiddlers 50000] [--queries 50]
+
+Writes a synthetic TiddlyWiki with a JSON tiddler store, indexes it from
+scratch, refreshes it unchanged (stat only), after editing a handful of
+tiddlers (re-parse, rewrite only those), and times `wiki:` queries the way
+the URL bar runs them on every keystroke.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from void import WikiIndex
+
+WORDS = ("sterne", "galaxie", "nebel", "quasar", "planet", "komet", "orbit", "masse", "licht", "zeit",
+         "raum", "python", "notiz", "rezept", "reise", "buch", "film", "idee", "projekt", "garten")
+QUERIES = ("sterne", "quasar", "nebel orb", "Tiddler 4711", "proj", "licht zeit raum", "zzqx")
+
+
+def vocabulary(seed=1):
+    """WORDS plus 5000 made-up words, weighted roughly like natural text (Zipf)."""
+    rnd = random.Random(seed)
+    words = list(WORDS) + ["".join(rnd.choice("aeiounrstlkm") for _ in range(rnd.randint(3, 10))) for _ in range(5000)]
+    return words, [1 / (rank + 1) for rank in range(len(words))]
+
+
+def synthetic_wiki(path, n, edited=(), seed=1):
+    rnd = random.Random(seed)
+    words, weights = vocabulary()
+    lines = []
+    for i in range(n):
+        text = " ".join(rnd.choices(words, weights, k=60))
+        if i in edited:
+            text += " bearbeitet"
+        title = f"Tiddler {i}" if i % 2 else f"{rnd.choice(WORDS).title()} {i}"
+        lines.append(json.dumps({"title": title, "tags": f"[[{rnd.choice(WORDS)}]]", "text": text}))
+    lines.append(json.dumps({"title": "$:/core", "text": "x" * 100_000}))
+    path.write_text("<!doctype html><html><head></head><body>"
+                    '<script class="tiddlywiki-tiddler-store" type="application/json">[\n'
+                    + ",\n".join(lines) + "\n]</script></body></html>")
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tiddlers", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp(prefix="void-bench-"))
+    wiki = tmp / "wiki.html"
+    synthetic_wiki(wiki, args.tiddlers)
+    index = WikiIndex(tmp / "wiki-index.sqlite")
+    print(f"{args.tiddlers} tiddlers, {wiki.stat().st_size / 2**20:.1f} MB wiki")
+
+    ms, written = timed(lambda: index.refresh(wiki))
+    print(f"{'initial build':<28} {ms:9.1f} ms  ({written} tiddlers written)")
+    ms, written = timed(lambda: index.refresh(wiki))
+    print(f"{'refresh, unchanged':<28} {ms:9.1f} ms  ({written} written)")
+    synthetic_wiki(wiki, args.tiddlers, edited=range(0, args.tiddlers, args.tiddlers // 10))
+    os.utime(wiki)
+    ms, written = timed(lambda: index.refresh(wiki))
+    print(f"{'refresh, 10 edited':<28} {ms:9.1f} ms  ({written} written)")
+
+    print(f"{'query':<18} {'mean ms':>9} {'max ms':>9}  top hit")
+    for query in QUERIES:
+        samples = []
+        for _ in range(args.queries):
+            ms, hits = timed(lambda: index.search(wiki, query))
+            samples.append(ms)
+        top = hits[0][0] if hits else "-"
+        print(f"{query:<18} {statistics.mean(samples):>9.2f} {max(samples):>9.2f}  {top}")
+
+
+if __name__ == "__main__":
+    main()
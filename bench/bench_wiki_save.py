@@ -0,0 +1,82 @@
+"""Save latency of WikiSaver on a large single-file wiki.
+
+Usage:
+    python bench/bench_wiki_save.py [--size-mb 20] [--saves 10]
+
+Times the worker-side save (compare + atomic write) for changed and
+unchanged content, separately from the gzip backup that follows it, and
+compares with a plain fsync'ed write of the same bytes.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import void
+from void import WikiSaver
+
+
+def synthetic_wiki(size):
+    tiddler = '{"title":"Tiddler %d","text":"Lorem ipsum dolor sit amet %d ' + "x" * 200 + '"},\n'
+    parts, total, i = [], 0, 0
+    while total < size:
+        part = tiddler % (i, i)
+        parts.append(part)
+        total += len(part)
+        i += 1
+    return "<!doctype html><html><head><meta name=\"application-name\" content=\"TiddlyWiki\"></head><body>" \
+           '<script class="tiddlywiki-tiddler-store" type="application/json">[' + "".join(parts) + "]</script></body></html>"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=20)
+    parser.add_argument("--saves", type=int, default=10)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp(prefix="void-bench-"))
+    void.WIKI_BACKUP_DIR = tmp / "backups"
+    wiki = tmp / "wiki.html"
+    content = synthetic_wiki(int(args.size_mb * 2**20))
+    wiki.write_text(content)
+    saver = WikiSaver(None, None)  # ohne Seite: save() prüft die Seite, _write() ist der Schreibpfad
+
+    changed, unchanged, plain, backup = [], [], [], []
+    for i in range(args.saves):
+        data = (content + f"<!-- {i} -->").encode()
+        start = time.perf_counter()
+        saver._write(str(wiki), wiki, data, 0)
+        changed.append(time.perf_counter() - start)
+
+        same = bytes(bytearray(data))  # gleicher Inhalt, anderes Objekt – wie bei einem echten Speichern
+        start = time.perf_counter()
+        saver._write(str(wiki), wiki, same, 0)
+        unchanged.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        WikiSaver._backup(wiki, data, 20)
+        backup.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with open(tmp / "plain.html", "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        plain.append(time.perf_counter() - start)
+
+    size = len(content) / 2**20
+    print(f"{size:.1f} MB wiki, {args.saves} saves")
+    for name, samples in (("changed (compare + atomic write)", changed), ("unchanged (compare only)", unchanged),
+                          ("plain fsync'ed write", plain), ("gzip backup (worker, after reply)", backup)):
+        print(f"{name:<36} median {statistics.median(samples) * 1000:8.1f} ms   max {max(samples) * 1000:8.1f} ms")
+    stored = sum(p.stat().st_size for p in void.WIKI_BACKUP_DIR.rglob("*.gz"))
+    print(f"backups: {len(list(void.WIKI_BACKUP_DIR.rglob('*.gz')))} files, {stored / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
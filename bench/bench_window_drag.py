@@ -0,0 +1,86 @@
+"""Relayouts per second while dragging the frameless window, under the offscreen QPA.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python bench/bench_window_drag.py [--hz 1000] [--seconds 1.5]
+
+Feeds synthetic mouse events at --hz into a bottom-right resize, a title
+bar move and an outline (rubber-band) resize, and prints what
+Browser.drag_stats recorded. "events" is what the old handlers turned
+into one setGeometry/move each. "updates" and "relayouts" are what
+actually reached the window. The offscreen platform has no window
+manager, so the coalesced fallback path is the one being measured.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hz", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=1.5)
+    args = parser.parse_args()
+
+    os.environ["VOID_DATA_DIR"] = tempfile.mkdtemp(prefix="void-bench-")
+    from PySide6.QtCore import QEvent, QPointF, Qt
+    from PySide6.QtGui import QMouseEvent
+    from PySide6.QtWidgets import QApplication
+    import void
+
+    app = QApplication(sys.argv)
+    browser = void.Browser("Void Bench")
+    browser.resize(1200, 800)
+    browser.show()
+    app.processEvents()
+
+    def send(widget, kind, local, buttons=Qt.LeftButton):
+        global_pos = QPointF(widget.mapToGlobal(local.toPoint()))
+        event = QMouseEvent(kind, local, global_pos, Qt.LeftButton, buttons, Qt.NoModifier)
+        QApplication.sendEvent(widget, event)
+
+    def drag(widget, start, step):
+        send(widget, QEvent.MouseButtonPress, start)
+        interval = 1 / args.hz
+        n = int(args.hz * args.seconds)
+        next_at = time.perf_counter()
+        pos = QPointF(start)
+        for i in range(n):
+            # Ein Pixel pro Event, hin und zurück, damit das Fenster nicht wegläuft
+            pos += step if (i // 200) % 2 == 0 else -step
+            send(widget, QEvent.MouseMove, pos)
+            app.processEvents()
+            next_at += interval
+            while time.perf_counter() < next_at:
+                pass
+        send(widget, QEvent.MouseButtonRelease, pos, Qt.NoButton)
+        app.processEvents()
+        return browser.drag_stats[-1]
+
+    corner = QPointF(browser.width() - 2, browser.height() - 2)
+    runs = [("resize", lambda: drag(browser, corner, QPointF(1, 1))),
+            ("move", lambda: drag(browser.toolbar_widget, QPointF(300, 10), QPointF(1, 0)))]
+
+    def outline():
+        browser.settings_data.set("resize_outline", True)
+        try:
+            return drag(browser, QPointF(browser.width() - 2, browser.height() - 2), QPointF(1, 1))
+        finally:
+            browser.settings_data.set("resize_outline", False)
+    runs.append(("outline resize", outline))
+
+    print(f"{args.hz} Hz mouse for {args.seconds:.1f} s per drag")
+    print(f"{'drag':<16} {'events':>7} {'updates':>8} {'relayouts':>10} {'relayouts/s':>12}")
+    for name, fn in runs:
+        stats = fn()
+        print(f"{name:<16} {stats['events']:>7} {stats['updates']:>8} {stats['relayouts']:>10} "
+              f"{stats['relayouts_per_s']:>12.1f}")
+    browser.close()
+
+
+if __name__ == "__main__":
+    main()
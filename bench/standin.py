@@ -0,0 +1,167 @@
+"""Local HTTP stand-in for the web, used by the browser benchmarks.
+
+Serves synthetic pages that are heavy in the ways that matter for Void:
+many subresources, requests to tracker hosts, third-party hosts and large
+DOMs. Hosts are subdomains of ``localhost`` (Chromium resolves
+``*.localhost`` to the loopback address), so "third-party" and "tracker"
+requests really are cross-site without any DNS setup.
+
+    server = StandInServer()
+    server.start()
+    server.url("/page/1?res=60&dom=3000")     # http://www.localhost:<port>/page/1?...
+    server.offline = True                     # connections are now refused
+    server.latency = 0.15                     # seconds before every response
+"""
+import struct
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FIRST_PARTY = "www.localhost"
+THIRD_PARTY = "cdn.localhost"
+# Für den Tracker-Blocker der Browser-Instanz registrieren (tracker.matcher.update)
+TRACKER_HOSTS = ("ads.localhost", "metrics.localhost")
+
+
+def tiny_png():
+    row = b"\x00" + b"\x60\x30\xa0" * 8
+    raw = zlib.compress(row * 8)
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", 8, 8, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", raw) + chunk(b"IEND", b""))
+
+
+PNG = tiny_png()
+
+
+def heavy_page(server, page_id, resources, dom, trackers):
+    """HTML with ``resources`` subresources (a third from THIRD_PARTY), ``trackers``
+    tracker requests and about ``dom`` elements."""
+    parts = [f"<!doctype html><html><head><title>Bench {page_id}</title>",
+             f'<link rel="stylesheet" href="{server.url(f"/css/{page_id}.css")}">']
+    for i in range(resources):
+        host = THIRD_PARTY if i % 3 == 0 else FIRST_PARTY
+        if i % 4 == 0:
+            parts.append(f'<script src="{server.url(f"/js/{page_id}-{i}.js", host)}"></script>')
+        else:
+            parts.append(f'<img src="{server.url(f"/img/{page_id}-{i}.png", host)}" width="8" height="8">')
+    for i in range(trackers):
+        host = TRACKER_HOSTS[i % len(TRACKER_HOSTS)]
+        parts.append(f'<img src="{server.url(f"/pixel/{page_id}-{i}.png", host)}" width="1" height="1">')
+    parts.append("</head><body><main>")
+    for i in range(dom // 3):
+        parts.append(f'<div class="row"><span>Zeile {i}</span><a href="/page/{page_id}-{i}">Link</a></div>')
+    parts.append("</main></body></html>")
+    return "\n".join(parts).encode()
+
+
+class StandInServer:
+    """ThreadingHTTPServer on 127.0.0.1 with request counters and an offline switch."""
+
+    def __init__(self, port=0):
+        self.port = port
+        self._offline = False
+        self.latency = 0.0
+        self.requests = Counter()   # (host, erster Pfadteil) → Anzahl
+        self.paths = Counter()      # voller Pfad → Anzahl
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._httpd = None
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self.port), self._handler())
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        threading.Thread(target=self._httpd.serve_forever, name="standin-http", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    @property
+    def offline(self):
+        return self._offline
+
+    @offline.setter
+    def offline(self, value):
+        # Offline heißt: der Port nimmt keine Verbindungen mehr an (ERR_CONNECTION_REFUSED),
+        # danach lauscht der Server wieder auf demselben Port
+        if value and not self._offline:
+            self.stop()
+        elif not value and self._offline:
+            self.start()
+        self._offline = bool(value)
+
+    def url(self, path, host=FIRST_PARTY):
+        return f"http://{host}:{self.port}{path}"
+
+    def page_url(self, page_id, resources=60, dom=3000, trackers=10):
+        return self.url(f"/page/{page_id}?res={resources}&dom={dom}&trk={trackers}")
+
+    def count(self, host=None, kind=None):
+        with self._lock:
+            return sum(n for (h, k), n in self.requests.items()
+                       if (host is None or h == host) and (kind is None or k == kind))
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests.clear()
+            self.paths.clear()
+            self.bytes_sent = 0
+
+    def _record(self, host, kind, path, size):
+        with self._lock:
+            self.requests[(host, kind)] += 1
+            self.paths[path] += 1
+            self.bytes_sent += size
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if server.offline:
+                    # Noch offene Keep-alive-Verbindung: ohne Antwort schließen, Chromium verbindet neu
+                    self.close_connection = True
+                    return
+                parts = urlsplit(self.path)
+                kind = parts.path.strip("/").split("/", 1)[0]
+                host = (self.headers.get("Host") or "").split(":", 1)[0]
+                query = {k: int(v[0]) for k, v in parse_qs(parts.query).items() if v[0].isdigit()}
+                if kind == "page":
+                    body, mime = heavy_page(server, parts.path.rsplit("/", 1)[1], query.get("res", 60),
+                                            query.get("dom", 3000), query.get("trk", 10)), "text/html; charset=utf-8"
+                elif kind in ("img", "pixel"):
+                    body, mime = PNG, "image/png"
+                elif kind == "js":
+                    body, mime = b"window.__bench = (window.__bench || 0) + 1;", "text/javascript"
+                elif kind == "css":
+                    body, mime = b".row { display: flex; gap: 4px; } span { color: #888; }", "text/css"
+                else:
+                    self.send_error(404)
+                    return
+                if server.latency:
+                    time.sleep(server.latency)
+                server._record(host, kind, parts.path, len(body))
+                self.send_response(200)
+                self.send_header("Content-Type", mime)
+                self.send_header("Content-Length", str(len(body)))
+                # Seiten wie bei echten Sites revalidieren, Assets cachen
+                self.send_header("Cache-Control", "max-age=0" if kind == "page" else "max-age=3600")
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
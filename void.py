@@ -1,298 +1,3421 @@
 import os
 os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = "--disable-gpu"
 os.environ["QT_OPENGL"] = "software"
+import time
+_IMPORT_T0 = time.perf_counter()  # Nullpunkt für --profile-startup
 import sys
 import json
+import gzip
+from html.parser import HTMLParser
+import mmap
+import struct
+import hashlib
+import threading
+import queue
+import signal
+import sqlite3
+import re
+import math
+import weakref
+from array import array
+from collections import Counter, OrderedDict, deque
+from heapq import nlargest
+from itertools import chain
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from PySide6.QtCore import Qt, QUrl, QRect, QSize, Slot, QObject, Signal, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QFont, QIcon, QCursor
+from time import perf_counter_ns
+from PySide6.QtCore import (
+    Qt, QUrl, QRect, QSize, Slot, QObject, Signal, Property, QPropertyAnimation, QVariantAnimation, QEasingCurve, QTimer,
+    QByteArray, QDataStream, QIODevice, QAbstractListModel, QModelIndex, QEvent, QBuffer,
+    QAbstractTableModel, QDateTime, QFile,
+)
+from PySide6.QtGui import (
+    QFont, QIcon, QCursor, QColor, QPainter, QPen, QPixmap, QShortcut, QKeySequence,
+    QStandardItemModel, QStandardItem,
+)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QToolBar, QLineEdit, QFileDialog,
     QPushButton, QWidget, QHBoxLayout, QVBoxLayout, QLabel,
-    QStatusBar, QSizePolicy, QStyle, QStackedWidget, QScrollArea, QSplitter,
+    QStatusBar, QSizePolicy, QStyle, QStackedWidget, QSplitter,
+    QListView, QStyledItemDelegate, QAbstractItemView, QTableView, QHeaderView, QCompleter,
+    QRubberBand,
 )
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebEngineCore import (
     QWebEnginePage, QWebEngineProfile, QWebEngineSettings,
-    QWebEngineDownloadRequest, QWebEngineUrlRequestInterceptor,
-    QWebEngineScript,
+    QWebEngineDownloadRequest, QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo,
+    QWebEngineScript, QWebEngineUrlScheme, QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob,
+    QWebEngineLoadingInfo,
 )
 from PySide6.QtWebChannel import QWebChannel
+_IMPORT_T1 = time.perf_counter()
 
 EDGE_MARGIN = 8
+RESIZE_EDGES = {
+    "left": Qt.LeftEdge, "right": Qt.RightEdge, "top": Qt.TopEdge, "bottom": Qt.BottomEdge,
+    "top-left": Qt.TopEdge | Qt.LeftEdge, "top-right": Qt.TopEdge | Qt.RightEdge,
+    "bottom-left": Qt.BottomEdge | Qt.LeftEdge, "bottom-right": Qt.BottomEdge | Qt.RightEdge,
+}
 SIDEBAR_COLLAPSED_WIDTH = 48
-SETTINGS_FILE = Path(__file__).parent / "settings.json"
+# VOID_DATA_DIR trennt Einstellungen, Session und Web-Profil vom Programmordner (z. B. für Kaltstarts)
+DATA_DIR = Path(os.environ.get("VOID_DATA_DIR") or Path(__file__).parent)
+SETTINGS_FILE = DATA_DIR / "settings.json"
+FILTER_SNAPSHOT = SETTINGS_FILE.parent / "filters.bin"
+COSMETIC_SNAPSHOT = SETTINGS_FILE.parent / "cosmetic.json"
+METRICS_DUMP_FILE = SETTINGS_FILE.parent / "interceptor-stats.json"
+SESSION_FILE = SETTINGS_FILE.parent / "session.jsonl"
+FAVICON_DIR = SETTINGS_FILE.parent / "favicons"
+HISTORY_DB = SETTINGS_FILE.parent / "history.sqlite"
+WIKI_BACKUP_DIR = SETTINGS_FILE.parent / "wiki-backups"
+WIKI_INDEX_DB = SETTINGS_FILE.parent / "wiki-index.sqlite"
+ARCHIVE_DIR = SETTINGS_FILE.parent / "archive"
+STARTPAGE_DIR = Path(__file__).parent / "startpage"
+
+DEFAULT_SETTINGS = {
+    "sidebar_width": 220,
+    "engine": "https://google.com/search?q=",
+    "homepage": "void",
+    "homepage_url": "",
+    "tracker": True,
+    "dnt": False,
+    "auto_collapse": True,
+    "filter_lists": [],
+    "metrics_dump_interval": 0,
+    "tab_freeze_after": 300,
+    "tab_discard_after": 1800,
+    "tab_memory_budget_mb": 1536,
+    "restore_session": True,
+    "wiki_backups": 20,
+    "wiki_file": "../blackhole/index.html",
+    "speculative_loading": True,
+    "spare_tabs": 2,
+    "sidebar_overlay": True,
+    "resize_outline": False,
+    "archive_max_mb": 256,
+    "archive_pinned": [],
+    "archive_fast_open": False,
+    "cosmetic_filtering": True,
+    "lite_rules": {},   # Domain → {"js", "images", "fonts", "media": false, "third_party_max": n}
+    "sites": None,  # None = noch nicht aus dem localStorage der alten file://-Startseite übernommen
+}
+
+# Zahlenwerte: Typ und erlaubter Bereich; 0 schaltet Zeitlimits, Budgets und Dumps ab
+NUMERIC_SETTINGS = {
+    "sidebar_width": (int, 160, 400),
+    "metrics_dump_interval": (float, 0, 86_400),
+    "tab_freeze_after": (int, 0, 7 * 86_400),
+    "tab_discard_after": (int, 0, 7 * 86_400),
+    "tab_memory_budget_mb": (int, 0, 1 << 20),
+    "wiki_backups": (int, 0, 1000),
+    "spare_tabs": (int, 0, 8),
+    "archive_max_mb": (int, 0, 1 << 20),
+}
+LITE_CAP_RANGE = (int, 0, 10_000)
+
+def clean_number(value, kind, low, high):
+    """``value`` (number or numeric string) as ``kind`` clamped to [low, high]; None if it is not a number."""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(number):
+        return None
+    return kind(max(low, min(high, number)))
+
+DEFAULT_SITES = [
+    {"name": "Blackhole", "url": (STARTPAGE_DIR / "../../blackhole/index.html").resolve().as_uri()},
+    {"name": "YouTube",   "url": "https://youtube.com"},
+    {"name": "GitHub",    "url": "https://github.com"},
+    {"name": "Google",    "url": "https://google.com"},
+    {"name": "Reddit",    "url": "https://reddit.com"},
+]
+
+def load_settings(path=SETTINGS_FILE):
+    try:
+        if path.exists():
+            with open(path) as f:
+                data = json.load(f)
+                return {**DEFAULT_SETTINGS, **data}
+    except Exception as e:
+        print(f"{path.name} unlesbar, verwende Standardwerte: {e}", file=sys.stderr)
+    return DEFAULT_SETTINGS.copy()
+
+def atomic_write(path, data, mode=None):
+    """Write bytes to path via temp file + fsync + rename, so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    if mode is not None:
+        os.chmod(tmp, mode)
+    os.replace(tmp, path)
+
+def save_settings(data, path=SETTINGS_FILE):
+    atomic_write(path, json.dumps(data, indent=2).encode())
+
+class SettingsStore(QObject):
+    """In-memory settings with debounced, atomic write-behind to settings.json.
+
+    Reads behave like a dict. Writes go through set()/update(), which emit
+    ``changed(key, value)`` for every key whose value actually changed and
+    coalesce all writes within WRITE_DELAY_MS into one save.
+    """
+    changed = Signal(str, object)
+    WRITE_DELAY_MS = 400
+
+    def __init__(self, path=SETTINGS_FILE, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._data = load_settings(path)
+        self._dirty = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.WRITE_DELAY_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def as_dict(self):
+        return dict(self._data)
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def update(self, changes):
+        changed = {k: v for k, v in changes.items() if self._data.get(k) != v}
+        if not changed:
+            return
+        self._data.update(changed)
+        self._dirty = True
+        self._timer.start()
+        for key, value in changed.items():
+            self.changed.emit(key, value)
+
+    def flush(self):
+        self._timer.stop()
+        if not self._dirty:
+            return
+        try:
+            save_settings(self._data, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Einstellungen konnten nicht gespeichert werden: {e}", file=sys.stderr)
+
+# ---- Startup Profiling ----
+# Liest First Contentful Paint der Seite als Epoch-Millisekunden aus
+FIRST_PAINT_JS = """
+(function() {
+  var e = performance.getEntriesByName('first-contentful-paint')[0]
+       || performance.getEntriesByName('first-paint')[0];
+  return e ? performance.timeOrigin + e.startTime : null;
+})()
+"""
+
+def process_age():
+    """Seconds since this process was started, from /proc; None where unavailable."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Feld 22 (starttime); der Prozessname in Klammern kann Leerzeichen enthalten
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+class StartupProfiler:
+    """Named startup phases in ms since void.py started importing.
+
+    Enabled by ``--profile-startup <file.json>``. Until then mark() is a
+    no-op, so the calls stay in the normal startup path. Once the first
+    page has painted (or TIMEOUT_MS passed) the marks are written as JSON
+    and the browser closes itself.
+    """
+    TIMEOUT_MS = 30000
+    POLL_MS = 50
+
+    def __init__(self):
+        self.path = None
+        self.marks = {}
+        self.interpreter_ms = None
+        # time.time() zum Nullpunkt – für Zeitstempel aus der Seite (performance.timeOrigin)
+        self.epoch_t0 = time.time() - (time.perf_counter() - _IMPORT_T0)
+        self._done = None
+
+    @property
+    def enabled(self):
+        return self.path is not None
+
+    def enable(self, path, done):
+        self.path = Path(path)
+        self._done = done
+        age = process_age()
+        if age is not None:
+            self.interpreter_ms = round((age - (time.perf_counter() - _IMPORT_T0)) * 1000, 1)
+        self.marks["imports"] = round((_IMPORT_T1 - _IMPORT_T0) * 1000, 2)
+        QTimer.singleShot(self.TIMEOUT_MS, self.finish)
+
+    def mark(self, name, at=None):
+        if self.path is None or name in self.marks:
+            return
+        at = time.perf_counter() if at is None else at
+        self.marks[name] = round((at - _IMPORT_T0) * 1000, 2)
+
+    def watch_first_paint(self, page, attempts=100):
+        """Polls the page's paint timing until it reports a first paint."""
+        def check(epoch_ms):
+            if epoch_ms:
+                self.marks.setdefault("first_paint", round(epoch_ms - self.epoch_t0 * 1000, 2))
+                self.finish()
+            elif attempts > 1:
+                QTimer.singleShot(self.POLL_MS, lambda: self.watch_first_paint(page, attempts - 1))
+            else:
+                self.finish()
+        page.runJavaScript(FIRST_PAINT_JS, 0, check)
+
+    def finish(self):
+        if self.path is None:
+            return
+        report = {
+            "interpreter_ms": self.interpreter_ms,
+            "phases": dict(sorted(self.marks.items(), key=lambda kv: kv[1])),
+            "platform": QApplication.platformName(),
+            "data_dir": str(DATA_DIR),
+        }
+        try:
+            atomic_write(self.path, json.dumps(report, indent=2).encode())
+        except OSError as e:
+            print(f"Startprofil konnte nicht geschrieben werden: {e}", file=sys.stderr)
+        self.path = None
+        if self._done:
+            self._done()
+
+STARTUP = StartupProfiler()
+
+def startup_profile_arg(argv):
+    """Pops ``--profile-startup <file>`` / ``--profile-startup=<file>`` from argv."""
+    for i, arg in enumerate(argv):
+        if arg == "--profile-startup" and i + 1 < len(argv):
+            path = argv[i + 1]
+            del argv[i:i + 2]
+            return path
+        if arg.startswith("--profile-startup="):
+            del argv[i]
+            return arg.split("=", 1)[1]
+    return None
+
+# ---- Tracker Blocker ----
+def host_suffixes(host):
+    """Yield a host and all of its parent domains: a.b.com → b.com → com.
+
+    A trailing dot (fully qualified "a.b.com.") is dropped first.
+    """
+    host = host.rstrip(".")
+    while host:
+        yield host
+        dot = host.find(".")
+        if dot < 0:
+            return
+        host = host[dot + 1:]
+
+class DomainMatcher:
+    """Matches hosts against a domain list by label suffix.
+
+    A lookup costs one hash probe per label of the host, independent of
+    how many domains are loaded. Decisions are cached per host.
+    """
+    CACHE_SIZE = 4096
+
+    def __init__(self, domains=()):
+        self._domains = set()
+        self.snapshot = None
+        self.lookup = lru_cache(maxsize=self.CACHE_SIZE)(self._lookup)
+        self.update(domains)
+
+    def __len__(self):
+        return len(self._domains)
+
+    def update(self, domains):
+        self._domains.update(d.strip().lower().lstrip(".") for d in domains if d.strip())
+        self.lookup.cache_clear()
+
+    def set_snapshot(self, snapshot):
+        """Swap in a compiled filter list; safe to call from a worker thread."""
+        self.snapshot = snapshot
+        self.lookup.cache_clear()
+
+    def _lookup(self, host):
+        domains = self._domains
+        snapshot = self.snapshot
+        for suffix in host_suffixes(host):
+            if suffix in domains or (snapshot is not None and suffix in snapshot):
+                return True
+        return False
+
+class InterceptorMetrics:
+    """Counters and a latency histogram for the request interceptor.
+
+    interceptRequest is the only writer and always runs on the same thread,
+    so the counters are plain lists mutated in place without locks. Readers
+    take a copy via snapshot(). ``by_host`` keeps at most MAX_HOSTS
+    first-party hosts; beyond that the less busy half is dropped.
+    """
+    # Bucket i counts calls that took at most 2**i µs; the last one is open-ended
+    LATENCY_BUCKETS = 18
+    MAX_HOSTS = 1000
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.by_type = {}
+        self.by_host = {}
+        self.latency = [0] * self.LATENCY_BUCKETS
+        self.latency_total_ns = 0
+        self.latency_max_ns = 0
+        self.calls = 0
+
+    def record(self, resource_type, first_party_host, blocked, elapsed_ns):
+        counts = self.by_type.get(resource_type)
+        if counts is None:
+            counts = self.by_type[resource_type] = [0, 0]
+        counts[blocked] += 1
+        counts = self.by_host.get(first_party_host)
+        if counts is None:
+            if len(self.by_host) >= self.MAX_HOSTS:
+                self._prune_hosts()
+            counts = self.by_host[first_party_host] = [0, 0]
+        counts[blocked] += 1
+        bucket = ((elapsed_ns - 1) // 1000).bit_length() if elapsed_ns > 0 else 0
+        self.latency[min(bucket, self.LATENCY_BUCKETS - 1)] += 1
+        self.latency_total_ns += elapsed_ns
+        if elapsed_ns > self.latency_max_ns:
+            self.latency_max_ns = elapsed_ns
+        self.calls += 1
+
+    def _prune_hosts(self):
+        busiest = sorted(self.by_host.items(), key=lambda kv: kv[1][0] + kv[1][1], reverse=True)
+        self.by_host = dict(busiest[:self.MAX_HOSTS // 2])
+
+    def _percentile_us(self, latency, q):
+        total = sum(latency)
+        if not total:
+            return 0
+        seen = 0
+        for i, n in enumerate(latency):
+            seen += n
+            if seen >= q * total:
+                return 2 ** i
+        return 2 ** (len(latency) - 1)
+
+    def snapshot(self, top_hosts=20):
+        latency = list(self.latency)
+        by_type = {getattr(t, "name", str(t)).removeprefix("ResourceType"): list(c)
+                   for t, c in list(self.by_type.items())}
+        hosts = sorted(list(self.by_host.items()), key=lambda kv: kv[1][1], reverse=True)
+        calls = self.calls
+        return {
+            "allowed": sum(c[0] for c in by_type.values()),
+            "blocked": sum(c[1] for c in by_type.values()),
+            "by_type": by_type,
+            "by_host": {h or "(none)": list(c) for h, c in hosts[:top_hosts]},
+            "latency": {
+                "buckets_us": [[2 ** i, n] for i, n in enumerate(latency)],
+                "mean_us": round(self.latency_total_ns / calls / 1000, 2) if calls else 0,
+                "max_us": round(self.latency_max_ns / 1000, 2),
+                "p50_us": self._percentile_us(latency, 0.5),
+                "p99_us": self._percentile_us(latency, 0.99),
+            },
+        }
+
+# ---- Lite Mode ----
+_RT = QWebEngineUrlRequestInfo.ResourceType
+LITE_TYPES = {
+    "images": frozenset((_RT.ResourceTypeImage,)),
+    "fonts": frozenset((_RT.ResourceTypeFontResource,)),
+    "media": frozenset((_RT.ResourceTypeMedia,)),
+    # Ohne JavaScript sind Skripte und Worker nur noch Ballast
+    "js": frozenset((_RT.ResourceTypeScript, _RT.ResourceTypeWorker, _RT.ResourceTypeSharedWorker,
+                     _RT.ResourceTypeServiceWorker)),
+}
+# Grobe Schätzwerte pro Anfrage – blockierte Antworten sieht der Interceptor nie
+LITE_TYPICAL_BYTES = {
+    _RT.ResourceTypeImage: 25_000, _RT.ResourceTypeFontResource: 30_000, _RT.ResourceTypeMedia: 500_000,
+    _RT.ResourceTypeScript: 20_000, _RT.ResourceTypeStylesheet: 10_000,
+}
+LITE_DEFAULT_RULE = {"js": False, "images": False, "fonts": False, "media": False, "third_party_max": 10}
+
+def is_third_party(host, site):
+    """Third-party unless ``host`` is ``site`` or one of its subdomains.
+
+    ``site`` is the domain of the matching lite rule, so cdn.example.com
+    is first-party on www.example.com under a rule for example.com.
+    """
+    return not (host == site or host.endswith("." + site))
+
+class LiteRules:
+    """Per-site content rules ("lite mode") from the ``lite_rules`` setting.
+
+    The setting maps a domain to what its pages should do without, e.g.
+    {"example.com": {"js": false, "images": false, "third_party_max": 10}}.
+    Compiled, each domain holds one tuple (blocked resource types,
+    JavaScript allowed, third-party cap or -1, the domain itself, which
+    is the first-party boundary for the cap). Like DomainMatcher, a
+    lookup probes each label suffix of the first-party host and is
+    cached, so a rule for example.com also covers www.example.com.
+    ``saved`` counts per rule domain what was not loaded:
+    [requests, estimated bytes]. Like the third-party counters, it has at
+    most one entry per rule.
+    """
+    CACHE_SIZE = 1024
+
+    def __init__(self, rules=None):
+        self.table = {}
+        self.saved = {}
+        self._third_party = {}   # Regel-Domain → Drittanbieter-Anfragen seit der letzten Navigation
+        self.lookup = lru_cache(maxsize=self.CACHE_SIZE)(self._lookup)
+        self.load(rules or {})
+
+    def load(self, rules):
+        table = {}
+        for domain, rule in rules.items():
+            if not isinstance(rule, dict):
+                continue
+            blocked = frozenset().union(*(types for key, types in LITE_TYPES.items() if rule.get(key) is False))
+            cap = rule.get("third_party_max")
+            # Infinity/NaN aus settings.json oder der Bridge und true/false sind keine Obergrenze
+            if isinstance(cap, bool) or not isinstance(cap, (int, float)) or not math.isfinite(cap):
+                cap = -1
+            else:
+                cap = int(max(0, cap))
+            site = domain.strip().lower().lstrip(".")
+            table[site] = (blocked, rule.get("js") is not False, cap, site)
+        self.table = table
+        self._third_party = {}
+        self.lookup.cache_clear()
+
+    def _lookup(self, host):
+        table = self.table
+        for suffix in host_suffixes(host):
+            rule = table.get(suffix)
+            if rule is not None:
+                return rule
+        return None
+
+    def javascript_enabled(self, host):
+        rule = self.lookup(host) if host and self.table else None
+        return rule is None or rule[1]
+
+    def check(self, resource_type, host, first_party):
+        """True if this request should be blocked; called from interceptRequest."""
+        rule = self.lookup(first_party)
+        if rule is None:
+            return False
+        blocked, _, cap, site = rule
+        if resource_type == _RT.ResourceTypeMainFrame:
+            self._third_party.pop(site, None)
+            return False
+        if resource_type not in blocked:
+            if cap < 0 or not host or not is_third_party(host.lower(), site):
+                return False
+            count = self._third_party[site] = self._third_party.get(site, 0) + 1
+            if count <= cap:
+                return False
+        saved = self.saved.get(site)
+        if saved is None:
+            saved = self.saved[site] = [0, 0]
+        saved[0] += 1
+        saved[1] += LITE_TYPICAL_BYTES.get(resource_type, 10_000)
+        return True
+
+    def snapshot(self):
+        return {host: {"requests": n, "bytes_estimated": b}
+                for host, (n, b) in sorted(list(self.saved.items()), key=lambda kv: kv[1][1], reverse=True)}
+
+class SimpleTrackerBlocker(QWebEngineUrlRequestInterceptor):
+    """Profile-wide interceptor: blocks trackers and lite-mode types for pages and page-less requests alike.
+
+    Blocked requests are also counted on the page that last navigated to
+    their first party (see attribute()). A page interceptor cannot do
+    that: it never sees requests the profile interceptor already blocked.
+    """
+    BLOCKED_DOMAINS = [
+        "doubleclick.net", "google-analytics.com",
+        "googletagmanager.com", "facebook.net", "adsystem.com",
+        "amazon-adsystem.com",
+    ]
+    def __init__(self):
+        super().__init__()
+        self.enabled = True
+        self.matcher = DomainMatcher(self.BLOCKED_DOMAINS)
+        self.lite = LiteRules()
+        self.metrics = InterceptorMetrics()
+        self.pages = weakref.WeakValueDictionary()   # Host/Site → Seite, die zuletzt dorthin navigiert ist
+
+    def attribute(self, host, page):
+        """Count blocked requests whose first party is ``host`` or a parent domain of it towards ``page``."""
+        labels = host.lower().split(".")
+        # Ohne Top-Level-Domain: firstPartyUrl ist je nach Qt-Version Host oder Site
+        for i in range(len(labels) - 1):
+            self.pages[".".join(labels[i:])] = page
+
+    def interceptRequest(self, info):
+        start = perf_counter_ns()
+        blocked = False
+        # Nur der Host zählt – "/?ref=doubleclick.net" im Pfad ist kein Treffer;
+        # "doubleclick.net." (voll qualifiziert) ist derselbe Host
+        host = info.requestUrl().host().rstrip(".")
+        first_party = info.firstPartyUrl().host().rstrip(".")
+        resource_type = info.resourceType()
+        if self.enabled and host and self.matcher.lookup(host):
+            blocked = True
+        elif self.lite.table and first_party and self.lite.check(resource_type, host, first_party):
+            blocked = True
+        if blocked:
+            info.block(True)
+            page = self.pages.get(first_party)
+            if page is not None:
+                page.blocked += 1
+        elapsed = perf_counter_ns() - start
+        self.metrics.record(resource_type, first_party, blocked, elapsed)
+
+# ---- Filter Lists ----
+def resolve_user_path(path):
+    """Paths from the settings (filter lists, wiki) may be absolute, ~-relative or relative to void.py."""
+    p = Path(path).expanduser()
+    return p if p.is_absolute() else (Path(__file__).parent / p).resolve()
+
+# Kosmetik- und Scriptlet-Trenner (##, #@#, #?#, #$#, #%#, #@$# …) und HTML-Filter ($$, $@$)
+NON_NETWORK_RULE = re.compile(r"#[@?$%]*#|\$@?\$")
+HOSTNAME = re.compile(r"(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})")
+# Optionen, die eine ||domain^-Regel nicht einschränken; alles andere (third-party, script, …) kann
+# ein reiner Host-Block nicht umsetzen
+WHOLE_HOST_OPTIONS = {"important", "all", "document", "doc"}
+
+def parse_filter_list(path):
+    """Yield blocked domains from a hosts file or an EasyList-style list.
+
+    Only whole-domain rules are understood: hosts entries, bare domains and
+    ``||domain^`` network rules without restricting options. Exceptions,
+    path rules and rules with options like ``$third-party`` or ``$script``
+    are skipped; cosmetic and scriptlet rules are read by
+    parse_cosmetic_rules. Everything yielded is a valid hostname.
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] in "!#[" or line.startswith("@@") or NON_NETWORK_RULE.search(line):
+                continue
+            if line.startswith("||"):
+                rule, _, options = line[2:].partition("$")
+                if options and not {o.strip().lower() for o in options.split(",")} <= WHOLE_HOST_OPTIONS:
+                    continue
+                rule = rule.rstrip("^|").lower()
+                if HOSTNAME.fullmatch(rule):
+                    yield rule
+                continue
+            parts = line.split("#", 1)[0].split()
+            if len(parts) >= 2 and parts[0] in ("0.0.0.0", "127.0.0.1", "::", "::1"):
+                hosts = parts[1:]
+            elif len(parts) == 1:
+                hosts = parts
+            else:
+                continue
+            for host in hosts:
+                host = host.lower()
+                if host != "localhost.localdomain" and HOSTNAME.fullmatch(host):
+                    yield host
+
+def _domain_hash(domain):
+    return int.from_bytes(hashlib.blake2b(domain.encode(), digest_size=8).digest(), "little")
+
+def _source_stamp(path, with_hash=True):
+    st = path.stat()
+    stamp = {"path": str(path), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    if with_hash:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        stamp["sha1"] = h.hexdigest()
+    return stamp
+
+class FilterSnapshot:
+    """Compiled filter lists as a memory-mapped, sorted array of 64-bit domain hashes.
+
+    Layout: ``MAGIC | u32 manifest length | manifest JSON | pad to 8 | u64[]``.
+    The manifest records mtime, size and sha1 of every source file so a
+    snapshot is only rebuilt when a source actually changed.
+    """
+    MAGIC = b"VOIDFLT2"   # 2: strengere parse_filter_list, alte Snapshots neu bauen
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:8] != self.MAGIC:
+            raise ValueError(f"{path} is not a filter snapshot")
+        (mlen,) = struct.unpack_from("<I", self._mm, 8)
+        self.manifest = json.loads(self._mm[12:12 + mlen])
+        offset = self._data_offset(mlen)
+        self._hashes = memoryview(self._mm)[offset:].cast("Q")
+
+    @staticmethod
+    def _data_offset(manifest_len):
+        return (12 + manifest_len + 7) & ~7
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def __contains__(self, domain):
+        h = _domain_hash(domain)
+        hashes = self._hashes
+        i = bisect_left(hashes, h)
+        return i < len(hashes) and hashes[i] == h
+
+    @classmethod
+    def write(cls, path, sources, hashes):
+        """Atomically write a snapshot; ``hashes`` must be a sorted array('Q')."""
+        manifest = json.dumps({"sources": sources, "count": len(hashes)}).encode()
+        header = cls.MAGIC + struct.pack("<I", len(manifest)) + manifest
+        header += b"\0" * (cls._data_offset(len(manifest)) - len(header))
+        tmp = Path(str(path) + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(header)
+            hashes.tofile(f)
+        os.replace(tmp, path)
+        return cls(path)
+
+    @classmethod
+    def compile(cls, path, sources):
+        """Parse all source lists and write a fresh snapshot."""
+        seen = set()
+        stamps = []
+        for src in sources:
+            if not src.exists():
+                continue
+            stamps.append(_source_stamp(src))
+            seen.update(_domain_hash(d) for d in parse_filter_list(src))
+        hashes = array("Q", sorted(seen))
+        return cls.write(path, stamps, hashes)
+
+    @classmethod
+    def open_if_fresh(cls, path, sources):
+        """Return the existing snapshot if it matches ``sources``, else None.
+
+        Sources whose mtime changed but whose content hash did not are
+        re-stamped without re-parsing.
+        """
+        if not path.exists():
+            return None
+        try:
+            snap = cls(path)
+        except (OSError, ValueError):
+            return None
+        recorded = {s["path"]: s for s in snap.manifest.get("sources", [])}
+        current = [src for src in sources if src.exists()]
+        if set(recorded) != {str(src) for src in current}:
+            return None
+        restamped = []
+        for src in current:
+            old = recorded[str(src)]
+            stamp = _source_stamp(src, with_hash=False)
+            if stamp["mtime_ns"] == old["mtime_ns"] and stamp["size"] == old["size"]:
+                restamped.append(old)
+                continue
+            stamp = _source_stamp(src)
+            if stamp["sha1"] != old.get("sha1"):
+                return None
+            restamped.append(stamp)
+        if restamped != list(recorded.values()):
+            hashes = array("Q")
+            hashes.frombytes(snap._hashes.tobytes())
+            return cls.write(path, restamped, hashes)
+        return snap
+
+# ---- Cosmetic Filtering ----
+# Erweiterte Syntax (uBO/ABP) versteht CSS nicht; ein solcher Selektor würde seinen ganzen Block ungültig machen
+COSMETIC_UNSUPPORTED = re.compile(
+    r":(?:-abp-|has-text|contains|xpath|style|upward|remove|matches-|min-text-length|watch-attr|others|if)|[{}]")
+
+# Grobe Syntaxprüfung: "#" und "." brauchen einen Bezeichner ("#####" aus Hosts-Dateien, ".5"),
+# Klammern müssen paarweise vorkommen; Zeichenketten werden vorher ausgeblendet
+COSMETIC_STRINGS = re.compile(r""""[^"]*"|'[^']*'""")
+COSMETIC_BAD_NAME = re.compile(r"[#.](?![-_a-zA-Z\\\u00a0-\uffff])|^[^-_a-zA-Z\\\u00a0-\uffff*#.\[:]")
+
+def plausible_selector(selector):
+    """False for selectors that cannot be valid CSS; they would cost the generic sheet a whole rule group."""
+    bare = COSMETIC_STRINGS.sub('""', selector)
+    if "'" in bare or '"' in bare.replace('""', "") or COSMETIC_BAD_NAME.search(bare):
+        return False
+    return bare.count("(") == bare.count(")") and bare.count("[") == bare.count("]")
+
+# Läuft im ApplicationWorld, damit Seitenskripte das Skript nicht sehen; die Stylesheets selbst hängen am
+# Dokument und sind über document.adoptedStyleSheets für die Seite lesbar und ersetzbar.
+# ``overrides`` (nur "host") ersetzt Gruppen des allgemeinen Stylesheets durch die Gruppe ohne die Selektoren,
+# die der Host ausnimmt – egal, welches der beiden Skripte zuerst läuft.
+COSMETIC_JS = """
+(function(css, key, overrides) {
+  var start = performance.now();
+  var sheet = new CSSStyleSheet();
+  sheet.replaceSync(css);
+  var state = window.__voidCosmeticState || (window.__voidCosmeticState = {});
+  state[key] = {sheet: sheet, overrides: overrides, rules: null};
+  if (key === 'generic') {
+    var groups = css.split('\\n');
+    if (sheet.cssRules.length !== groups.length) {
+      // Eine Gruppe wurde verworfen: Gruppen einzeln einfügen und Gruppe → Regel merken
+      sheet.replaceSync('');
+      state.generic.rules = groups.map(function(group) {
+        try { return sheet.insertRule(group, sheet.cssRules.length); } catch (e) { return -1; }
+      });
+    }
+  }
+  document.adoptedStyleSheets = document.adoptedStyleSheets.concat([sheet]);
+  if (state.generic && state.host) {
+    var generic = state.generic.sheet, rules = state.generic.rules, replace = state.host.overrides;
+    Object.keys(replace).map(Number).sort(function(a, b) { return b - a; }).forEach(function(group) {
+      var index = rules ? rules[group] : group;
+      if (index < 0) return;
+      generic.deleteRule(index);
+      if (replace[group]) generic.insertRule(replace[group], index);
+    });
+  }
+  var timings = window.__voidCosmetic || (window.__voidCosmetic = {});
+  timings[key] = performance.now() - start;
+})(%s, %s, %s);
+"""
+
+def parse_cosmetic_rules(path):
+    """Yield ``(domains, excluded, selector, is_exception)`` for element-hiding rules.
+
+    ``a.com,~b.a.com##sel`` hides ``sel`` on a.com except on b.a.com;
+    ``#@#`` marks an exception; no domains make the rule generic. Extended
+    syntax (``#?#``, ``#$#``, ``##+js(...)``, ``##^``, procedural
+    pseudo-classes) and regex domains are skipped.
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] == "!":
+                continue
+            if "#@#" in line:
+                domains, _, selector = line.partition("#@#")
+                exception = True
+            elif "##" in line:
+                domains, _, selector = line.partition("##")
+                exception = False
+            else:
+                continue
+            # "## Abschnitt" und "#####" in Hosts-Dateien sind Kommentare, keine Selektoren
+            if (not selector or selector[0] in " +^" or "/" in domains or COSMETIC_UNSUPPORTED.search(selector)
+                    or not plausible_selector(selector)):
+                continue
+            names = [d.strip().lower() for d in domains.split(",") if d.strip()]
+            yield (tuple(d for d in names if d[0] != "~"), tuple(d[1:] for d in names if d[0] == "~"),
+                   selector, exception)
+
+class CosmeticFilter:
+    """Element-hiding rules compiled into CSS: one generic stylesheet plus small per-domain deltas.
+
+    ``generic`` selectors apply everywhere and go into one stylesheet that
+    is shared by all pages, one rule per GROUP selectors. The delta of a
+    host holds its domain-specific selectors (``specific``) minus its
+    ``exceptions``. If the host excepts generic selectors, the delta also
+    carries replacements for just the generic rules that contain them
+    (see COSMETIC_JS). delta_for_host() probes the label suffixes of the
+    host like DomainMatcher and caches the result. The compiled rules are
+    kept as JSON together with the stamps of their source lists. Only the
+    first GENERIC_MAX generic selectors are used, which bounds what every
+    document has to parse.
+    """
+    VERSION = 3
+    GENERIC_MAX = 25_000
+    GROUP = 20            # Selektoren pro Regel: ein ungültiger kostet höchstens seine Gruppe
+    CACHE_SIZE = 256
+
+    def __init__(self, data):
+        self.sources = data["sources"]
+        self.generic = data["generic"][:self.GENERIC_MAX]
+        self.specific = data["specific"]
+        self.exceptions = data["exceptions"]
+        self.generic_css = self.css(self.generic)
+        self._group_of = {s: i // self.GROUP for i, s in enumerate(self.generic)}
+        self.delta_for_host = lru_cache(maxsize=self.CACHE_SIZE)(self._delta_for_host)
+
+    @classmethod
+    def css(cls, selectors):
+        return "\n".join(",".join(selectors[i:i + cls.GROUP]) + "{display:none!important}"
+                         for i in range(0, len(selectors), cls.GROUP))
+
+    def _delta_for_host(self, host):
+        """``(css, overrides)``: the host's own rules and {generic rule index: replacement rule}."""
+        selectors, excepted = [], set()
+        for suffix in host_suffixes(host):
+            selectors += self.specific.get(suffix, ())
+            excepted.update(self.exceptions.get(suffix, ()))
+        overrides = {}
+        for group in sorted({self._group_of[s] for s in excepted if s in self._group_of}):
+            chunk = self.generic[group * self.GROUP:(group + 1) * self.GROUP]
+            overrides[group] = self.css([s for s in chunk if s not in excepted])
+        return self.css([s for s in dict.fromkeys(selectors) if s not in excepted]), overrides
+
+    @classmethod
+    def compile(cls, path, sources):
+        """Parse the cosmetic rules of all source lists and write a fresh snapshot."""
+        hide, generic_exceptions = [], set()
+        specific, exceptions = {}, {}
+        stamps = []
+        for src in sources:
+            if not src.exists():
+                continue
+            stamps.append(_source_stamp(src, with_hash=False))
+            for domains, excluded, selector, exception in parse_cosmetic_rules(src):
+                if exception:
+                    if not domains:
+                        generic_exceptions.add(selector)
+                    for domain in domains:
+                        exceptions.setdefault(domain, []).append(selector)
+                    continue
+                for domain in domains:
+                    specific.setdefault(domain, []).append(selector)
+                for domain in excluded:
+                    exceptions.setdefault(domain, []).append(selector)
+                if not domains:
+                    hide.append(selector)
+        data = {
+            "version": cls.VERSION,
+            "sources": stamps,
+            "generic": [s for s in dict.fromkeys(hide) if s not in generic_exceptions],
+            "specific": {d: list(dict.fromkeys(s for s in sel if s not in generic_exceptions))
+                         for d, sel in specific.items()},
+            "exceptions": {d: sorted(set(sel)) for d, sel in exceptions.items()},
+        }
+        atomic_write(path, json.dumps(data, separators=(",", ":")).encode())
+        return cls(data)
+
+    @classmethod
+    def open_if_fresh(cls, path, sources):
+        """The compiled rules at ``path`` if they were built from ``sources`` as they are now, else None."""
+        try:
+            data = json.loads(path.read_bytes())
+            current = [_source_stamp(src, with_hash=False) for src in sources if src.exists()]
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != cls.VERSION or data.get("sources") != current:
+            return None
+        return cls(data)
+
+    def snapshot(self):
+        return {"generic": len(self.generic), "domains": len(self.specific), "excepting": len(self.exceptions),
+                "generic_css_bytes": len(self.generic_css),
+                "hosts_cached": self.delta_for_host.cache_info().currsize}
+
+# ---- Favicon Cache ----
+class FaviconCache:
+    """Favicons keyed by host: an in-memory LRU in front of one PNG per host on disk.
+
+    Filled from the tabs' iconChanged; read by the sidebar (QIcon) and by the
+    start page through void://favicon/<host> (PNG bytes). PNGs are written
+    by a worker thread, without fsync: the cache refills itself from the
+    pages, so a file lost in a crash costs nothing.
+    """
+    MEMORY_ENTRIES = 256
+    ICON_SIZE = 32
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._lru = OrderedDict()   # host → (QIcon | None, PNG bytes)
+        self._queue = queue.SimpleQueue()
+        self._writer = None
+
+    def _path(self, host):
+        return self.directory / (re.sub(r"[^a-z0-9.-]", "_", host) + ".png")
+
+    def _get(self, host):
+        host = host.lower()
+        entry = self._lru.get(host)
+        if entry is not None:
+            self._lru.move_to_end(host)
+            return entry
+        try:
+            png = self._path(host).read_bytes()
+        except OSError:
+            return None
+        return self._remember(host, (None, png))
+
+    def _remember(self, host, entry):
+        self._lru[host] = entry
+        self._lru.move_to_end(host)
+        while len(self._lru) > self.MEMORY_ENTRIES:
+            self._lru.popitem(last=False)
+        return entry
+
+    def png(self, host):
+        entry = self._get(host) if host else None
+        return entry[1] if entry else None
+
+    def icon(self, host):
+        entry = self._get(host) if host else None
+        if entry is None:
+            return None
+        icon, png = entry
+        if icon is None:
+            pixmap = QPixmap()
+            pixmap.loadFromData(png, "PNG")
+            icon = QIcon(pixmap)
+            self._remember(host.lower(), (icon, png))
+        return icon
+
+    def put(self, host, icon):
+        """Rasterizes ``icon`` once; returns the pixmap-backed QIcon the sidebar should paint."""
+        if not host or icon is None or icon.isNull():
+            return icon
+        host = host.lower()
+        pixmap = icon.pixmap(self.ICON_SIZE, self.ICON_SIZE)
+        data = QByteArray()
+        buf = QBuffer(data)
+        buf.open(QIODevice.WriteOnly)
+        pixmap.save(buf, "PNG")
+        png = bytes(data)
+        entry = self._lru.get(host)
+        if entry is not None and entry[1] == png and entry[0] is not None:
+            self._lru.move_to_end(host)
+            return entry[0]
+        icon = QIcon(pixmap)
+        self._remember(host, (icon, png))
+        if entry is not None and entry[1] == png:
+            return icon
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="favicon-writer", daemon=True)
+            self._writer.start()
+        self._queue.put((host, png))
+        return icon
+
+    def _write_loop(self):
+        while True:
+            host, png = self._queue.get()
+            path = self._path(host)
+            tmp = path.with_name(path.name + ".tmp")
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                tmp.write_bytes(png)
+                os.replace(tmp, path)
+            except OSError as e:
+                print(f"Favicon für {host} nicht gespeichert: {e}", file=sys.stderr)
+
+# ---- Start Page Bundle ----
+MIME_TYPES = {
+    ".html": b"text/html", ".js": b"application/javascript", ".css": b"text/css",
+    ".json": b"application/json", ".svg": b"image/svg+xml", ".png": b"image/png",
+    ".jpg": b"image/jpeg", ".woff2": b"font/woff2",
+}
+
+class StartPageBundle:
+    """Every file under startpage/, read once at startup and served from memory.
+
+    Entries are path → (bytes, mime type, ETag); new tabs never touch the disk.
+    """
+
+    def __init__(self, root=STARTPAGE_DIR):
+        self.root = root
+        self.files = {}
+        self.load()
+
+    def load(self):
+        files = {}
+        for path in sorted(self.root.rglob("*")):
+            if not path.is_file():
+                continue
+            data = path.read_bytes()
+            mime = MIME_TYPES.get(path.suffix.lower(), b"application/octet-stream")
+            etag = b'"' + hashlib.blake2b(data, digest_size=8).hexdigest().encode() + b'"'
+            files[path.relative_to(self.root).as_posix()] = (data, mime, etag)
+        self.files = files
+
+    def get(self, path):
+        return self.files.get(path or "index.html")
+
+# ---- void:// Scheme ----
+def register_url_schemes():
+    """Must run before QApplication is created."""
+    scheme = QWebEngineUrlScheme(b"void")
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    # LocalScheme: Webseiten aus dem Netz dürfen void:// nicht laden
+    scheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme
+                    | QWebEngineUrlScheme.Flag.LocalScheme
+                    | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+                    | QWebEngineUrlScheme.Flag.CorsEnabled)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+class VoidSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Serves internal resources: void://start/<path> and void://favicon/<host>."""
+
+    def __init__(self, browser):
+        super().__init__(browser)
+        self.browser = browser
+        self.bundle = StartPageBundle()
+
+    def _reply(self, job, content_type, data, cache_control=b"no-cache", etag=None):
+        # setAdditionalResponseHeaders gibt es erst ab Qt 6.6
+        if hasattr(job, "setAdditionalResponseHeaders"):
+            headers = {QByteArray(b"Cache-Control"): QByteArray(cache_control)}
+            if etag:
+                headers[QByteArray(b"ETag")] = QByteArray(etag)
+            job.setAdditionalResponseHeaders(headers)
+        buf = QBuffer(parent=job)
+        buf.setData(data)
+        buf.open(QIODevice.ReadOnly)
+        job.reply(content_type, buf)
+
+    def requestStarted(self, job):
+        url = job.requestUrl()
+        section, path = url.host(), url.path().lstrip("/")
+        if section == "start":
+            entry = self.bundle.get(path)
+            if entry is not None:
+                data, mime, etag = entry
+                # Die Seite selbst immer revalidieren, Assets dürfen einen Tag liegen bleiben
+                cache = b"no-cache" if mime == b"text/html" else b"max-age=86400"
+                self._reply(job, mime, data, cache, etag)
+                return
+        elif section == "favicon":
+            png = self.browser.favicons.png(path)
+            if png is not None:
+                self._reply(job, b"image/png", png, b"max-age=3600")
+                return
+        job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+
+register_url_schemes()
+
+# ---- QWebChannel Bridge ----
+class BrowserBridge(QObject):
+    """Python side of the start page, reachable only from void:// pages.
+
+    Settings travel as the ``settings`` property, so the page gets them
+    with the channel's init message instead of a call. Changes go back in
+    one batched setSettings() and come out again through settingsChanged
+    (the changed keys as a JSON array), whoever made them. ``calls``
+    counts slot invocations – every one is a round trip for the page.
+    """
+    settingsChanged = Signal(str)
+    PUSH_DELAY_MS = 50   # QWebChannel bündelt Property-Updates ebenso, Argumente nur des letzten Signals
+
+    def __init__(self, browser):
+        super().__init__()
+        self.browser = browser
+        self.calls = Counter()
+        self.pushes = 0
+        self._changed_keys = set()
+        self._push_timer = QTimer(self)
+        self._push_timer.setSingleShot(True)
+        self._push_timer.setInterval(self.PUSH_DELAY_MS)
+        self._push_timer.timeout.connect(self._push)
+        browser.settings_data.changed.connect(self._on_setting_changed)
+
+    def _on_setting_changed(self, key, value):
+        self._changed_keys.add(key)
+        self._push_timer.start()
+
+    def _push(self):
+        keys, self._changed_keys = sorted(self._changed_keys), set()
+        self.pushes += 1
+        self.settingsChanged.emit(json.dumps(keys))
+
+    def _settings_json(self):
+        return json.dumps(self.browser.settings_data.as_dict())
+
+    settings = Property(str, _settings_json, notify=settingsChanged)
+
+    @staticmethod
+    def _clean_lite_rule(rule):
+        """Keep the flags of a lite rule that are real booleans and a valid third_party_max."""
+        clean = {k: v for k, v in rule.items() if k in LITE_TYPES and isinstance(v, bool)}
+        cap = clean_number(rule.get("third_party_max"), *LITE_CAP_RANGE)
+        if cap is not None:
+            clean["third_party_max"] = cap
+        return clean
+
+    @staticmethod
+    def _clean_settings(changes):
+        """Validate values coming from JS before they reach the store.
+
+        Numbers (also as strings, e.g. "3") are coerced to their type in
+        NUMERIC_SETTINGS and clamped to its range. A value of the wrong
+        type leaves that key unchanged.
+        """
+        clean = {}
+        for key, value in changes.items():
+            if key not in DEFAULT_SETTINGS:
+                continue
+            if key in NUMERIC_SETTINGS:
+                value = clean_number(value, *NUMERIC_SETTINGS[key])
+                if value is None:
+                    continue
+            elif key in ("filter_lists", "archive_pinned"):
+                if not isinstance(value, list):
+                    continue
+                value = [p for p in value if isinstance(p, str) and p.strip()]
+            elif key == "sites":
+                if not isinstance(value, list):
+                    continue
+                value = [{"name": str(s["name"]), "url": str(s["url"])}
+                         for s in value if isinstance(s, dict) and s.get("name") and s.get("url")]
+            elif key == "lite_rules":
+                if not isinstance(value, dict):
+                    continue
+                value = {str(d): BrowserBridge._clean_lite_rule(r) for d, r in value.items() if isinstance(r, dict)}
+            elif isinstance(DEFAULT_SETTINGS[key], bool):
+                if not isinstance(value, bool):
+                    continue
+            elif isinstance(DEFAULT_SETTINGS[key], str) and not isinstance(value, str):
+                continue
+            clean[key] = value
+        return clean
+
+    @Slot(str)
+    def setSettings(self, changes_json):
+        """Batched update: one JSON object with any subset of the settings keys."""
+        self.calls["setSettings"] += 1
+        try:
+            changes = json.loads(changes_json)
+        except json.JSONDecodeError:
+            return
+        if isinstance(changes, dict):
+            self.browser.settings_data.update(self._clean_settings(changes))
+
+    @Slot(str, result=str)
+    def resolveLocalPath(self, relative_path):
+        """Löst einen relativen Pfad von void.py aus auf einen absoluten file:// URL."""
+        self.calls["resolveLocalPath"] += 1
+        base = Path(__file__).parent
+        resolved = (base / relative_path).resolve()
+        return resolved.as_uri()  # gibt file:///absoluter/pfad zurück
+
+    @Slot(result=str)
+    def getInterceptorStats(self):
+        self.calls["getInterceptorStats"] += 1
+        return json.dumps(self.browser.interceptor_stats())
+
+# ---- TiddlyWiki Saver ----
+# Spricht das TiddlyFox-Protokoll, das TiddlyWiki für file://-Seiten von sich aus nutzt:
+# Nachricht in #tiddlyfox-message-box, Event "tiddlyfox-save-file", Antwort "tiddlyfox-have-saved-file".
+# Läuft in der ApplicationWorld – Skripte der Seite sehen den Kanal nicht.
+WIKI_SAVER_JS = """
+(function() {
+  if (location.protocol !== 'file:' || window.__voidWikiSaver || typeof qt === 'undefined') return;
+  var meta = document.querySelector('meta[name="application-name"]');
+  if (!meta || meta.content !== 'TiddlyWiki') return;
+  window.__voidWikiSaver = true;
+  new QWebChannel(qt.webChannelTransport, function(channel) {
+    var saver = channel.objects.wikiSaver;
+    var pending = [];
+    var box = document.getElementById('tiddlyfox-message-box');
+    if (!box) {
+      box = document.createElement('div');
+      box.id = 'tiddlyfox-message-box';
+      box.style.display = 'none';
+      document.body.appendChild(box);
+    }
+    box.addEventListener('tiddlyfox-save-file', function(event) {
+      var message = event.target;
+      pending.push(message);
+      saver.save(message.getAttribute('data-tiddlyfox-path'), message.getAttribute('data-tiddlyfox-content'));
+    }, false);
+    saver.saved.connect(function(path, error) {
+      var done = pending.filter(function(m) { return m.getAttribute('data-tiddlyfox-path') === path; });
+      pending = pending.filter(function(m) { return done.indexOf(m) < 0; });
+      done.forEach(function(message) {
+        if (error) {
+          alert('Void: Speichern fehlgeschlagen – ' + error);
+        } else {
+          var ev = document.createEvent('Events');
+          ev.initEvent('tiddlyfox-have-saved-file', true, false);
+          message.dispatchEvent(ev);
+        }
+        if (message.parentNode) message.parentNode.removeChild(message);
+      });
+    });
+  });
+})();
+"""
+
+class WikiSaver(QObject):
+    """Saves a TiddlyWiki page back into its own file, one instance per page.
+
+    The write runs on a worker thread: skipped when the content equals
+    the last saved version (kept in memory, compared before anything is
+    hashed), otherwise atomic (temp file + fsync + rename, file mode
+    kept). After the page has its answer the version goes gzip-compressed
+    into wiki-backups/, named by content hash so identical versions are
+    stored once; only the newest ``wiki_backups`` are kept.
+    """
+    saved = Signal(str, str)  # Pfad, Fehlertext ("" = gespeichert)
+
+    def __init__(self, page, browser):
+        super().__init__(page)
+        self.page = page
+        self.browser = browser
+        self._lock = threading.Lock()
+        self._contents = {}   # Pfad → zuletzt gespeicherter Inhalt
+
+    @Slot(str, str)
+    def save(self, path, content):
+        target = Path(path)
+        own = self.page.url().toLocalFile()
+        # Nur die Datei, die gerade in dieser Seite offen ist
+        if not own or not target.is_file() or Path(own).resolve() != target.resolve():
+            self.saved.emit(path, "Speichern ist nur in die geöffnete Wiki-Datei erlaubt")
+            return
+        keep = self.browser.settings_data.get("wiki_backups", 20)
+        data = content.encode("utf-8")
+        threading.Thread(target=self._write, args=(path, target.resolve(), data, keep),
+                         name="wiki-save", daemon=True).start()
+
+    def _write(self, path, target, data, keep):
+        with self._lock:
+            try:
+                last = self._contents.get(target)
+                if last is None:
+                    # Erste Speicherung: Datei nur lesen, wenn die Größe überhaupt passt
+                    last = target.read_bytes() if target.stat().st_size == len(data) else b""
+                changed = data != last
+                if changed:
+                    atomic_write(target, data, target.stat().st_mode & 0o7777)
+                self._contents[target] = data
+            except OSError as e:
+                self.saved.emit(path, str(e))
+                return
+            self.saved.emit(path, "")
+            if changed and keep:
+                try:
+                    self._backup(target, data, keep)
+                except OSError as e:
+                    print(f"Wiki-Backup fehlgeschlagen: {e}", file=sys.stderr)
+
+    @staticmethod
+    def _backup(target, data, keep):
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        folder = WIKI_BACKUP_DIR / f"{target.stem}-{hashlib.blake2b(str(target).encode(), digest_size=4).hexdigest()}"
+        folder.mkdir(parents=True, exist_ok=True)
+        backup = folder / f"{digest.hex()}.html.gz"
+        if backup.exists():
+            os.utime(backup)
+        else:
+            atomic_write(backup, gzip.compress(data, 6, mtime=0))
+        backups = sorted(folder.glob("*.html.gz"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in backups[keep:]:
+            old.unlink()
+
+# ---- Speculative Loading ----
+# Läuft im ApplicationWorld der gehoverten Seite; Chromium übernimmt Verbindung bzw. Cache
+# Läuft im ApplicationWorld und fasst das DOM nicht an – ein <link> wäre für Seitenskripte sichtbar.
+# "preconnect": HEAD ohne Cookies auf den Ursprung baut DNS, TCP und TLS auf;
+# "prefetch": GET mit den Cookies der eigenen Site landet im HTTP-Cache
+SPECULATE_JS = """
+(function(rel, href) {
+  var init = rel === 'prefetch'
+    ? {credentials: 'same-origin', mode: 'no-cors', priority: 'low'}
+    : {method: 'HEAD', credentials: 'omit', mode: 'no-cors', cache: 'no-store', priority: 'low'};
+  fetch(href, init).catch(function() {});
+})(%s, %s);
+"""
+
+def url_origin(qurl):
+    return f"{qurl.scheme()}://{qurl.authority()}"
+
+def url_without_fragment(qurl):
+    return qurl.toString().split("#", 1)[0]
+
+class SpeculativeLoader(QObject):
+    """Warms up links the user is about to click, driven by linkHovered.
+
+    After PRECONNECT_DWELL_MS on a link the target origin is
+    preconnected (DNS, TCP, TLS); after PREFETCH_DWELL_MS a same-host
+    document is prefetched into the HTTP cache. Both are fetch() calls
+    from the isolated world (SPECULATE_JS), so the page's DOM never shows
+    them. Cross-site targets are only preconnected, since the partitioned
+    cache would not reuse the prefetch. Favorites on the start page use
+    half the dwell. Nothing happens for hosts the tracker blocker would
+    block or while Do Not Track is set, and PER_HOST_PREFETCHES / BUDGET
+    per BUDGET_WINDOW cap what hovering alone can cost.
+    """
+    PRECONNECT_DWELL_MS = 80
+    PREFETCH_DWELL_MS = 300
+    PRECONNECT_TTL = 10.0     # Chromium hält ungenutzte Sockets etwa so lange
+    PREFETCH_TTL = 60.0
+    PER_HOST_PREFETCHES = 3
+    BUDGET = 20
+    BUDGET_WINDOW = 60.0
+
+    def __init__(self, browser):
+        super().__init__(browser)
+        self.browser = browser
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_dwell)
+        self._hover = None          # (page, QUrl, Stufe)
+        self._preconnected = {}     # origin → Zeitpunkt
+        self._prefetched = {}       # url → Zeitpunkt
+        self._prefetch_times = []   # für das Budget
+        self.stats = {"hovers": 0, "preconnects": 0, "prefetches": 0, "skipped": {},
+                      "hits": {"prefetch": 0, "preconnect": 0}, "misses": 0, "wasted": 0}
+
+    def enabled(self):
+        return self.browser.settings_data.get("speculative_loading", True)
+
+    def hovered(self, page, url):
+        self._timer.stop()
+        self._hover = None
+        if not url or not self.enabled():
+            return
+        qurl = QUrl(url)
+        if qurl.scheme() not in ("http", "https"):
+            return
+        self.stats["hovers"] += 1
+        if self.browser.settings_data.get("dnt", False):
+            self._skip("dnt")
+            return
+        self._hover = (page, qurl, "preconnect")
+        self._timer.start(self._dwell(page, self.PRECONNECT_DWELL_MS))
+
+    def _dwell(self, page, ms):
+        return ms // 2 if page.url().scheme() == "void" else ms
+
+    def _skip(self, reason):
+        self.stats["skipped"][reason] = self.stats["skipped"].get(reason, 0) + 1
+
+    def _on_dwell(self):
+        if self._hover is None:
+            return
+        page, qurl, stage = self._hover
+        host = qurl.host()
+        tracker = self.browser.tracker
+        if tracker.enabled and host and tracker.matcher.lookup(host):
+            self._skip("tracker")
+            self._hover = None
+            return
+        now = time.monotonic()
+        if stage == "preconnect":
+            origin = url_origin(qurl)
+            if now - self._preconnected.get(origin, -self.PRECONNECT_TTL) >= self.PRECONNECT_TTL:
+                self._preconnected[origin] = now
+                self.stats["preconnects"] += 1
+                self._inject(page, "preconnect", origin)
+            self._hover = (page, qurl, "prefetch")
+            self._timer.start(self._dwell(page, self.PREFETCH_DWELL_MS - self.PRECONNECT_DWELL_MS))
+            return
+        self._hover = None
+        # DNT kann zwischen Vorverbindung und Prefetch eingeschaltet worden sein
+        reason = "dnt" if self.browser.settings_data.get("dnt", False) else self._prefetch_veto(page, qurl, now)
+        if reason:
+            self._skip(reason)
+            return
+        key = url_without_fragment(qurl)
+        self._prefetched[key] = now
+        self._prefetch_times.append(now)
+        self.stats["prefetches"] += 1
+        self._inject(page, "prefetch", key)
+
+    def _prefetch_veto(self, page, qurl, now):
+        if qurl.host() != page.url().host():
+            return "cross_site"
+        if url_without_fragment(qurl) == url_without_fragment(page.url()):
+            return "same_document"
+        key = url_without_fragment(qurl)
+        if now - self._prefetched.get(key, -self.PREFETCH_TTL) < self.PREFETCH_TTL:
+            return "fresh"
+        self._expire(now)
+        if len(self._prefetch_times) >= self.BUDGET:
+            return "budget"
+        host_prefix = url_origin(qurl) + "/"
+        if sum(1 for url in self._prefetched if url.startswith(host_prefix)) >= self.PER_HOST_PREFETCHES:
+            return "host_limit"
+        return None
+
+    def _expire(self, now):
+        self._prefetch_times = [t for t in self._prefetch_times if now - t < self.BUDGET_WINDOW]
+        for url, t in list(self._prefetched.items()):
+            if now - t >= self.PREFETCH_TTL:
+                del self._prefetched[url]
+                self.stats["wasted"] += 1
+
+    def _inject(self, page, rel, href):
+        page.runJavaScript(SPECULATE_JS % (json.dumps(rel), json.dumps(href)), QWebEngineScript.ApplicationWorld)
+
+    def navigated(self, url):
+        """Called for link navigations in the main frame to count hits and misses."""
+        if not self.enabled() or url.scheme() not in ("http", "https"):
+            return
+        self._timer.stop()
+        self._hover = None
+        now = time.monotonic()
+        key = url_without_fragment(url)
+        origin = url_origin(url)
+        if now - self._prefetched.pop(key, -self.PREFETCH_TTL) < self.PREFETCH_TTL:
+            self.stats["hits"]["prefetch"] += 1
+        elif now - self._preconnected.get(origin, -self.PRECONNECT_TTL) < self.PRECONNECT_TTL:
+            self.stats["hits"]["preconnect"] += 1
+        else:
+            self.stats["misses"] += 1
+
+    def snapshot(self):
+        self._expire(time.monotonic())
+        stats = {**self.stats, "skipped": dict(self.stats["skipped"]), "hits": dict(self.stats["hits"])}
+        clicks = sum(stats["hits"].values()) + stats["misses"]
+        stats["hit_rate"] = round(sum(stats["hits"].values()) / clicks, 3) if clicks else None
+        return stats
+
+# ---- Offline Archive ----
+# Chromium schreibt pro Speicherung neue Boundary- und Frame-IDs und ein Datum – für den
+# Vergleich werden sie neutralisiert, sonst wäre jede Kopie "neu"
+MHTML_VOLATILE = re.compile(rb"^Date: [^\r\n]*|----MultipartBoundary--[A-Za-z0-9]+----|frame-[0-9A-F]+@mhtml\.blink",
+                            re.MULTILINE)
+
+# Chromium-Netzfehler, bei denen der Server nicht erreichbar ist (net/base/net_error_list.h);
+# abgebrochene (-3 ERR_ABORTED) oder blockierte Ladevorgänge gehören nicht dazu
+NETWORK_ERRORS = {
+    -7,     # TIMED_OUT
+    -21,    # NETWORK_CHANGED
+    -100,   # CONNECTION_CLOSED
+    -101,   # CONNECTION_RESET
+    -102,   # CONNECTION_REFUSED
+    -104,   # CONNECTION_FAILED
+    -105,   # NAME_NOT_RESOLVED
+    -106,   # INTERNET_DISCONNECTED
+    -109,   # ADDRESS_UNREACHABLE
+    -118,   # CONNECTION_TIMED_OUT
+    -137,   # NAME_RESOLUTION_FAILED
+}
+
+def archive_key(qurl):
+    return url_without_fragment(qurl).rstrip("/")
+
+def mhtml_digest(data):
+    """Hash of an MHTML snapshot without the parts that change on every save."""
+    return hashlib.blake2b(MHTML_VOLATILE.sub(b"", data), digest_size=16).hexdigest()
+
+class OfflineArchive(QObject):
+    """MHTML snapshots of start-page favorites and pinned pages, for reading offline.
+
+    After loadFinished of such a page, and once it has been idle for
+    SNAPSHOT_DELAY_MS, QWebEnginePage.save() writes it to a temp file;
+    at most one snapshot per URL every REFRESH_S. A worker thread hashes
+    the snapshot (see mhtml_digest). Files are stored by hash, so an
+    unchanged page costs no disk write, and index.json maps URL → hash.
+    Over ``archive_max_mb`` the entries opened least recently go first.
+
+    Snapshots open as file:// URLs (Chromium renders MHTML only from
+    there): instead of the network when ``archive_fast_open`` is set or
+    a load failed with one of NETWORK_ERRORS within OFFLINE_RETRY_S, and
+    as fallback in the tab whose load just failed that way.
+
+    Opening a snapshot only marks the index dirty; it is written
+    INDEX_DELAY_MS later on a worker thread, and by flush() on exit.
+    """
+    SNAPSHOT_DELAY_MS = 1500
+    REFRESH_S = 600
+    OFFLINE_RETRY_S = 30
+    INDEX_DELAY_MS = 5000
+    _hashed = Signal(str, str, str)   # Schlüssel, Hash, temporäre Datei
+
+    def __init__(self, browser, directory):
+        super().__init__(browser)
+        self.browser = browser
+        # Absolut und ohne Symlinks: sonst erkennt is_snapshot() die eigenen file://-URLs nicht wieder
+        self.directory = directory.resolve()
+        self.index_path = self.directory / "index.json"
+        try:
+            self.index = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            self.index = {}   # Schlüssel → {"hash", "size", "saved", "used"}
+        self.targets = set()
+        self.offline_since = None
+        self.stats = {"snapshots": 0, "unchanged": 0, "failed": 0, "evicted": 0, "served": 0}
+        self._pending = {}    # temporäre Datei → Schlüssel
+        self._saving = set()
+        self._next_tmp = 0
+        self._index_lock = threading.Lock()
+        self._index_seq = 0
+        self._index_written = 0
+        self._index_timer = QTimer(self)
+        self._index_timer.setSingleShot(True)
+        self._index_timer.setInterval(self.INDEX_DELAY_MS)
+        self._index_timer.timeout.connect(self._save_index)
+        self._hashed.connect(self._store)
+        self.set_targets()
+
+    def set_targets(self):
+        settings = self.browser.settings_data
+        urls = [s["url"] for s in settings.get("sites") or ()] + list(settings.get("archive_pinned") or ())
+        self.targets = {archive_key(QUrl(u)) for u in urls if QUrl(u).scheme() in ("http", "https")}
+
+    def _object(self, digest):
+        return self.directory / f"{digest}.mhtml"
+
+    def is_snapshot(self, qurl):
+        if not qurl.isLocalFile():
+            return False
+        path = Path(qurl.toLocalFile())
+        return path.parent == self.directory or path.resolve().parent == self.directory
+
+    def offline(self):
+        return self.offline_since is not None and time.monotonic() - self.offline_since < self.OFFLINE_RETRY_S
+
+    def snapshot_url(self, qurl):
+        """file:// URL of the snapshot for ``qurl``, or None; counts as use for the LRU."""
+        entry = self.index.get(archive_key(qurl))
+        if entry is None or not self._object(entry["hash"]).exists():
+            return None
+        entry["used"] = time.time()
+        self.stats["served"] += 1
+        self._index_timer.start()
+        return QUrl.fromLocalFile(str(self._object(entry["hash"])))
+
+    def redirect(self, qurl):
+        """Snapshot to open instead of ``qurl`` when fast open is on or the network is down."""
+        if qurl.scheme() not in ("http", "https"):
+            return None
+        if not (self.browser.settings_data.get("archive_fast_open") or self.offline()):
+            return None
+        return self.snapshot_url(qurl)
+
+    def loaded(self, page, ok):
+        """loadFinished of any page: schedule a snapshot if it is a target."""
+        url = page.url()
+        if not ok or url.scheme() not in ("http", "https"):
+            return
+        key = archive_key(url)
+        self.offline_since = None
+        entry = self.index.get(key)
+        if key in self.targets and key not in self._saving and (
+                entry is None or time.time() - entry["saved"] > self.REFRESH_S):
+            self._saving.add(key)
+            QTimer.singleShot(self.SNAPSHOT_DELAY_MS, page, lambda: self._save(page, key))
+
+    def failed(self, info):
+        """Failed load (QWebEngineLoadingInfo): the offline fallback URL, or None."""
+        url = info.url()
+        if url.scheme() not in ("http", "https") or info.errorCode() not in NETWORK_ERRORS:
+            return None
+        self.offline_since = time.monotonic()
+        return self.snapshot_url(url)
+
+    def _save(self, page, key):
+        if archive_key(page.url()) != key:
+            self._saving.discard(key)
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._next_tmp += 1
+        tmp = self.directory / f".snapshot-{os.getpid()}-{self._next_tmp}.part"
+        self._pending[str(tmp)] = key
+        page.save(str(tmp), QWebEngineDownloadRequest.MimeHtmlSaveFormat)
+
+    def track(self, download):
+        """Claim the download page.save() started; False for everything else."""
+        tmp = str(Path(download.downloadDirectory()) / download.downloadFileName())
+        key = self._pending.pop(tmp, None)
+        if key is None:
+            return False
+        download.isFinishedChanged.connect(lambda: self._finished(download, key, tmp))
+        return True
+
+    def _finished(self, download, key, tmp):
+        if download.state() != QWebEngineDownloadRequest.DownloadCompleted:
+            self.stats["failed"] += 1
+            self._saving.discard(key)
+            Path(tmp).unlink(missing_ok=True)
+            return
+        threading.Thread(target=self._hash, args=(key, tmp), name="archive-hash", daemon=True).start()
+
+    def _hash(self, key, tmp):
+        try:
+            digest = mhtml_digest(Path(tmp).read_bytes())
+        except OSError as e:
+            print(f"Archivkopie von {key} unlesbar: {e}", file=sys.stderr)
+            digest = ""
+        self._hashed.emit(key, digest, tmp)
+
+    def _store(self, key, digest, tmp):
+        self._saving.discard(key)
+        if not digest:
+            self.stats["failed"] += 1
+            Path(tmp).unlink(missing_ok=True)
+            return
+        target = self._object(digest)
+        try:
+            if target.exists():
+                Path(tmp).unlink()
+                self.stats["unchanged"] += 1
+            else:
+                os.replace(tmp, target)
+                self.stats["snapshots"] += 1
+            size = target.stat().st_size
+        except OSError as e:
+            print(f"Archivkopie von {key} nicht gespeichert: {e}", file=sys.stderr)
+            self.stats["failed"] += 1
+            return
+        now = time.time()
+        old = self.index.get(key)
+        self.index[key] = {"hash": digest, "size": size, "saved": now, "used": old["used"] if old else now}
+        if old and old["hash"] != digest:
+            self._drop_unreferenced(old["hash"])
+        self.evict()
+
+    def _drop_unreferenced(self, digest):
+        if all(e["hash"] != digest for e in self.index.values()):
+            self._object(digest).unlink(missing_ok=True)
+
+    def size(self):
+        return sum({e["hash"]: e["size"] for e in self.index.values()}.values())
+
+    def evict(self):
+        """Drop least recently used entries until the archive fits ``archive_max_mb``."""
+        limit = self.browser.settings_data.get("archive_max_mb", 256) * 2**20
+        total = self.size()
+        for key, entry in sorted(self.index.items(), key=lambda kv: kv[1]["used"]):
+            if total <= limit:
+                break
+            del self.index[key]
+            if all(e["hash"] != entry["hash"] for e in self.index.values()):
+                self._object(entry["hash"]).unlink(missing_ok=True)
+                total -= entry["size"]
+            self.stats["evicted"] += 1
+        self._save_index()
+
+    def _save_index(self):
+        self._index_timer.stop()
+        self._index_seq += 1
+        threading.Thread(target=self._write_index, args=(self._index_seq, json.dumps(self.index).encode()),
+                         name="archive-index", daemon=True).start()
+
+    def _write_index(self, seq, data):
+        with self._index_lock:
+            # Threads können sich überholen: ein älterer Stand überschreibt keinen neueren
+            if seq <= self._index_written:
+                return
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                atomic_write(self.index_path, data)
+                self._index_written = seq
+            except OSError as e:
+                print(f"Archiv-Index nicht gespeichert: {e}", file=sys.stderr)
+
+    def flush(self):
+        """Write a pending index update now (on exit)."""
+        if self._index_timer.isActive():
+            self._index_timer.stop()
+            self._index_seq += 1
+            self._write_index(self._index_seq, json.dumps(self.index).encode())
+
+    def snapshot(self):
+        return {**self.stats, "entries": len(self.index), "bytes": self.size(), "offline": self.offline()}
+
+# ---- Custom Page ----
+class BrowserPage(QWebEnginePage):
+    def __init__(self, profile, browser, parent=None):
+        super().__init__(profile, parent)
+        self.browser = browser
+        self.blocked = 0
+        self.linkHovered.connect(self._on_link_hovered)
+        self._wiki_channel = None
+
+    def _on_link_hovered(self, url):
+        if url:
+            self.browser.statusbar.showMessage(url)
+        else:
+            self.browser.statusbar.clearMessage()
+        self.browser.speculation.hovered(self, url)
+
+    def createWindow(self, win_type):
+        tab = self.browser.add_tab(blank=True)
+        return tab.page()
+
+    def acceptNavigationRequest(self, url, nav_type, is_main_frame):
+        if is_main_frame and nav_type == QWebEnginePage.NavigationType.NavigationTypeLinkClicked:
+            self.browser.speculation.navigated(url)
+        if is_main_frame:
+            snapshot = self.browser.archive.redirect(url)
+            if snapshot is not None:
+                # Archivkopie statt Netz: Navigation abbrechen und die Kopie laden
+                QTimer.singleShot(0, self, lambda: self.setUrl(snapshot))
+                return False
+            # Dateizugriffe nur für lokale Dateien (TiddlyWiki & Co.), nicht für jede Seite
+            local = url.isLocalFile() and not self.browser.archive.is_snapshot(url)
+            settings = self.settings()
+            settings.setAttribute(QWebEngineSettings.LocalContentCanAccessRemoteUrls, local)
+            settings.setAttribute(QWebEngineSettings.LocalContentCanAccessFileUrls, local)
+            # Lite-Regeln gelten ab dem Dokument, das diese Navigation erzeugt
+            settings.setAttribute(QWebEngineSettings.JavascriptEnabled,
+                                  self.browser.tracker.lite.javascript_enabled(url.host()))
+            self.browser.apply_cosmetic_delta(self, url)
+            self.browser._setup_page_channel(self, url)
+            if url.host():
+                self.browser.tracker.attribute(url.host(), self)
+        return super().acceptNavigationRequest(url, nav_type, is_main_frame)
+
+    def wiki_channel(self):
+        if self._wiki_channel is None:
+            self._wiki_channel = QWebChannel(self)
+            self._wiki_channel.registerObject("wikiSaver", WikiSaver(self, self.browser))
+        return self._wiki_channel
+
+# ---- Browser Tab ----
+class BrowserTab(QWebEngineView):
+    def __init__(self, profile, browser, parent=None):
+        super().__init__(parent)
+        page = BrowserPage(profile, browser, self)
+        self.setPage(page)
+        settings = self.settings()
+        settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
+        settings.setAttribute(QWebEngineSettings.PluginsEnabled, False)
+        settings.setAttribute(QWebEngineSettings.FullScreenSupportEnabled, False)
+        # Für den Lifecycle-Scheduler
+        self.last_active = time.monotonic()
+        self.form_dirty = False
+        # Für den Verlauf: letzte bereits erfasste URL
+        self.last_visit_url = None
+
+# ---- Tab Lifecycle ----
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Merkt sich im ApplicationWorld, ob der Nutzer in ein Formular getippt hat
+FORM_STATE_JS = """
+(function() {
+  if (window.__voidFormWatch) return;
+  window.__voidFormWatch = true;
+  window.__voidFormDirty = false;
+  document.addEventListener('input', function(e) {
+    var t = e.target;
+    if (t && (t.form || t.isContentEditable || t.tagName === 'TEXTAREA')) window.__voidFormDirty = true;
+  }, true);
+  document.addEventListener('submit', function() { window.__voidFormDirty = false; }, true);
+})();
+"""
+
+def renderer_rss_bytes(pid):
+    """Resident set size of a process from /proc/<pid>/statm, 0 if unavailable."""
+    if not pid:
+        return 0
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+class TabLifecycleScheduler(QObject):
+    """Moves idle background tabs through Active → Frozen → Discarded.
+
+    Tabs are frozen after ``tab_freeze_after`` and discarded after
+    ``tab_discard_after`` seconds in the background. While the renderers
+    together exceed ``tab_memory_budget_mb``, the least recently used
+    background tabs are discarded early. Pages that are playing audio or
+    have unsaved form input are never touched; Qt's recommendedState()
+    is respected as an upper bound. A tab's memory counts against the
+    excess only if its discard is not vetoed. Discards of active pages
+    wait for an asynchronous form check; if that vetoes one made for the
+    budget, _cover_owed() discards further tabs for the amount it owed.
+    """
+    TICK_MS = 15000
+
+    def __init__(self, browser):
+        super().__init__(browser)
+        self.browser = browser
+        script = QWebEngineScript()
+        script.setName("void-form-state")
+        script.setSourceCode(FORM_STATE_JS)
+        script.setInjectionPoint(QWebEngineScript.DocumentReady)
+        script.setWorldId(QWebEngineScript.ApplicationWorld)
+        script.setRunsOnSubFrames(True)
+        browser.profile.scripts().insert(script)
+        self._shares = {}      # Tab → RSS-Anteil aus dem letzten tick()
+        self._pending = set()  # Tabs, deren Formularprüfung noch aussteht
+        self._vetoed = set()   # Tabs, deren Verwerfen fürs Budget seit dem letzten tick() abgelehnt wurde
+        self._owed = 0         # Bytes, die abgelehnte Budget-Verwerfungen noch schulden
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.tick)
+        self._timer.start(self.TICK_MS)
+
+    def _background_tabs(self):
+        current = self.browser.current_tab()
+        return [t for t in self.browser.live_tabs() if t is not current]
+
+    def _memory_shares(self):
+        """Total renderer RSS and each tab's share of its (possibly shared) renderer."""
+        by_pid = {}
+        for tab in self.browser.live_tabs():
+            by_pid.setdefault(tab.page().renderProcessPid(), []).append(tab)
+        total, shares = 0, {}
+        for pid, tabs in by_pid.items():
+            rss = renderer_rss_bytes(pid)
+            total += rss
+            for tab in tabs:
+                shares[tab] = rss // len(tabs)
+        return total, shares
+
+    def tick(self):
+        self._vetoed.clear()
+        self._owed = 0
+        settings = self.browser.settings_data
+        freeze_after = settings.get("tab_freeze_after", 300)
+        discard_after = settings.get("tab_discard_after", 1800)
+        budget = settings.get("tab_memory_budget_mb", 0) * 1024 * 1024
+        now = time.monotonic()
+
+        excess = 0
+        shares = {}
+        if budget:
+            total, shares = self._memory_shares()
+            excess = total - budget
+        self._shares = shares
+
+        for tab in sorted(self._background_tabs(), key=lambda t: t.last_active):
+            state = tab.page().lifecycleState()
+            if state == QWebEnginePage.LifecycleState.Discarded:
+                continue
+            idle = now - tab.last_active
+            for_budget = excess > 0
+            if for_budget or (discard_after and idle >= discard_after):
+                target = QWebEnginePage.LifecycleState.Discarded
+            elif freeze_after and idle >= freeze_after and state == QWebEnginePage.LifecycleState.Active:
+                target = QWebEnginePage.LifecycleState.Frozen
+            else:
+                continue
+            # Erst abziehen, wenn das Verwerfen nicht abgelehnt wurde – sonst gälte das Budget als eingehalten
+            if self._transition(tab, target, for_budget) and target == QWebEnginePage.LifecycleState.Discarded:
+                excess -= shares.get(tab, 0)
+
+    def _cover_owed(self):
+        """Discard further background tabs, least recently used first, until the owed bytes are covered."""
+        for tab in sorted(self._background_tabs(), key=lambda t: t.last_active):
+            if self._owed <= 0:
+                return
+            if (tab in self._vetoed or tab in self._pending
+                    or tab.page().lifecycleState() == QWebEnginePage.LifecycleState.Discarded):
+                continue
+            if self._transition(tab, QWebEnginePage.LifecycleState.Discarded, True):
+                self._owed -= self._shares.get(tab, 0)
+
+    def _transition(self, tab, target, for_budget=False):
+        """Start the transition; False if it was vetoed right away (audio, recommendedState, form input)."""
+        page = tab.page()
+        if page.recentlyAudible() or target.value > page.recommendedState().value:
+            return False
+        if page.lifecycleState() == QWebEnginePage.LifecycleState.Active:
+            # Eingefrorene Seiten führen kein JS mehr aus – Formularstatus jetzt abfragen
+            self._pending.add(tab)
+            page.runJavaScript("!!window.__voidFormDirty", QWebEngineScript.ApplicationWorld,
+                               lambda dirty, t=tab: self._checked(t, target, dirty, for_budget))
+            return True
+        return self._apply(tab, target, tab.form_dirty)
+
+    def _checked(self, tab, target, dirty, for_budget):
+        self._pending.discard(tab)
+        if not self._apply(tab, target, dirty) and for_budget and target == QWebEnginePage.LifecycleState.Discarded:
+            # Schon als frei gezählt: den Anteil bei anderen Tabs holen
+            self._vetoed.add(tab)
+            self._owed += self._shares.get(tab, 0)
+            self._cover_owed()
+
+    def _apply(self, tab, target, dirty):
+        tab.form_dirty = bool(dirty)
+        if tab.form_dirty or tab.tab_id not in self.browser._tabs or tab is self.browser.current_tab():
+            return False
+        tab.page().setLifecycleState(target)
+        return True
+
+# ---- Spare Tabs ----
+class SpareTabPool(QObject):
+    """Pre-built BrowserTabs, so opening a tab is a swap instead of a construction.
+
+    One spare already shows the start page for new tabs; the others are
+    blank pages for links and popups, which load their own URL. After a
+    tab is taken the pool refills one spare per REFILL_DELAY_MS. Its size
+    is the ``spare_tabs`` setting, and it drops to zero while the
+    renderers use more than PRESSURE of ``tab_memory_budget_mb``.
+    """
+    REFILL_DELAY_MS = 1500
+    PRESSURE = 0.8
+
+    def __init__(self, browser):
+        super().__init__(browser)
+        self.browser = browser
+        self._start = None
+        self._blank = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.refill)
+        self.stats = {"hits": 0, "misses": 0}
+
+    def spares(self):
+        return ([self._start] if self._start is not None else []) + self._blank
+
+    def target_size(self):
+        settings = self.browser.settings_data
+        size = max(0, settings.get("spare_tabs", 2))
+        budget = settings.get("tab_memory_budget_mb", 0) * 1024 * 1024
+        if size and budget:
+            pids = {tab.page().renderProcessPid() for tab in self.browser.live_tabs() + self.spares()}
+            if sum(renderer_rss_bytes(pid) for pid in pids) > budget * self.PRESSURE:
+                return 0
+        return size
+
+    def schedule_refill(self):
+        self._timer.start(self.REFILL_DELAY_MS)
+
+    def take_start(self):
+        """The spare already showing the start page, else a blank one (or None)."""
+        tab, self._start = self._start, None
+        if tab is None:
+            return self.take_blank()
+        self.stats["hits"] += 1
+        self.schedule_refill()
+        return tab
+
+    def take_blank(self):
+        tab = self._blank.pop() if self._blank else None
+        self.stats["hits" if tab is not None else "misses"] += 1
+        self.schedule_refill()
+        return tab
+
+    def refill(self):
+        size = self.target_size()
+        if len(self.spares()) > size:
+            self.clear()
+        if size == 0:
+            return
+        if self._start is None:
+            self._start = self.browser._build_tab()
+            self._start.setUrl(self.browser.home_url)
+        elif len(self._blank) < size - 1:
+            self._blank.append(self.browser._build_tab())
+        if len(self.spares()) < size:
+            self.schedule_refill()
+
+    def clear(self):
+        for tab in self.spares():
+            self.browser._stack.removeWidget(tab)
+            tab.setPage(QWebEnginePage())
+            tab.deleteLater()
+        self._start, self._blank = None, []
+
+# ---- Renderer Monitor ----
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+def format_bytes(n):
+    if n is None:
+        return "–"
+    return f"{n / 2**20:.0f} MB" if n < 2**30 else f"{n / 2**30:.2f} GB"
+
+class RendererMonitor(QObject):
+    """Samples CPU% and RSS/PSS of every tab's renderer process from /proc.
+
+    /proc/<pid>/stat is read every INTERVAL_MS (VISIBLE_INTERVAL_MS while
+    the task manager is open). smaps_rollup makes the kernel walk the
+    whole address space, so PSS is only refreshed every PSS_EVERY samples.
+    Files stay open between samples and are re-read with pread, which is
+    cheap enough to leave the monitor running all the time.
+    """
+    sampled = Signal()
+    INTERVAL_MS = 10000
+    VISIBLE_INTERVAL_MS = 2000
+    PSS_EVERY = 3
+
+    def __init__(self, browser):
+        super().__init__(browser)
+        self.browser = browser
+        self.samples = {}   # pid → {"cpu": %, "rss": bytes, "pss": bytes | None}
+        self._ticks = {}    # pid → (utime + stime, monotonic)
+        self._fds = {}      # (pid, name) → fd
+        self._count = 0
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.sample)
+        self._timer.start(self.INTERVAL_MS)
+
+    def set_visible(self, visible):
+        self._timer.setInterval(self.VISIBLE_INTERVAL_MS if visible else self.INTERVAL_MS)
+        if visible:
+            self.sample()
+
+    def _read(self, pid, name):
+        key = (pid, name)
+        fd = self._fds.get(key)
+        try:
+            if fd is None:
+                fd = self._fds[key] = os.open(f"/proc/{pid}/{name}", os.O_RDONLY)
+            return os.pread(fd, 4096, 0).decode()
+        except OSError:
+            self._close(key)
+            return None
+
+    def _close(self, key):
+        fd = self._fds.pop(key, None)
+        if fd is not None:
+            os.close(fd)
+
+    def _forget(self, pid):
+        self.samples.pop(pid, None)
+        self._ticks.pop(pid, None)
+        for name in ("stat", "smaps_rollup"):
+            self._close((pid, name))
+
+    def _pss(self, pid):
+        rollup = self._read(pid, "smaps_rollup")
+        match = re.search(r"^Pss:\s+(\d+) kB", rollup or "", re.M)
+        return int(match.group(1)) * 1024 if match else None
+
+    def sample(self):
+        pids = {tab.page().renderProcessPid() for tab in self.browser.live_tabs()} - {0}
+        for pid in set(self.samples) - pids:
+            self._forget(pid)
+        with_pss = self._count % self.PSS_EVERY == 0
+        self._count += 1
+        now = time.monotonic()
+        for pid in pids:
+            stat = self._read(pid, "stat")
+            if stat is None:
+                self._forget(pid)
+                continue
+            # Felder ab 3 (state); utime/stime sind Feld 14/15, rss (Seiten) Feld 24
+            fields = stat.rsplit(")", 1)[1].split()
+            ticks = int(fields[11]) + int(fields[12])
+            previous = self._ticks.get(pid)
+            cpu = 0.0
+            if previous is not None and now > previous[1]:
+                cpu = (ticks - previous[0]) / CLK_TCK / (now - previous[1]) * 100
+            self._ticks[pid] = (ticks, now)
+            pss = self.samples.get(pid, {}).get("pss")
+            if with_pss or pss is None:
+                pss = self._pss(pid)
+            self.samples[pid] = {"cpu": round(cpu, 1), "rss": int(fields[21]) * PAGE_SIZE, "pss": pss}
+        self.sampled.emit()
+
+    def kill(self, pid):
+        """Kills a renderer; every tab in it shows a crashed page until reloaded."""
+        if pid:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError as e:
+                print(f"Renderer {pid} konnte nicht beendet werden: {e}", file=sys.stderr)
+
+class RendererTableModel(QAbstractTableModel):
+    """One row per live tab: its renderer's pid, state, CPU and memory."""
+    HEADERS = ("Tab", "PID", "Status", "CPU %", "RSS", "PSS")
+    STATES = {
+        QWebEnginePage.LifecycleState.Frozen: "Eingefroren",
+        QWebEnginePage.LifecycleState.Discarded: "Verworfen",
+    }
+
+    def __init__(self, browser, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self._rows = []
+
+    def refresh(self):
+        samples = self.browser.renderer_monitor.samples
+        tabs = self.browser.live_tabs()
+        pids = [tab.page().renderProcessPid() for tab in tabs]
+        rows = []
+        for tab, pid in zip(tabs, pids):
+            page = tab.page()
+            state = self.STATES.get(page.lifecycleState())
+            if state is None:
+                state = "Beendet" if not pid else "Lädt" if page.isLoading() else "Aktiv"
+            if pid and pids.count(pid) > 1:
+                state += f" (Prozess mit {pids.count(pid)} Tabs)"
+            sample = samples.get(pid, {})
+            rows.append((tab.tab_id, tab.title() or tab.url().toString(), pid, state,
+                         sample.get("cpu"), sample.get("rss"), sample.get("pss")))
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def row_info(self, row):
+        """(tab_id, pid) of a row."""
+        return self._rows[row][0], self._rows[row][2]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        _, title, pid, state, cpu, rss, pss = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            return (title, str(pid or "–"), state,
+                    "–" if cpu is None else f"{cpu:.1f}", format_bytes(rss), format_bytes(pss))[col]
+        if role == Qt.TextAlignmentRole and col >= 3:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+class TaskManager(QWidget):
+    """Renderer task manager (Shift+Esc): CPU and memory per tab, reload or kill its renderer."""
+
+    def __init__(self, browser):
+        super().__init__(browser, Qt.Window)
+        self.browser = browser
+        self.setObjectName("taskManager")
+        self.setWindowTitle("Task-Manager")
+        self.resize(760, 420)
+        self.model = RendererTableModel(browser, self)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().hide()
+        self.table.setShowGrid(False)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        reload_btn = QPushButton("Neu laden")
+        reload_btn.clicked.connect(self._reload)
+        kill_btn = QPushButton("Prozess beenden")
+        kill_btn.setToolTip("Beendet den Renderer – alle Tabs in diesem Prozess stürzen ab")
+        kill_btn.clicked.connect(self._kill)
+        buttons.addWidget(reload_btn)
+        buttons.addWidget(kill_btn)
+        layout.addLayout(buttons)
+
+        browser.renderer_monitor.sampled.connect(self._refresh)
+
+    def _refresh(self):
+        if not self.isVisible():
+            return
+        selected = self._selected()
+        self.model.refresh()
+        # Auswahl über den Neuaufbau des Modells hinweg halten
+        for row in range(self.model.rowCount()):
+            if selected and self.model.row_info(row)[0] == selected[0]:
+                self.table.selectRow(row)
+
+    def _selected(self):
+        rows = self.table.selectionModel().selectedRows()
+        return self.model.row_info(rows[0].row()) if rows else None
+
+    def _reload(self):
+        selected = self._selected()
+        tab = self.browser._tabs.get(selected[0]) if selected else None
+        if tab is not None:
+            tab.reload()
+
+    def _kill(self):
+        selected = self._selected()
+        if selected:
+            self.browser.renderer_monitor.kill(selected[1])
+
+    def showEvent(self, event):
+        self.browser.renderer_monitor.set_visible(True)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.browser.renderer_monitor.set_visible(False)
+        super().hideEvent(event)
+
+# ---- Tab Sidebar (Model/View) ----
+class TabListModel(QAbstractListModel):
+    """Sidebar rows keyed by stable tab ids; the view paints only visible rows.
+
+    ``_rows`` maps tab id → row, so lookups by id are O(1). remove() does
+    not renumber the rows behind the removed one; they are renumbered
+    from ``_stale_from`` the first time one of them is looked up.
+    """
+    TabIdRole = Qt.UserRole + 1
+    ActiveRole = Qt.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._rows = {}
+        self._stale_from = 0
+        self._titles = {}
+        self._icons = {}
+        self.active_id = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        tab_id = self._ids[index.row()]
+        if role == Qt.DisplayRole:
+            return self._titles.get(tab_id, "")
+        if role == Qt.DecorationRole:
+            return self._icons.get(tab_id)
+        if role == self.TabIdRole:
+            return tab_id
+        if role == self.ActiveRole:
+            return tab_id == self.active_id
+        return None
+
+    def ids(self):
+        return list(self._ids)
+
+    def id_at(self, row):
+        return self._ids[row] if 0 <= row < len(self._ids) else None
+
+    def row_of(self, tab_id):
+        row = self._rows.get(tab_id)
+        if row is None:
+            return -1
+        if row >= self._stale_from:
+            ids = self._ids
+            for r in range(self._stale_from, len(ids)):
+                self._rows[ids[r]] = r
+            self._stale_from = len(ids)
+            row = self._rows[tab_id]
+        return row
+
+    def append(self, tab_id, title):
+        row = len(self._ids)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ids.append(tab_id)
+        self._rows[tab_id] = row
+        if self._stale_from == row:
+            self._stale_from = row + 1
+        self._titles[tab_id] = title
+        self.endInsertRows()
+
+    def remove(self, tab_id):
+        row = self.row_of(tab_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ids[row]
+        del self._rows[tab_id]
+        self._stale_from = min(self._stale_from, row)
+        self._titles.pop(tab_id, None)
+        self._icons.pop(tab_id, None)
+        self.endRemoveRows()
+
+    def _changed(self, tab_id, roles):
+        row = self.row_of(tab_id)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, roles)
+
+    def set_title(self, tab_id, title):
+        self._titles[tab_id] = title
+        self._changed(tab_id, [Qt.DisplayRole])
+
+    def set_icon(self, tab_id, icon):
+        self._icons[tab_id] = icon if icon and not icon.isNull() else None
+        self._changed(tab_id, [Qt.DecorationRole])
+
+    def set_active(self, tab_id):
+        previous, self.active_id = self.active_id, tab_id
+        if previous is not None:
+            self._changed(previous, [self.ActiveRole])
+        self._changed(tab_id, [self.ActiveRole])
+
+class TabDelegate(QStyledItemDelegate):
+    """Paints a sidebar row: favicon box, label and close button."""
+    ROW_HEIGHT = 36
+    ROW_GAP = 1
+    closeRequested = Signal(int)
+
+    BG = QColor("#0a0a14")
+    BG_ACTIVE = QColor("#2a1f3d")
+    FG = QColor("#6a5080")
+    FG_ACTIVE = QColor("#e8d0f8")
+    BOX_BG = QColor("#12101e")
+    BOX_BORDER = QColor("#2a1f3d")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.collapsed = False
+        self._default_icon = None
+
+    def default_icon(self):
+        # Unauffälliges Welt-Icon als Fallback
+        if self._default_icon is None:
+            self._default_icon = QApplication.style().standardIcon(QStyle.SP_DriveNetIcon)
+        return self._default_icon
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT + self.ROW_GAP)
+
+    def _row_rect(self, option):
+        r = option.rect
+        return QRect(r.x(), r.y(), r.width(), self.ROW_HEIGHT)
+
+    def _box_rect(self, row):
+        # Eingeklappt: gleichmäßiger Abstand links und rechts um die Favicon-Box
+        left = 10 if self.collapsed else 8
+        return QRect(row.x() + left, row.y() + (row.height() - 28) // 2, 28, 28)
+
+    def _close_rect(self, row):
+        return QRect(row.right() - 6 - 18, row.y() + (row.height() - 18) // 2, 18, 18)
+
+    def paint(self, painter, option, index):
+        row = self._row_rect(option)
+        active = index.data(TabListModel.ActiveRole)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(row, self.BG_ACTIVE if active else self.BG)
+
+        box = self._box_rect(row)
+        painter.setPen(QPen(self.BOX_BORDER, 1))
+        painter.setBrush(self.BOX_BG)
+        painter.drawRoundedRect(box.adjusted(0, 0, -1, -1), 6, 6)
+        icon = index.data(Qt.DecorationRole) or self.default_icon()
+        icon.paint(painter, box.adjusted(6, 6, -6, -6))
 
-DEFAULT_SETTINGS = {
-    "sidebar_width": 220,
-    "engine": "https://google.com/search?q=",
-    "homepage": "void",
-    "homepage_url": "",
-    "tracker": True,
-    "dnt": False,
-    "auto_collapse": True,
-}
+        if not self.collapsed:
+            painter.setPen(self.FG_ACTIVE if active else self.FG)
+            close = self._close_rect(row)
+            label = QRect(box.right() + 9, row.y(), close.left() - box.right() - 17, row.height())
+            text = option.fontMetrics.elidedText(index.data(Qt.DisplayRole) or "", Qt.ElideRight, label.width())
+            painter.drawText(label, Qt.AlignVCenter | Qt.AlignLeft, text)
+            painter.drawText(close, Qt.AlignCenter, "✕")
+        painter.restore()
 
-def load_settings():
-    try:
-        if SETTINGS_FILE.exists():
-            with open(SETTINGS_FILE) as f:
-                data = json.load(f)
-                return {**DEFAULT_SETTINGS, **data}
-    except Exception:
-        pass
-    return DEFAULT_SETTINGS.copy()
+    def editorEvent(self, event, model, option, index):
+        # Schon beim Drücken schließen: clicked kommt beim Loslassen vor editorEvent und würde erst
+        # auf den Tab wechseln; nach dem Entfernen passt der gedrückte Index nicht mehr, clicked bleibt aus
+        if (event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease)
+                and event.button() == Qt.LeftButton and not self.collapsed
+                and self._close_rect(self._row_rect(option)).contains(event.position().toPoint())):
+            if event.type() == QEvent.MouseButtonPress:
+                self.closeRequested.emit(index.data(TabListModel.TabIdRole))
+            return True
+        return super().editorEvent(event, model, option, index)
 
-def save_settings(data):
-    with open(SETTINGS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+class SidebarHost(QWidget):
+    """Holds the tab stack and lets the sidebar float over it.
+
+    In overlay mode the sidebar is taken out of the layout; a fixed-width
+    placeholder keeps the collapsed strip free. Expanding then only resizes
+    the sidebar and repaints what it covers – the web view keeps its
+    geometry, so the page is not laid out again on every animation frame.
+    """
 
-# ---- Tracker Blocker ----
-class SimpleTrackerBlocker(QWebEngineUrlRequestInterceptor):
-    BLOCKED_DOMAINS = [
-        "doubleclick.net", "google-analytics.com",
-        "googletagmanager.com", "facebook.net", "adsystem.com"
-    ]
     def __init__(self):
         super().__init__()
-        self.enabled = True
+        self.sidebar = None
+        self.overlay = False
 
-    def interceptRequest(self, info):
-        if not self.enabled:
-            return
-        url = info.requestUrl().toString()
-        for domain in self.BLOCKED_DOMAINS:
-            if domain in url:
-                info.block(True)
-                return
+    def place_sidebar(self):
+        if self.overlay and self.sidebar is not None:
+            self.sidebar.setGeometry(0, 0, self.sidebar.width(), self.height())
+            self.sidebar.raise_()
 
-# ---- QWebChannel Bridge ----
-class BrowserBridge(QObject):
-    sidebarWidthChanged = Signal(int)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.place_sidebar()
 
-    def __init__(self, browser):
-        super().__init__()
-        self.browser = browser
+class FrameTimeRecorder(QObject):
+    """Frame intervals of one widget while an animation runs.
 
-    @Slot(int)
-    def setSidebarWidth(self, width):
-        width = max(160, min(400, width))
-        self.browser.settings_data["sidebar_width"] = width
-        save_settings(self.browser.settings_data)
-        self.browser.apply_sidebar_width(width)
+    start() arms it and every paint of the widget counts as a frame;
+    stop() turns the intervals into a summary, kept in ``runs``.
+    """
+    BUDGET_MS = 1000 / 60
 
-    @Slot(str)
-    def setEngine(self, engine):
-        self.browser.settings_data["engine"] = engine
-        save_settings(self.browser.settings_data)
+    def __init__(self, widget, keep=20):
+        super().__init__(widget)
+        widget.installEventFilter(self)
+        self.runs = deque(maxlen=keep)
+        self._frames = None
 
-    @Slot(bool)
-    def setTracker(self, enabled):
-        self.browser.settings_data["tracker"] = enabled
-        self.browser.tracker.enabled = enabled
-        save_settings(self.browser.settings_data)
+    def eventFilter(self, obj, event):
+        if self._frames is not None and event.type() == QEvent.Paint:
+            self._frames.append(perf_counter_ns())
+        return False
 
-    @Slot(bool)
-    def setDnt(self, enabled):
-        self.browser.settings_data["dnt"] = enabled
-        save_settings(self.browser.settings_data)
+    def start(self):
+        self._frames = [perf_counter_ns()]
 
-    @Slot(str, str)
-    def setHomepage(self, mode, url):
-        self.browser.settings_data["homepage"] = mode
-        self.browser.settings_data["homepage_url"] = url
-        save_settings(self.browser.settings_data)
+    def stop(self):
+        frames, self._frames = self._frames, None
+        if not frames or len(frames) < 2:
+            return None
+        intervals = sorted((b - a) / 1e6 for a, b in zip(frames, frames[1:]))
+        summary = {
+            "frames": len(intervals),
+            "duration_ms": round((frames[-1] - frames[0]) / 1e6, 2),
+            "mean_ms": round(sum(intervals) / len(intervals), 2),
+            "p95_ms": round(intervals[min(len(intervals) - 1, int(len(intervals) * 0.95))], 2),
+            "max_ms": round(intervals[-1], 2),
+            # Länger als anderthalb Frames: mindestens ein Bild ausgelassen
+            "janky": sum(1 for i in intervals if i > 1.5 * self.BUDGET_MS),
+        }
+        self.runs.append(summary)
+        return summary
 
-    @Slot(bool)
-    def setAutoCollapse(self, enabled):
-        self.browser.settings_data["auto_collapse"] = enabled
-        save_settings(self.browser.settings_data)
-        self.browser.apply_auto_collapse(enabled)
+# ---- Session ----
+def serialize_history(page):
+    data = QByteArray()
+    stream = QDataStream(data, QIODevice.WriteOnly)
+    stream << page.history()
+    return bytes(data.toBase64()).decode()
 
-    @Slot(str, result=str)
-    def resolveLocalPath(self, relative_path):
-        """Löst einen relativen Pfad von void.py aus auf einen absoluten file:// URL."""
-        base = Path(__file__).parent
-        resolved = (base / relative_path).resolve()
-        return resolved.as_uri()  # gibt file:///absoluter/pfad zurück
+def restore_history(page, encoded):
+    data = QByteArray.fromBase64(encoded.encode())
+    stream = QDataStream(data, QIODevice.ReadOnly)
+    stream >> page.history()
 
-    @Slot(result=str)
-    def getSettings(self):
-        return json.dumps(self.browser.settings_data)
+class SessionJournal:
+    """Append-only JSON-lines log of tab state.
 
-# ---- Custom Page ----
-class BrowserPage(QWebEnginePage):
-    def __init__(self, profile, browser, parent=None):
-        super().__init__(profile, parent)
-        self.browser = browser
-        self.linkHovered.connect(self._on_link_hovered)
+    Every change is appended and flushed immediately, so a crash loses at
+    most the record being written. load() folds the log into one record
+    per open tab; compact() rewrites it to exactly that.
 
-    def _on_link_hovered(self, url):
-        if url:
-            self.browser.statusbar.showMessage(url)
-        else:
-            self.browser.statusbar.clearMessage()
+    Once the log is larger than COMPACT_FACTOR times its size after the
+    last compact() (and at least COMPACT_MIN_BYTES), ``on_full`` is
+    called once, so the owner can compact during the session.
+    """
+    COMPACT_MIN_BYTES = 1 << 20
+    COMPACT_FACTOR = 4
 
-    def createWindow(self, win_type):
-        tab = self.browser.add_tab()
-        return tab.page()
+    def __init__(self, path, on_full=None):
+        self.path = path
+        self.on_full = on_full
+        self._file = None
+        try:
+            self._size = path.stat().st_size
+        except OSError:
+            self._size = 0
+        self._compacted_size = 0
+        self._full = False
 
-# ---- Browser Tab ----
-class BrowserTab(QWebEngineView):
-    def __init__(self, profile, browser, parent=None):
-        super().__init__(parent)
-        page = BrowserPage(profile, browser, self)
-        self.setPage(page)
-        settings = self.settings()
-        settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
-        settings.setAttribute(QWebEngineSettings.PluginsEnabled, False)
-        settings.setAttribute(QWebEngineSettings.FullScreenSupportEnabled, False)
+    def load(self):
+        """Return (records in tab order, active tab id)."""
+        tabs, active = {}, None
         try:
-            settings.setAttribute(QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
-            settings.setAttribute(QWebEngineSettings.LocalContentCanAccessFileUrls, True)
-        except AttributeError:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # abgeschnittene letzte Zeile nach einem Absturz
+                    op, tab_id = rec.pop("op", None), rec.pop("id", None)
+                    if op == "open":
+                        tabs[tab_id] = rec
+                    elif op == "update" and tab_id in tabs:
+                        tabs[tab_id].update(rec)
+                    elif op == "close":
+                        tabs.pop(tab_id, None)
+                    elif op == "active":
+                        active = tab_id
+        except OSError:
             pass
+        order = list(tabs)
+        return [tabs[i] for i in order], (order.index(active) if active in tabs else 0)
+
+    def compact(self, records, active_index):
+        """Replace the journal with one open record per tab, ids = list positions."""
+        self.close()
+        tmp = Path(str(self.path) + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for tab_id, rec in records:
+                f.write(json.dumps({"op": "open", "id": tab_id, **rec}) + "\n")
+            if records:
+                f.write(json.dumps({"op": "active", "id": records[active_index][0]}) + "\n")
+            size = f.tell()
+        os.replace(tmp, self.path)
+        self._size = self._compacted_size = size
+        self._full = False
+
+    def append(self, op, tab_id, **fields):
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        line = json.dumps({"op": op, "id": tab_id, **fields}) + "\n"
+        self._file.write(line)
+        self._file.flush()
+        self._size += len(line)
+        if (not self._full and self.on_full is not None
+                and self._size > max(self.COMPACT_MIN_BYTES, self.COMPACT_FACTOR * self._compacted_size)):
+            self._full = True
+            self.on_full()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
-# ---- Tab Entry Widget ----
-class TabEntry(QWidget):
-    def __init__(self, label, on_click, on_close, parent=None):
+# ---- History ----
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL DEFAULT '',
+    visit_count INTEGER NOT NULL DEFAULT 0,
+    last_visit REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS visits (
+    id INTEGER PRIMARY KEY,
+    url_id INTEGER NOT NULL REFERENCES urls(id),
+    visited_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS visits_url ON visits(url_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS urls_fts USING fts5(
+    title, url, content='urls', content_rowid='id', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS urls_ai AFTER INSERT ON urls BEGIN
+    INSERT INTO urls_fts(rowid, title, url) VALUES (new.id, new.title, new.url);
+END;
+CREATE TRIGGER IF NOT EXISTS urls_au AFTER UPDATE OF title, url ON urls
+WHEN old.title != new.title OR old.url != new.url BEGIN
+    INSERT INTO urls_fts(urls_fts, rowid, title, url) VALUES ('delete', old.id, old.title, old.url);
+    INSERT INTO urls_fts(rowid, title, url) VALUES (new.id, new.title, new.url);
+END;
+CREATE TRIGGER IF NOT EXISTS urls_ad AFTER DELETE ON urls BEGIN
+    INSERT INTO urls_fts(urls_fts, rowid, title, url) VALUES ('delete', old.id, old.title, old.url);
+END;
+"""
+
+def connect_sqlite(path):
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def fts_query(text):
+    """Turns free text into an FTS5 query: every word as a quoted prefix term."""
+    words = re.findall(r"\w+", text.lower())
+    return " ".join(f'"{w}"*' for w in words)
+
+class HistoryStore:
+    """Browsing history in a WAL-mode SQLite database with an FTS5 index.
+
+    visit()/set_title() only append to an in-memory queue; a worker thread
+    drains it and writes each batch in one transaction, so the GUI never
+    waits on the disk. Reads use their own connection and page by visit id.
+    """
+    FLUSH_INTERVAL = 1.0
+    MAX_BATCH = 5000
+
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+        with connect_sqlite(path) as conn:
+            conn.executescript(HISTORY_SCHEMA)
+        conn.close()
+        self._queue = queue.SimpleQueue()
+        self._reader = None
+        self._worker = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._worker.start()
+
+    # -- Schreiben (beliebiger Thread, blockiert nie) --
+    def visit(self, url, title="", when=None):
+        self._queue.put(("visit", url, title or "", time.time() if when is None else when))
+
+    def set_title(self, url, title):
+        if title:
+            self._queue.put(("title", url, title))
+
+    def close(self):
+        """Flushes everything queued so far and stops the writer."""
+        self._queue.put(None)
+        self._worker.join()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def _run(self):
+        conn = connect_sqlite(self.path)
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while batch[-1] is not None and len(batch) < self.MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            try:
+                self._write(conn, [op for op in batch if op is not None])
+            except sqlite3.Error as e:
+                print(f"Verlauf konnte nicht geschrieben werden: {e}", file=sys.stderr)
+            if stop:
+                conn.close()
+                return
+
+    @staticmethod
+    def _write(conn, ops):
+        visits = [op[1:] for op in ops if op[0] == "visit"]
+        titles = [(op[2], op[1]) for op in ops if op[0] == "title"]
+        with conn:
+            conn.executemany(
+                "INSERT INTO urls(url, title, visit_count, last_visit) VALUES (?, ?, 1, ?) "
+                "ON CONFLICT(url) DO UPDATE SET visit_count = visit_count + 1, "
+                "last_visit = excluded.last_visit, "
+                "title = CASE WHEN excluded.title != '' THEN excluded.title ELSE title END",
+                visits)
+            conn.executemany(
+                "INSERT INTO visits(url_id, visited_at) SELECT id, ? FROM urls WHERE url = ?",
+                [(when, url) for url, _, when in visits])
+            conn.executemany("UPDATE urls SET title = ? WHERE url = ? AND title != ?",
+                             [(t, u, t) for t, u in titles])
+
+    # -- Lesen (GUI-Thread) --
+    def _conn(self):
+        if self._reader is None:
+            self._reader = connect_sqlite(self.path)
+        return self._reader
+
+    def page(self, query="", before_id=None, limit=200):
+        """Visits newest first, at most ``limit``, all older than visit ``before_id``.
+
+        Returns (visit_id, visited_at, title, url) rows; pass the last id
+        back as ``before_id`` for the next page.
+        """
+        sql = ("SELECT v.id, v.visited_at, u.title, u.url FROM visits v "
+               "JOIN urls u ON u.id = v.url_id WHERE v.id < ?")
+        params = [before_id if before_id is not None else 2 ** 63 - 1]
+        match = fts_query(query)
+        if match:
+            sql += " AND v.url_id IN (SELECT rowid FROM urls_fts WHERE urls_fts MATCH ?)"
+            params.append(match)
+        sql += " ORDER BY v.id DESC LIMIT ?"
+        params.append(limit)
+        return self._conn().execute(sql, params).fetchall()
+
+    def pages(self):
+        """Every known page as (url, title, visit_count, last_visit); own connection, any thread."""
+        conn = connect_sqlite(self.path)
+        try:
+            yield from conn.execute("SELECT url, title, visit_count, last_visit FROM urls")
+        finally:
+            conn.close()
+
+    def search(self, query, limit=20):
+        """Distinct pages matching ``query``, most visited first: (url, title, visit_count, last_visit)."""
+        match = fts_query(query)
+        if not match:
+            return []
+        return self._conn().execute(
+            "SELECT u.url, u.title, u.visit_count, u.last_visit FROM urls_fts f "
+            "JOIN urls u ON u.id = f.rowid WHERE urls_fts MATCH ? "
+            "ORDER BY u.visit_count DESC, u.last_visit DESC LIMIT ?", (match, limit)).fetchall()
+
+class HistoryModel(QAbstractTableModel):
+    """Visits for the history viewer, fetched from the database page by page as the view scrolls."""
+    PAGE = 200
+    HEADERS = ("Zeit", "Titel", "Adresse")
+
+    def __init__(self, store, parent=None):
         super().__init__(parent)
-        self.on_click = on_click
-        self.setFixedHeight(36)
-        self.setCursor(Qt.PointingHandCursor)
-        self._active = False
-        self.setObjectName("tabEntry")
-
-        self._layout = QHBoxLayout(self)
-        self._layout.setContentsMargins(8, 0, 6, 0)
-        self._layout.setSpacing(8)
-
-        # Favicon box – feste 28x28 Box mit Border
-        self.favicon_box = QWidget()
-        self.favicon_box.setFixedSize(28, 28)
-        self.favicon_box.setStyleSheet("""
-            background-color: #12101e;
-            border: 1px solid #2a1f3d;
-            border-radius: 6px;
-        """)
-        fav_layout = QHBoxLayout(self.favicon_box)
-        fav_layout.setContentsMargins(4, 4, 4, 4)
+        self.store = store
+        self.query = ""
+        self._rows = []
+        self._exhausted = False
 
-        self.favicon = QLabel()
-        self.favicon.setFixedSize(16, 16)
-        self.favicon.setScaledContents(True)
-        self._set_default_icon()
-        fav_layout.addWidget(self.favicon)
+    def set_query(self, query):
+        self.beginResetModel()
+        self.query = query
+        self._rows = []
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
 
-        self._layout.addWidget(self.favicon_box)
+    def url_at(self, row):
+        return self._rows[row][3]
 
-        self.label = QLabel(label)
-        self._layout.addWidget(self.label)
-        self._layout.addStretch()
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
 
-        self.close_btn = QPushButton("✕")
-        self.close_btn.setFixedSize(18, 18)
-        self.close_btn.clicked.connect(on_close)
-        self._layout.addWidget(self.close_btn)
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
 
-        self._update_style()
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
 
-    def _set_default_icon(self):
-        # Unauffälliges Welt-Icon als Fallback
-        pixmap = QApplication.style().standardIcon(QStyle.SP_DriveNetIcon).pixmap(16, 16)
-        self.favicon.setPixmap(pixmap)
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        _, when, title, url = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            col = index.column()
+            if col == 0:
+                return QDateTime.fromSecsSinceEpoch(int(when)).toString("dd.MM.yyyy HH:mm")
+            return (title or url) if col == 1 else url
+        if role == Qt.ToolTipRole:
+            return url
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        before = self._rows[-1][0] if self._rows else None
+        try:
+            rows = self.store.page(self.query, before, self.PAGE)
+        except sqlite3.Error as e:
+            print(f"Verlauf nicht lesbar: {e}", file=sys.stderr)
+            rows = []
+        self._exhausted = len(rows) < self.PAGE
+        if rows:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+class HistoryViewer(QWidget):
+    """Searchable history window (Ctrl+H); double-click opens the page in a new tab."""
+    openRequested = Signal(QUrl)
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setObjectName("historyViewer")
+        self.setWindowTitle("Verlauf")
+        self.resize(900, 600)
+        self.model = HistoryModel(store, self)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Verlauf durchsuchen …")
+        layout.addWidget(self.search)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().hide()
+        self.table.setShowGrid(False)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        # Suche erst nach einer Tipppause, nicht bei jedem Zeichen
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(lambda: self.model.set_query(self.search.text()))
+        self.search.textChanged.connect(lambda _: self._search_timer.start())
+        self.table.doubleClicked.connect(lambda idx: self.openRequested.emit(QUrl(self.model.url_at(idx.row()))))
+
+    def showEvent(self, event):
+        self.model.set_query(self.search.text())
+        super().showEvent(event)
+
+# ---- Wiki Index ----
+WIKI_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS wiki_files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tiddlers (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    title TEXT NOT NULL,
+    digest BLOB NOT NULL,
+    UNIQUE(path, title)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS tiddlers_fts USING fts5(
+    title, tags, text, path UNINDEXED, tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+"""
+WIKI_INDEX_VERSION = 2   # 2: path in tiddlers_fts, damit der Wiki-Filter vor dem LIMIT greift
+
+class StoreAreaParser(HTMLParser):
+    """Tiddlers from the <div id="storeArea"> of TiddlyWiki Classic and TW5 before 5.2."""
+
+    def __init__(self, on_tiddler):
+        super().__init__(convert_charrefs=True)
+        self.on_tiddler = on_tiddler
+        self.done = False
+        self._in_store = False
+        self._div = None
+        self._pre = False
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "div" and attrs.get("id") == "storeArea":
+            self._in_store = True
+        elif tag == "div" and self._in_store and "title" in attrs:
+            self._div, self._text = attrs, []
+        elif tag == "pre" and self._div is not None:
+            self._pre = True
+
+    def handle_endtag(self, tag):
+        if tag == "pre":
+            self._pre = False
+        elif tag == "div" and self._div is not None:
+            self.on_tiddler({**self._div, "text": "".join(self._text)})
+            self._div = None
+        elif tag == "div" and self._in_store:
+            self._in_store, self.done = False, True
+
+    def handle_data(self, data):
+        if self._pre:
+            self._text.append(data)
+
+def tiddler_digest(source):
+    return hashlib.blake2b(source, digest_size=16).digest()
+
+def iter_tiddlers(path, known=()):
+    """Yields (digest, fields) for every tiddler in a single-file wiki.
+
+    The file is read line by line. TiddlyWiki ≥ 5.2 writes its
+    <script class="tiddlywiki-tiddler-store"> with one JSON tiddler per
+    line, so each line is hashed as raw bytes and only decoded when its
+    digest is not in ``known`` – unchanged tiddlers come back as
+    ``(digest, None)``. Older wikis go through StoreAreaParser.
+    """
+    in_json, legacy, found = False, None, []
+    with open(path, "rb") as f:
+        for line in f:
+            if legacy is not None:
+                legacy.feed(line.decode("utf-8", "replace"))
+                yield from legacy_tiddlers(found)
+                if legacy.done:
+                    legacy = None
+                continue
+            if not in_json:
+                start = line.find(b"tiddlywiki-tiddler-store")
+                if start >= 0 and b"<script" in line[:start]:
+                    in_json, line = True, line[line.index(b">", start) + 1:]
+                elif b'id="storeArea"' in line:
+                    legacy = StoreAreaParser(found.append)
+                    legacy.feed(line.decode("utf-8", "replace"))
+                    continue
+                else:
+                    continue
+            end = line.find(b"</script")
+            if end >= 0:
+                in_json, line = False, line[:end]
+            chunk = line.strip()
+            if chunk.startswith(b"["):
+                chunk = chunk[1:]
+            if chunk.endswith(b"]") and chunk[:-1].rstrip().endswith(b"}"):
+                chunk = chunk[:-1]
+            chunk = chunk.rstrip().rstrip(b",")
+            if not chunk:
+                continue
+            digest = tiddler_digest(chunk)
+            if digest in known:
+                # Unverändert seit dem letzten Index – kein JSON-Parsen nötig
+                yield digest, None
+                continue
+            try:
+                fields = json.loads(chunk)
+            except ValueError:
+                # Ganzer Store in einer Zeile (kleine oder von Hand gebaute Wikis)
+                try:
+                    found.extend(f for f in json.loads(b"[" + chunk + b"]") if isinstance(f, dict))
+                except ValueError:
+                    pass
+                yield from legacy_tiddlers(found)
+                continue
+            if isinstance(fields, dict):
+                yield digest, fields
+    yield from legacy_tiddlers(found)
+
+def legacy_tiddlers(found):
+    # Ohne eigene Zeile pro Tiddler: jedes einzeln hashen, geparst wird ohnehin
+    for fields in found:
+        yield tiddler_digest(json.dumps(fields, sort_keys=True).encode()), fields
+    found.clear()
+
+class WikiIndex:
+    """Persistent FTS5 index over the tiddlers of single-file TiddlyWikis.
+
+    refresh() re-reads a wiki only when its mtime or size changed, streams
+    the file, and rewrites just the tiddlers whose content differs from
+    the indexed version. Refreshes run on a worker thread; search() uses
+    its own connection on the GUI thread and ranks with bm25, titles first;
+    the wiki filter runs inside the FTS query, before ORDER BY rank and
+    LIMIT. Only one wiki is configured at a time: a refresh drops the
+    tiddlers of every other path.
+    """
+    SNIPPET_CHARS = 80
+
+    def __init__(self, path=WIKI_INDEX_DB):
+        self.path = path
+        conn = connect_sqlite(path)
+        with conn:
+            # Der Index ist nur ein Cache: bei altem Schema neu aufbauen statt migrieren
+            if conn.execute("PRAGMA user_version").fetchone()[0] != WIKI_INDEX_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS tiddlers_fts; DROP TABLE IF EXISTS tiddlers; "
+                                   "DROP TABLE IF EXISTS wiki_files;")
+                conn.executescript(WIKI_INDEX_SCHEMA)
+                conn.execute("INSERT INTO tiddlers_fts(tiddlers_fts, rank) VALUES ('rank', 'bm25(10.0, 4.0, 1.0, 0.0)')")
+                conn.execute(f"PRAGMA user_version = {WIKI_INDEX_VERSION}")
+        conn.close()
+        self._reader = None
+        self._lock = threading.Lock()
+        self._refreshing = set()
+
+    def refresh_async(self, wiki):
+        """Starts refresh(wiki) on a worker thread unless one is already running for it.
+
+        ``wiki=None`` only drops what is indexed, for when no wiki is configured.
+        """
+        wiki = str(wiki) if wiki is not None else None
+        with self._lock:
+            if wiki in self._refreshing:
+                return
+            self._refreshing.add(wiki)
+
+        def run():
+            try:
+                if wiki is None:
+                    self.purge()
+                else:
+                    self.refresh(wiki)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Wiki-Index für {wiki} fehlgeschlagen: {e}", file=sys.stderr)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(wiki)
+        threading.Thread(target=run, name="wiki-index", daemon=True).start()
+
+    def refresh(self, wiki):
+        """Brings the index of ``wiki`` up to date; returns the number of tiddlers written."""
+        wiki = str(wiki)
+        st = os.stat(wiki)
+        self.purge(keep=wiki)
+        conn = connect_sqlite(self.path)
+        try:
+            known = conn.execute("SELECT mtime_ns, size FROM wiki_files WHERE path = ?", (wiki,)).fetchone()
+            if known == (st.st_mtime_ns, st.st_size):
+                return 0
+            titles = dict(conn.execute("SELECT digest, title FROM tiddlers WHERE path = ?", (wiki,)))
+            seen, written = set(), 0
+            with conn:
+                for digest, fields in iter_tiddlers(wiki, titles):
+                    if fields is None:
+                        seen.add(titles[digest])
+                        continue
+                    title = str(fields.get("title", ""))
+                    if not title or title in seen:
+                        continue
+                    seen.add(title)
+                    row = conn.execute("SELECT id FROM tiddlers WHERE path = ? AND title = ?", (wiki, title)).fetchone()
+                    if row:
+                        conn.execute("UPDATE tiddlers SET digest = ? WHERE id = ?", (digest, row[0]))
+                        conn.execute("DELETE FROM tiddlers_fts WHERE rowid = ?", (row[0],))
+                        tiddler_id = row[0]
+                    else:
+                        tiddler_id = conn.execute("INSERT INTO tiddlers(path, title, digest) VALUES (?, ?, ?)",
+                                                  (wiki, title, digest)).lastrowid
+                    # System-Tiddler und Plugins nur merken, für die Suche sind sie Ballast
+                    if not title.startswith("$:/"):
+                        conn.execute("INSERT INTO tiddlers_fts(rowid, title, tags, text, path) VALUES (?, ?, ?, ?, ?)",
+                                     (tiddler_id, title, str(fields.get("tags", "")), str(fields.get("text", "")),
+                                      wiki))
+                    written += 1
+                gone = [(wiki, t) for t in set(titles.values()) - seen]
+                conn.executemany("DELETE FROM tiddlers_fts WHERE rowid = "
+                                 "(SELECT id FROM tiddlers WHERE path = ? AND title = ?)", gone)
+                conn.executemany("DELETE FROM tiddlers WHERE path = ? AND title = ?", gone)
+                conn.execute("INSERT OR REPLACE INTO wiki_files(path, mtime_ns, size) VALUES (?, ?, ?)",
+                             (wiki, st.st_mtime_ns, st.st_size))
+            return written + len(gone)
+        finally:
+            conn.close()
+
+    def purge(self, keep=None):
+        """Drop the tiddlers of every wiki except ``keep``."""
+        conn = connect_sqlite(self.path)
+        try:
+            if conn.execute("SELECT 1 FROM wiki_files WHERE path IS NOT ? LIMIT 1", (keep,)).fetchone() is None:
+                return
+            with conn:
+                conn.execute("DELETE FROM tiddlers_fts WHERE path IS NOT ?", (keep,))
+                conn.execute("DELETE FROM tiddlers WHERE path IS NOT ?", (keep,))
+                conn.execute("DELETE FROM wiki_files WHERE path IS NOT ?", (keep,))
+        finally:
+            conn.close()
+
+    def is_stale(self, wiki):
+        try:
+            st = os.stat(wiki)
+        except OSError:
+            return False
+        known = self._conn().execute("SELECT mtime_ns, size FROM wiki_files WHERE path = ?", (str(wiki),)).fetchone()
+        return known != (st.st_mtime_ns, st.st_size)
+
+    def _conn(self):
+        if self._reader is None:
+            self._reader = connect_sqlite(self.path)
+        return self._reader
+
+    def search(self, wiki, query, limit=8):
+        """Best tiddlers of ``wiki`` for ``query`` as (title, snippet)."""
+        match = fts_query(query)
+        if not match:
+            return []
+        conn = self._conn()
+        hits = {}
+        # Erst Titel und Tags, dann der Text; rank ist bm25 mit Titel > Tags > Text
+        for expr in (f"{{title tags}} : ({match})", match):
+            for rowid, title in conn.execute(
+                    "SELECT rowid, title FROM tiddlers_fts WHERE tiddlers_fts MATCH ? AND path = ? "
+                    "ORDER BY rank LIMIT ?", (expr, str(wiki), limit)):
+                hits.setdefault(rowid, title)
+            if len(hits) >= limit:
+                break
+        words = re.findall(r"\w+", query.lower())
+        results = []
+        for rowid, title in list(hits.items())[:limit]:
+            text = conn.execute("SELECT text FROM tiddlers_fts WHERE rowid = ?", (rowid,)).fetchone()[0]
+            results.append((title, self.snippet(text, words)))
+        return results
+
+    @classmethod
+    def snippet(cls, text, words):
+        """The stretch of ``text`` around the first query word, on one line."""
+        lower = text.lower()
+        pos = min((i for i in (lower.find(w) for w in words) if i >= 0), default=0)
+        start = max(0, pos - cls.SNIPPET_CHARS // 4)
+        part = " ".join(text[start:start + cls.SNIPPET_CHARS].split())
+        return ("…" if start else "") + part + ("…" if start + cls.SNIPPET_CHARS < len(text) else "")
+
+# ---- Omnibox ----
+def omnibox_text(url, title):
+    """Lowercased words of URL (without scheme/www) and title, space-delimited on both ends."""
+    url = re.sub(r"^[a-z]+://(www\.)?", "", url.lower())
+    return " " + " ".join(re.findall(r"\w+", f"{url} {title.lower()}")) + " "
+
+def omnibox_grams(text):
+    """Trigrams of ``text`` plus "^"-keys for the 1- and 2-letter prefixes of every word."""
+    grams = {text[i:i + 3] for i in range(len(text) - 2)}
+    for word in text.split():
+        grams.add("^" + word[:1])
+        grams.add("^" + word[:2])
+    return grams
+
+def frecency(visits, last_visit, now):
+    """Visit count weighted by recency buckets, like Firefox' frecency."""
+    age_days = (now - last_visit) / 86400
+    weight = 100 if age_days < 4 else 70 if age_days < 14 else 50 if age_days < 31 else 30 if age_days < 90 else 10
+    return visits * weight
+
+class OmniboxIndex:
+    """In-memory completion index over history, favorites and open tabs.
+
+    Every entry is indexed by its trigrams (and word prefixes for one- or
+    two-letter input). A query with a short posting list checks just those
+    candidates; a common query walks the entries in frecency order and
+    stops after enough hits. Entries are added and updated in place as
+    pages are visited – nothing is re-read from the database per keystroke.
+    """
+    DIRECT_CANDIDATES = 4000  # längere Posting-Listen → Frecency-Reihenfolge durchlaufen
+    RESORT_AFTER = 5000       # so viele geänderte Einträge, dann wird neu sortiert
+    FAVORITE_BONUS = 1000
+    OPEN_TAB_BONUS = 300
 
-    def set_favicon(self, icon: QIcon):
-        if icon and not icon.isNull():
-            self.favicon.setPixmap(icon.pixmap(QSize(16, 16)))
+    def __init__(self):
+        self.urls = []
+        self.titles = []
+        self.texts = []
+        self.visits = []
+        self.last_visit = []
+        self.favorites = set()
+        self._ids = {}        # url → id
+        self._grams = {}      # gram → array('I') der Einträge
+        self._order = []      # ids nach Frecency absteigend, Stand der letzten Sortierung
+        self._changed = set() # seitdem geänderte/neue ids
+
+    def __len__(self):
+        return len(self.urls)
+
+    def _index(self, entry_id, grams):
+        for gram in grams:
+            postings = self._grams.get(gram)
+            if postings is None:
+                self._grams[gram] = array("I", (entry_id,))
+            else:
+                postings.append(entry_id)
+
+    def add(self, url, title="", visits=0, last_visit=0.0):
+        """Adds a page or updates it: visits accumulate, title and last visit follow the newest data."""
+        entry_id = self._ids.get(url)
+        if entry_id is None:
+            entry_id = len(self.urls)
+            self._ids[url] = entry_id
+            self.urls.append(url)
+            self.titles.append(title)
+            self.texts.append(omnibox_text(url, title))
+            self.visits.append(visits)
+            self.last_visit.append(last_visit)
+            self._index(entry_id, omnibox_grams(self.texts[entry_id]))
         else:
-            self._set_default_icon()
+            self.visits[entry_id] += visits
+            self.last_visit[entry_id] = max(self.last_visit[entry_id], last_visit)
+            if title and title != self.titles[entry_id]:
+                self.set_title(url, title)
+        self._changed.add(entry_id)
+        return entry_id
+
+    def visit(self, url, when=None):
+        self.add(url, visits=1, last_visit=time.time() if when is None else when)
+
+    def set_title(self, url, title):
+        entry_id = self._ids.get(url)
+        if entry_id is None or not title or self.titles[entry_id] == title:
+            return
+        old = omnibox_grams(self.texts[entry_id])
+        self.titles[entry_id] = title
+        self.texts[entry_id] = omnibox_text(url, title)
+        # Alte Grams bleiben stehen; die Textprüfung beim Suchen filtert sie aus
+        self._index(entry_id, omnibox_grams(self.texts[entry_id]) - old)
+
+    def set_favorites(self, sites):
+        self.favorites = {self.add(site["url"], site.get("name", "")) for site in sites or ()}
 
-    def set_active(self, active):
-        self._active = active
-        self._update_style()
+    def merge(self, other):
+        """Takes over the entries of ``other``; counts keep the larger value, not the sum."""
+        for i, url in enumerate(other.urls):
+            entry_id = self.add(url, other.titles[i])
+            self.visits[entry_id] = max(self.visits[entry_id], other.visits[i])
+            self.last_visit[entry_id] = max(self.last_visit[entry_id], other.last_visit[i])
+        self.favorites |= {self._ids[other.urls[i]] for i in other.favorites}
 
-    def set_label(self, text):
-        self.label.setText(text[:28])
+    def score(self, entry_id, now, open_ids=()):
+        score = frecency(self.visits[entry_id], self.last_visit[entry_id], now)
+        if entry_id in self.favorites:
+            score += self.FAVORITE_BONUS
+        if entry_id in open_ids:
+            score += self.OPEN_TAB_BONUS
+        return score
 
-    def _update_style(self):
-        if self._active:
-            self.setStyleSheet("""
-                background-color: #2a1f3d;
-                color: #e8d0f8;
-            """)
+    def sort(self, now=None):
+        """Re-sorts all entries by frecency; done once off-thread after loading, then every RESORT_AFTER changes."""
+        now = time.time() if now is None else now
+        scores = [self.score(i, now) for i in range(len(self.urls))]
+        self._order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        self._changed.clear()
+
+    def search(self, query, limit=8, open_urls=(), now=None):
+        """Top ``limit`` entries for ``query`` as (url, title, is_open_tab, is_favorite)."""
+        q = " ".join(re.findall(r"\w+", query.lower()))
+        if not q:
+            return []
+        now = time.time() if now is None else now
+        if len(q) < 3:
+            needle, keys = " " + q, ("^" + q,)
         else:
-            self.setStyleSheet("""
-                background-color: #0a0a14;
-                color: #6a5080;
-            """)
-
-    def set_collapsed(self, collapsed):
-        if collapsed:
-            self.label.hide()
-            self.close_btn.hide()
-            # Gleichmäßiger Abstand links und rechts um die favicon_box
-            self._layout.setContentsMargins(10, 0, 10, 0)
-            self._layout.setSpacing(0)
+            needle, keys = q, {q[i:i + 3] for i in range(len(q) - 2)}
+        postings = [self._grams.get(k, ()) for k in keys]
+        smallest = min(postings, key=len)
+        if not smallest:
+            return []
+        texts = self.texts
+        open_ids = {self._ids[u] for u in open_urls if u in self._ids}
+        if len(smallest) <= self.DIRECT_CANDIDATES:
+            hits = {i for i in smallest if needle in texts[i]}
         else:
-            self._layout.setContentsMargins(8, 0, 6, 0)
-            self._layout.setSpacing(8)
-            self.label.show()
-            self.close_btn.show()
+            if len(self._changed) > self.RESORT_AFTER:
+                self.sort(now)
+            hits = {i for i in chain(self._changed, self.favorites, open_ids) if needle in texts[i]}
+            # Vorne in der Frecency-Reihenfolge finden sich bei häufigen Treffern schnell genug
+            wanted = limit * 4
+            for i in self._order:
+                if needle in texts[i]:
+                    hits.add(i)
+                    wanted -= 1
+                    if not wanted:
+                        break
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.on_click()
+        def ranked(i):
+            score = self.score(i, now, open_ids)
+            # Eingabe trifft den Anfang der Adresse → nach vorn
+            return score * 2 + 1 if texts[i].startswith(" " + q) else score
+        return [(self.urls[i], self.titles[i], i in open_ids, i in self.favorites)
+                for i in nlargest(limit, hits, key=ranked)]
+
+# ---- Theme ----
+# Eine Stylesheet für die ganze App. Zustände laufen über dynamische
+# Properties (collapsed), damit Hover & Co. nur umschalten statt neu zu parsen.
+VOID_THEME = """
+    QMainWindow, QMainWindow QWidget { background-color:#080810; color:#c8a8e8; }
+
+    QScrollBar:vertical { background:#0a0a14; width:6px; }
+    QScrollBar::handle:vertical { background:#3d2a5a; border-radius:3px; }
+    QScrollBar::handle:vertical:hover { background:#7a4aaa; }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height:0px; }
+    QTabBar::tab { background:#0d0d1a; color:#6a5080; padding:6px; }
+    QTabBar::tab:selected { background:#12101e; color:#c8a8e8; }
+
+    QWidget#sidebar { background-color:#0a0a14; border-right:1px solid #2a1f3d; }
+    QListView#tabList { border:none; background:#0a0a14; }
+
+    QPushButton#newTabButton {
+        background-color:#0a0a14; color:#5a3a7a; border:none;
+        border-bottom:1px solid #1a1020; font-size:12px;
+        text-align:left; padding-left:14px;
+    }
+    QPushButton#newTabButton[collapsed="true"] { font-size:16px; text-align:center; padding:0; }
+    QPushButton#newTabButton:hover { background-color:#12101e; color:#c8a8e8; }
+
+    QListView#omniboxPopup {
+        background:#12101e; color:#c8a8e8; border:1px solid #2a1f3d; font-size:13px;
+        selection-background-color:#2a1f3d; selection-color:#e8d0f8;
+    }
+
+    QWidget#historyViewer, QWidget#taskManager { background-color:#080810; color:#c8a8e8; }
+    QWidget#historyViewer QLineEdit {
+        background:#12101e; color:#e8d0f8; border:1px solid #2a1f3d;
+        border-radius:4px; padding:4px 10px; font-size:13px;
+    }
+    QWidget#historyViewer QTableView, QWidget#taskManager QTableView {
+        background:#0a0a14; color:#c8a8e8; border:none;
+        selection-background-color:#2a1f3d; selection-color:#e8d0f8;
+    }
+    QWidget#historyViewer QHeaderView::section, QWidget#taskManager QHeaderView::section {
+        background:#0d0d1a; color:#6a5080; border:none; padding:4px 6px;
+    }
+    QWidget#taskManager QPushButton {
+        background:#12101e; color:#c8a8e8; border:1px solid #2a1f3d;
+        border-radius:4px; padding:4px 12px;
+    }
+    QWidget#taskManager QPushButton:hover { background:#2a1f3d; color:#e8d0f8; }
+"""
+
+def set_style_state(widget, name, value):
+    """Flip a theme property and repolish only this widget; no-op if unchanged."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
 
 # ---- Main Browser ----
 class Browser(QMainWindow):
+    omniboxLoaded = Signal(object)
+    filtersLoaded = Signal(int, object)   # Generation, FilterSnapshot
+    cosmeticLoaded = Signal(int, object)  # Generation, CosmeticFilter
+
     def __init__(self, title="Void"):
         super().__init__()
         self.setWindowTitle(title)
         self.resize(1400, 860)
         self.setMinimumSize(600, 400)
 
-        self.settings_data = load_settings()
+        self.settings_data = SettingsStore(SETTINGS_FILE, self)
+        self.settings_data.changed.connect(self._on_setting_changed)
+        STARTUP.mark("settings")
 
         icon_path = Path(__file__).parent / "assets" / "void_logo.jpg"
         self.setWindowIcon(QIcon(str(icon_path)))
 
-        self.startpage_path = Path(__file__).parent / "startpage" / "index.html"
-        self.home_url = QUrl.fromLocalFile(str(self.startpage_path))
+        self.home_url = QUrl("void://start/")
 
         self.setWindowFlag(Qt.FramelessWindowHint)
-        self.setStyleSheet("background-color: #080810; color: #c8a8e8;")
+        QApplication.instance().setStyleSheet(VOID_THEME)
 
         self._resizing = False
         self._resize_edge = None
         self._resize_start_pos = None
         self._resize_start_geom = None
+        self._hover_edge = None
         self.setMouseTracking(True)
+        # Maus-Events kommen schneller als Frames: höchstens eine Geometrie pro Frame
+        self._pending_geometry = None
+        self._pending_pos = None
+        self._geometry_timer = QTimer(self)
+        self._geometry_timer.setSingleShot(True)
+        self._geometry_timer.timeout.connect(self._apply_pending_geometry)
+        self._rubber_band = None
+        self._drag = None
+        self.drag_stats = deque(maxlen=20)
 
-        self._tabs = []
-        self._entries = []
-        self._current = -1
+        self._tabs = {}
+        self._current_id = None
+        self._next_tab_id = 0
+        self._pending_restore = {}
+        # Nicht mitten in einer Tab-Änderung verdichten: erst, wenn die Ereignisschleife wieder dran ist
+        self.session = SessionJournal(SESSION_FILE, on_full=lambda: QTimer.singleShot(0, self, self._compact_session))
+        self.history = HistoryStore(HISTORY_DB)
+        self._history_viewer = None
+        self.omnibox = OmniboxIndex()
+        self.omnibox.set_favorites(self.settings_data["sites"])
+        self.omniboxLoaded.connect(self._on_omnibox_loaded)
+        self._load_omnibox()
+        self.wiki_index = WikiIndex(WIKI_INDEX_DB)
+        self._refresh_wiki_index()
 
         # Tracker
         self.tracker = SimpleTrackerBlocker()
         self.tracker.enabled = self.settings_data.get("tracker", True)
+        self.tracker.lite.load(self.settings_data.get("lite_rules", {}))
+        self._filter_generation = 0
+        self._filter_compile_lock = threading.Lock()
+        self.filtersLoaded.connect(self._install_filter_snapshot)
+        self.load_filter_lists()
+        self._metrics_timer = QTimer(self)
+        self._metrics_timer.timeout.connect(self.dump_interceptor_stats)
+        self.apply_metrics_dump(self.settings_data.get("metrics_dump_interval", 0))
 
         # Profile
         self.profile = QWebEngineProfile("void", self)
         self.profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
         self.profile.setPersistentCookiesPolicy(QWebEngineProfile.ForcePersistentCookies)
+        if "VOID_DATA_DIR" in os.environ:
+            self.profile.setPersistentStoragePath(str(DATA_DIR / "profile"))
+            self.profile.setCachePath(str(DATA_DIR / "cache"))
         self.profile.setUrlRequestInterceptor(self.tracker)
+        self.cosmetic = None
+        self._cosmetic_generation = 0
+        self._cosmetic_compile_lock = threading.Lock()
+        self.cosmeticLoaded.connect(self._install_cosmetic_filter)
+        self.load_cosmetic_filters()
         self.profile.downloadRequested.connect(self.handle_download)
+        self.favicons = FaviconCache(FAVICON_DIR)
+        self.scheme_handler = VoidSchemeHandler(self)
+        self.profile.installUrlSchemeHandler(b"void", self.scheme_handler)
+        self.archive = OfflineArchive(self, ARCHIVE_DIR)
+        if self.settings_data["sites"] is None:
+            self._migrate_start_page_sites()
+        self.lifecycle = TabLifecycleScheduler(self)
+        self.renderer_monitor = RendererMonitor(self)
+        self.speculation = SpeculativeLoader(self)
+        self.spares = SpareTabPool(self)
+        self._task_manager = None
+        STARTUP.mark("profile")
 
         # WebChannel
         self.channel = QWebChannel()
         self.bridge = BrowserBridge(self)
         self.channel.registerObject("bridge", self.bridge)
         self._inject_webchannel_js()
+        STARTUP.mark("channel")
 
         # ===== LAYOUT: Sidebar floating über Stack =====
-        self._container = QWidget()
-        self._container.setStyleSheet("background: #080810;")
+        self._container = SidebarHost()
         container_layout = QHBoxLayout(self._container)
         container_layout.setContentsMargins(0, 0, 0, 0)
         container_layout.setSpacing(0)
@@ -300,11 +3423,9 @@ class Browser(QMainWindow):
         # Sidebar
         sidebar_width = self.settings_data.get("sidebar_width", 220)
         self._sidebar = QWidget(self._container)
+        self._sidebar.setObjectName("sidebar")
+        self._sidebar.setAttribute(Qt.WA_StyledBackground, True)
         self._sidebar.setFixedWidth(sidebar_width)
-        self._sidebar.setStyleSheet("""
-            background-color: #0a0a14;
-            border-right: 1px solid #2a1f3d;
-        """)
         self._sidebar.raise_()
         sidebar_layout = QVBoxLayout(self._sidebar)
         sidebar_layout.setContentsMargins(0, 0, 0, 0)
@@ -312,34 +3433,39 @@ class Browser(QMainWindow):
 
         self._new_tab_btn = QPushButton("＋  Neuer Tab")
         new_tab_btn = self._new_tab_btn
+        new_tab_btn.setObjectName("newTabButton")
         new_tab_btn.setFixedHeight(36)
-        new_tab_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0a0a14; color: #5a3a7a; border: none;
-                border-bottom: 1px solid #1a1020; font-size: 12px;
-                text-align: left; padding-left: 14px;
-            }
-            QPushButton:hover { background-color: #12101e; color: #c8a8e8; }
-        """)
         new_tab_btn.clicked.connect(lambda: self.add_tab())
         sidebar_layout.addWidget(new_tab_btn)
 
-        self._tab_list_widget = QWidget()
-        self._tab_list_layout = QVBoxLayout(self._tab_list_widget)
-        self._tab_list_layout.setContentsMargins(0, 0, 0, 0)
-        self._tab_list_layout.setSpacing(1)
-        self._tab_list_layout.addStretch()
-
-        scroll = QScrollArea()
-        scroll.setWidget(self._tab_list_widget)
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { border: none; background: #0a0a14; }")
-        sidebar_layout.addWidget(scroll)
+        self._tab_model = TabListModel(self)
+        self._tab_delegate = TabDelegate(self)
+        self._tab_delegate.closeRequested.connect(lambda tab_id: self.close_tab(self._tab_model.row_of(tab_id)))
+        self._tab_view = QListView()
+        self._tab_view.setModel(self._tab_model)
+        self._tab_view.setItemDelegate(self._tab_delegate)
+        self._tab_view.setUniformItemSizes(True)
+        self._tab_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self._tab_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._tab_view.setFocusPolicy(Qt.NoFocus)
+        self._tab_view.setMouseTracking(True)
+        self._tab_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._tab_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._tab_view.viewport().setCursor(Qt.PointingHandCursor)
+        self._tab_view.setObjectName("tabList")
+        self._tab_view.clicked.connect(lambda idx: self.switch_tab(idx.row()))
+        sidebar_layout.addWidget(self._tab_view)
 
         self._stack = QStackedWidget()
+        # Im Overlay-Modus hält der Platzhalter den eingeklappten Streifen frei
+        self._sidebar_reserve = QWidget()
+        self._sidebar_reserve.hide()
+        container_layout.addWidget(self._sidebar_reserve)
         container_layout.addWidget(self._sidebar)
         container_layout.addWidget(self._stack)
+        self._container.sidebar = self._sidebar
+        self.sidebar_frames = FrameTimeRecorder(self._sidebar)
+        self._anim = self._anim2 = None
 
         # ===== TOOLBAR =====
         self.toolbar_widget = QWidget()
@@ -361,6 +3487,12 @@ class Browser(QMainWindow):
         tlayout.addWidget(nav_button(QStyle.SP_ArrowBack,     lambda: self.current_tab().back(),    "Zurück"))
         tlayout.addWidget(nav_button(QStyle.SP_ArrowForward,  lambda: self.current_tab().forward(), "Vorwärts"))
         tlayout.addWidget(nav_button(QStyle.SP_BrowserReload, lambda: self.current_tab().reload(),  "Neu laden"))
+        tlayout.addWidget(nav_button(QStyle.SP_FileDialogDetailedView, self.show_history, "Verlauf (Strg+H)"))
+        QShortcut(QKeySequence("Ctrl+H"), self, self.show_history)
+        QShortcut(QKeySequence("Shift+Esc"), self, self.show_task_manager)
+        QShortcut(QKeySequence("Ctrl+T"), self, lambda: self.add_tab())
+        QShortcut(QKeySequence("Ctrl+Shift+A"), self, self.toggle_archive_pin)
+        QShortcut(QKeySequence("Ctrl+Shift+L"), self, self.toggle_lite_mode)
 
         self.urlbar = QLineEdit()
         self.urlbar.returnPressed.connect(self.navigate_to_url)
@@ -372,6 +3504,18 @@ class Browser(QMainWindow):
         """)
         tlayout.addWidget(self.urlbar)
 
+        # Vorschläge aus dem OmniboxIndex; UserRole trägt die URL, angezeigt wird Titel + URL
+        self._omni_model = QStandardItemModel(self)
+        self._completer = QCompleter(self._omni_model, self)
+        self._completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self._completer.setCompletionRole(Qt.UserRole)
+        self._completer.setMaxVisibleItems(8)
+        self._completer.popup().setObjectName("omniboxPopup")
+        self._completer.activated[str].connect(self._on_completion_activated)
+        self._completion_taken = False
+        self.urlbar.setCompleter(self._completer)
+        self.urlbar.textEdited.connect(self._update_completions)
+
         title_label = QLabel(title)
         title_label.setFont(QFont("Segoe UI", 9))
         title_label.setStyleSheet("color:#3d2a5a; padding:0 6px;")
@@ -395,6 +3539,7 @@ class Browser(QMainWindow):
 
         self.toolbar_widget.mousePressEvent = self._titlebar_mouse_press
         self.toolbar_widget.mouseMoveEvent  = self._titlebar_mouse_move
+        self.toolbar_widget.mouseReleaseEvent = self._titlebar_mouse_release
         self._drag_pos = None
 
         # Statusbar
@@ -408,34 +3553,280 @@ class Browser(QMainWindow):
         # Apply auto-collapse setting
         self._auto_collapse = False
         self._sidebar_expanded = True
+        self._sidebar_overlay = False
+        self.apply_sidebar_overlay(self.settings_data.get("sidebar_overlay", True))
         if self.settings_data.get("auto_collapse", True):
             self.apply_auto_collapse(True)
+        STARTUP.mark("widgets")
+
+        self.restore_session()
+        STARTUP.mark("session_restored")
+        self.spares.schedule_refill()
+
+    # ---- Filter lists ----
+    def load_filter_lists(self):
+        """Map the compiled snapshot; recompile in the background only if a source changed.
+
+        Every call starts a new generation. Compiles run one at a time
+        (they share FILTER_SNAPSHOT's temp file), a compile whose
+        generation is already outdated is skipped, and only the result of
+        the current generation is installed.
+        """
+        self._filter_generation += 1
+        generation = self._filter_generation
+        sources = [resolve_user_path(p) for p in self.settings_data.get("filter_lists", [])]
+        matcher = self.tracker.matcher
+        if not sources:
+            matcher.set_snapshot(None)
+            return
+        snapshot = FilterSnapshot.open_if_fresh(FILTER_SNAPSHOT, sources)
+        if snapshot is not None:
+            matcher.set_snapshot(snapshot)
+            return
+        def compile_snapshot():
+            with self._filter_compile_lock:
+                if generation != self._filter_generation:
+                    return
+                try:
+                    snapshot = FilterSnapshot.compile(FILTER_SNAPSHOT, sources)
+                except OSError as e:
+                    print(f"Filterlisten konnten nicht kompiliert werden: {e}", file=sys.stderr)
+                    return
+            self.filtersLoaded.emit(generation, snapshot)
+        threading.Thread(target=compile_snapshot, name="filter-compile", daemon=True).start()
+
+    def _install_filter_snapshot(self, generation, snapshot):
+        # Im UI-Thread, damit kein Ergebnis einer überholten Generation mehr durchrutscht
+        if generation == self._filter_generation:
+            self.tracker.matcher.set_snapshot(snapshot)
+
+    def load_cosmetic_filters(self):
+        """Use the compiled element-hiding rules if fresh; otherwise compile them in the background.
+
+        Generations work as in load_filter_lists(): one compile at a time,
+        and only the newest result is applied.
+        """
+        self._cosmetic_generation += 1
+        generation = self._cosmetic_generation
+        sources = [resolve_user_path(p) for p in self.settings_data.get("filter_lists", [])]
+        if not sources or not self.settings_data.get("cosmetic_filtering", True):
+            self.apply_cosmetic_filter(None)
+            return
+        cosmetic = CosmeticFilter.open_if_fresh(COSMETIC_SNAPSHOT, sources)
+        if cosmetic is not None:
+            self.apply_cosmetic_filter(cosmetic)
+            return
+        def compile_cosmetic():
+            with self._cosmetic_compile_lock:
+                if generation != self._cosmetic_generation:
+                    return
+                try:
+                    cosmetic = CosmeticFilter.compile(COSMETIC_SNAPSHOT, sources)
+                except OSError as e:
+                    print(f"Element-Filter konnten nicht kompiliert werden: {e}", file=sys.stderr)
+                    return
+            self.cosmeticLoaded.emit(generation, cosmetic)
+        threading.Thread(target=compile_cosmetic, name="cosmetic-compile", daemon=True).start()
+
+    def _install_cosmetic_filter(self, generation, cosmetic):
+        if generation == self._cosmetic_generation:
+            self.apply_cosmetic_filter(cosmetic)
+
+    def apply_cosmetic_filter(self, cosmetic):
+        """Swap the generic stylesheet script; host deltas follow with each navigation."""
+        self.cosmetic = cosmetic
+        scripts = self.profile.scripts()
+        for old in scripts.find("void-cosmetic-generic"):
+            scripts.remove(old)
+        if cosmetic is None or not cosmetic.generic_css:
+            return
+        script = QWebEngineScript()
+        script.setName("void-cosmetic-generic")
+        # Nur Webseiten – Startseite und lokale Dateien bleiben unangetastet
+        script.setSourceCode("// ==UserScript==\n// @include http://*\n// @include https://*\n// ==/UserScript==\n"
+                             + COSMETIC_JS % (json.dumps(cosmetic.generic_css), json.dumps("generic"), "{}"))
+        script.setInjectionPoint(QWebEngineScript.DocumentCreation)
+        script.setWorldId(QWebEngineScript.ApplicationWorld)
+        script.setRunsOnSubFrames(True)
+        scripts.insert(script)
+
+    def apply_cosmetic_delta(self, page, url):
+        """Give ``page`` the element-hiding delta for ``url``'s host before its document exists."""
+        scripts = page.scripts()
+        for old in scripts.find("void-cosmetic-host"):
+            scripts.remove(old)
+        if self.cosmetic is None or url.scheme() not in ("http", "https") or not url.host():
+            return
+        css, overrides = self.cosmetic.delta_for_host(url.host().lower())
+        if not css and not overrides:
+            return
+        script = QWebEngineScript()
+        script.setName("void-cosmetic-host")
+        script.setSourceCode(COSMETIC_JS % (json.dumps(css), json.dumps("host"), json.dumps(overrides)))
+        script.setInjectionPoint(QWebEngineScript.DocumentCreation)
+        script.setWorldId(QWebEngineScript.ApplicationWorld)
+        script.setRunsOnSubFrames(False)
+        scripts.insert(script)
+
+    # ---- Interceptor metrics ----
+    def interceptor_stats(self):
+        stats = self.tracker.metrics.snapshot()
+        # Zähler der Seite selbst; ein verworfener Tab beginnt mit neuer Seite wieder bei null
+        stats["tabs"] = [
+            {"title": tab.title(), "host": tab.url().host(),
+             "blocked": tab.page().blocked if isinstance(tab.page(), BrowserPage) else 0}
+            for tab in self.live_tabs()
+        ]
+        stats["speculation"] = self.speculation.snapshot()
+        stats["archive"] = self.archive.snapshot()
+        stats["lite"] = self.tracker.lite.snapshot()
+        stats["cosmetic"] = self.cosmetic.snapshot() if self.cosmetic is not None else None
+        return stats
 
-        self.add_tab(self.home_url, "Start")
+    def apply_metrics_dump(self, interval):
+        """Periodically write interceptor stats as JSON; 0 disables the dump."""
+        if interval and interval > 0:
+            self._metrics_timer.start(int(interval * 1000))
+        else:
+            self._metrics_timer.stop()
+
+    def dump_interceptor_stats(self):
+        try:
+            METRICS_DUMP_FILE.write_text(json.dumps(self.interceptor_stats(), indent=2))
+        except OSError as e:
+            print(f"Statistik konnte nicht geschrieben werden: {e}", file=sys.stderr)
+
+    def _migrate_start_page_sites(self):
+        """Übernimmt die Favoriten aus dem localStorage der früheren file://-Startseite.
+
+        Die Startseite läuft jetzt unter void://start und hat damit einen
+        anderen Origin; ihre Favoriten liegen deshalb in settings.json.
+        """
+        page = QWebEnginePage(self.profile, self)
+
+        def store(raw):
+            sites = None
+            try:
+                sites = json.loads(raw).get("sites") if raw else None
+            except (ValueError, AttributeError):
+                pass
+            if isinstance(sites, list):
+                for site in sites:
+                    # Relative Einträge bezogen sich auf startpage/index.html
+                    if isinstance(site, dict) and str(site.get("url", "")).startswith("."):
+                        site["url"] = (STARTPAGE_DIR / site["url"]).resolve().as_uri()
+                sites = BrowserBridge._clean_settings({"sites": sites})["sites"]
+            self.settings_data.set("sites", sites or DEFAULT_SITES)
+            page.deleteLater()
+
+        page.loadFinished.connect(
+            lambda ok: page.runJavaScript("localStorage.getItem('voidSettings')", 0, store))
+        page.setHtml("", QUrl.fromLocalFile(str(STARTPAGE_DIR / "index.html")))
 
     # ---- WebChannel injection ----
     def _inject_webchannel_js(self):
-        """Inject qwebchannel.js into every page via profile script."""
-        qwc_path = Path(__file__).parent / "startpage" / "qwebchannel.js"
-        # Qt ships qwebchannel.js – copy it out if not present
-        if not qwc_path.exists():
-            from PySide6.QtWebEngineCore import QWebEngineScript
-            # Use the built-in resource
-            src = ":/qtwebchannel/qwebchannel.js"
-            # We'll inject via page instead (see _setup_page_channel)
-        # We set the channel per-page in _setup_page_channel
-
-    def _setup_page_channel(self, page):
-        """Attach QWebChannel to a specific page."""
-        page.setWebChannel(self.channel)
+        """Inject qwebchannel.js plus the TiddlyWiki saver into the ApplicationWorld of file:// pages."""
+        # Qt liefert qwebchannel.js als Ressource mit
+        f = QFile(":/qtwebchannel/qwebchannel.js")
+        if not f.open(QIODevice.ReadOnly):
+            print("qwebchannel.js nicht gefunden – Wiki-Speichern über Void deaktiviert", file=sys.stderr)
+            return
+        script = QWebEngineScript()
+        script.setName("void-wiki-saver")
+        # Der Greasemonkey-Kopf beschränkt das Skript auf file:// – Webseiten parsen qwebchannel.js gar nicht erst
+        script.setSourceCode("// ==UserScript==\n// @include file://*\n// ==/UserScript==\n"
+                             + bytes(f.readAll()).decode() + WIKI_SAVER_JS)
+        script.setInjectionPoint(QWebEngineScript.DocumentReady)
+        script.setWorldId(QWebEngineScript.ApplicationWorld)
+        script.setRunsOnSubFrames(False)
+        self.profile.scripts().insert(script)
+
+    def _setup_page_channel(self, page, url):
+        """Attach the channel ``url`` is trusted with, before its document exists.
+
+        void:// pages get the bridge, local files only their wiki saver (in
+        the ApplicationWorld, invisible to the page's own scripts), and
+        everything else no channel at all – no transport, no setup cost.
+        """
+        if url.scheme() == "void":
+            page.setWebChannel(self.channel)
+        elif url.isLocalFile() and not self.archive.is_snapshot(url):
+            page.setWebChannel(page.wiki_channel(), QWebEngineScript.ApplicationWorld)
+        else:
+            page.setWebChannel(None)
 
     # ---- Apply settings ----
+    def _on_setting_changed(self, key, value):
+        if key == "sidebar_width":
+            self.apply_sidebar_width(value)
+        elif key == "tracker":
+            self.tracker.enabled = value
+        elif key == "auto_collapse":
+            self.apply_auto_collapse(value)
+        elif key == "filter_lists":
+            self.load_filter_lists()
+            self.load_cosmetic_filters()
+        elif key == "cosmetic_filtering":
+            self.load_cosmetic_filters()
+        elif key == "metrics_dump_interval":
+            self.apply_metrics_dump(value)
+        elif key == "sites":
+            self.omnibox.set_favorites(value)
+            self.archive.set_targets()
+        elif key == "archive_pinned":
+            self.archive.set_targets()
+        elif key == "archive_max_mb":
+            self.archive.evict()
+        elif key == "lite_rules":
+            self.tracker.lite.load(value)
+        elif key == "wiki_file":
+            self._refresh_wiki_index()
+        elif key == "spare_tabs":
+            self.spares.refill()
+        elif key == "sidebar_overlay":
+            self.apply_sidebar_overlay(value)
+
     def apply_sidebar_width(self, width):
         if not self._auto_collapse or self._sidebar_expanded:
+            self._set_sidebar_width(width)
+        self._update_sidebar_reserve()
+
+    def _set_sidebar_width(self, width):
+        if self._sidebar_overlay:
+            self._sidebar.resize(width, self._sidebar.height())
+        else:
+            self._sidebar.setFixedWidth(width)
+
+    def _update_sidebar_reserve(self):
+        # Ohne Auto-Collapse bleibt die Sidebar offen und braucht ihren ganzen Platz
+        width = SIDEBAR_COLLAPSED_WIDTH if self._auto_collapse else self.settings_data.get("sidebar_width", 220)
+        self._sidebar_reserve.setFixedWidth(width)
+
+    def apply_sidebar_overlay(self, enabled):
+        """Float the sidebar over the tab stack (True) or lay it out beside it."""
+        if self._anim is not None:
+            self._anim.stop()
+        if self._anim2 is not None:
+            self._anim2.stop()
+        layout = self._container.layout()
+        width = self._sidebar.width()
+        self._sidebar_overlay = self._container.overlay = enabled
+        if enabled:
+            layout.removeWidget(self._sidebar)
+            self._sidebar.setMinimumWidth(0)
+            self._sidebar.setMaximumWidth(16777215)
+            self._update_sidebar_reserve()
+            self._sidebar_reserve.show()
+            self._sidebar.resize(width, self._container.height())
+            self._container.place_sidebar()
+        else:
+            self._sidebar_reserve.hide()
             self._sidebar.setFixedWidth(width)
+            layout.insertWidget(1, self._sidebar)
 
     def apply_auto_collapse(self, enabled):
         self._auto_collapse = enabled
+        self._update_sidebar_reserve()
         if enabled:
             self._sidebar.enterEvent  = self._sidebar_enter
             self._sidebar.leaveEvent  = self._sidebar_leave
@@ -447,6 +3838,22 @@ class Browser(QMainWindow):
             self._expand_sidebar()
 
     def _animate_sidebar(self, target_width):
+        for anim in (self._anim, self._anim2):
+            if anim is not None:
+                anim.stop()
+        self.sidebar_frames.start()
+        if self._sidebar_overlay:
+            # Nur die Sidebar selbst ändert ihre Größe, der Stack darunter bleibt stehen
+            self._anim = QVariantAnimation(self)
+            self._anim.setDuration(220)
+            self._anim.setEasingCurve(QEasingCurve.InOutCubic)
+            self._anim.setStartValue(self._sidebar.width())
+            self._anim.setEndValue(target_width)
+            self._anim.valueChanged.connect(lambda w: self._sidebar.resize(w, self._sidebar.height()))
+            self._anim.finished.connect(self.sidebar_frames.stop)
+            self._anim2 = None
+            self._anim.start()
+            return
         self._anim = QPropertyAnimation(self._sidebar, b"minimumWidth")
         self._anim.setDuration(220)
         self._anim.setEasingCurve(QEasingCurve.InOutCubic)
@@ -458,22 +3865,16 @@ class Browser(QMainWindow):
         self._anim2.setEasingCurve(QEasingCurve.InOutCubic)
         self._anim2.setStartValue(self._sidebar.width())
         self._anim2.setEndValue(target_width)
+        self._anim2.finished.connect(self.sidebar_frames.stop)
         self._anim.start()
         self._anim2.start()
 
     def _collapse_sidebar(self):
         self._sidebar_expanded = False
-        for entry in self._entries:
-            entry.set_collapsed(True)
+        self._tab_delegate.collapsed = True
+        self._tab_view.viewport().update()
         self._new_tab_btn.setText("＋")
-        self._new_tab_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0a0a14; color: #5a3a7a; border: none;
-                border-bottom: 1px solid #1a1020; font-size: 16px;
-                text-align: center; padding: 0;
-            }
-            QPushButton:hover { background-color: #12101e; color: #c8a8e8; }
-        """)
+        set_style_state(self._new_tab_btn, "collapsed", True)
         self._animate_sidebar(SIDEBAR_COLLAPSED_WIDTH)
 
     def _expand_sidebar(self):
@@ -485,17 +3886,10 @@ class Browser(QMainWindow):
         QTimer.singleShot(150, self._show_expanded_content)
 
     def _show_expanded_content(self):
-        for entry in self._entries:
-            entry.set_collapsed(False)
+        self._tab_delegate.collapsed = False
+        self._tab_view.viewport().update()
         self._new_tab_btn.setText("＋  Neuer Tab")
-        self._new_tab_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0a0a14; color: #5a3a7a; border: none;
-                border-bottom: 1px solid #1a1020; font-size: 12px;
-                text-align: left; padding-left: 14px;
-            }
-            QPushButton:hover { background-color: #12101e; color: #c8a8e8; }
-        """)
+        set_style_state(self._new_tab_btn, "collapsed", False)
 
     def _sidebar_enter(self, event):
         self._expand_sidebar()
@@ -504,84 +3898,351 @@ class Browser(QMainWindow):
         self._collapse_sidebar()
 
     # ---- Tab Management ----
-    def add_tab(self, url=None, label="Neuer Tab"):
-        url = url or QUrl(self.home_url)
-        tab = BrowserTab(self.profile, self)
-        self._setup_page_channel(tab.page())
-        tab.setUrl(url)
+    def add_tab(self, url=None, label="Neuer Tab", restore=None, activate=True, blank=False):
+        """Open a tab. With ``restore`` only the sidebar row is created;
+        the BrowserTab is built on first switch_tab. ``blank`` leaves the
+        page empty for createWindow, which loads the target itself."""
+        tab_id = self._next_tab_id
+        self._next_tab_id += 1
 
-        idx = len(self._tabs)
-        self._tabs.append(tab)
-        self._stack.addWidget(tab)
+        if restore is None:
+            self._tab_model.append(tab_id, label)
+            url = url or QUrl(self.home_url)
+            if blank:
+                tab = self.spares.take_blank()
+            elif url == self.home_url:
+                tab = self.spares.take_start()
+            else:
+                tab = self.spares.take_blank()
+            tab = self._attach_tab(tab or self._build_tab(), tab_id)
+            if blank:
+                url = QUrl("about:blank")
+            elif tab.url() == url:
+                # Vorgeladene Startseite: was vor dem Übernehmen kam, nachtragen
+                self._tab_model.set_title(tab_id, tab.title() or label)
+                if not tab.icon().isNull():
+                    self._on_icon_changed(tab, tab.icon())
+            else:
+                tab.setUrl(url)
+            self.session.append("open", tab_id, url=url.toString(), title=label)
+        else:
+            self._pending_restore[tab_id] = restore
+            self._tab_model.append(tab_id, restore.get("title") or label)
+            self._show_cached_favicon(tab_id, QUrl(restore.get("url", "")))
+
+        if activate:
+            self.switch_tab(self._tab_model.row_of(tab_id))
+        return self._tabs.get(tab_id)
 
-        entry = TabEntry(
-            label,
-            on_click=lambda i=idx: self.switch_tab(i),
-            on_close=lambda i=idx: self.close_tab(i),
-        )
-        self._entries.append(entry)
-        insert_pos = self._tab_list_layout.count() - 1
-        self._tab_list_layout.insertWidget(insert_pos, entry)
+    def _create_tab(self, tab_id):
+        return self._attach_tab(self._build_tab(), tab_id)
+
+    def _build_tab(self):
+        """The expensive part of a tab: view and page. Used directly by SpareTabPool."""
+        tab = BrowserTab(self.profile, self)
+        tab.tab_id = None
+        self._stack.addWidget(tab)
+        return tab
 
-        tab.iconChanged.connect(lambda icon, i=idx: self._on_icon_changed(i, icon))
-        tab.titleChanged.connect(lambda t, i=idx: self._on_title_changed(i, t))
-        tab.urlChanged.connect(lambda q, i=idx: self._on_url_changed(i, q))
+    def _attach_tab(self, tab, tab_id):
+        tab.tab_id = tab_id
+        tab.last_active = time.monotonic()
+        self._tabs[tab_id] = tab
+        tab.iconChanged.connect(lambda icon, t=tab: self._on_icon_changed(t, icon))
+        tab.titleChanged.connect(lambda title, t=tab: self._on_title_changed(t, title))
+        tab.urlChanged.connect(lambda q, t=tab: self._on_url_changed(t, q))
+        tab.loadFinished.connect(lambda ok, t=tab: self._on_load_finished(t, ok))
+        tab.page().loadingChanged.connect(lambda info, t=tab: self._on_loading_changed(t, info))
+        tab.page().iconUrlChanged.connect(
+            lambda u, t=tab: self.session.append("update", t.tab_id, icon=u.toString()))
+        return tab
 
-        self.switch_tab(idx)
+    def _materialize(self, tab_id):
+        """Build the BrowserTab for a lazily restored row."""
+        rec = self._pending_restore.pop(tab_id)
+        tab = self._create_tab(tab_id)
+        if rec.get("history"):
+            restore_history(tab.page(), rec["history"])
+        if tab.page().history().count() == 0:
+            tab.setUrl(QUrl(rec.get("url") or self.home_url))
         return tab
 
+    def live_tabs(self):
+        """Tabs that have a BrowserTab, i.e. not waiting for lazy restore."""
+        return list(self._tabs.values())
+
+    def tab_count(self):
+        return self._tab_model.rowCount()
+
+    def current_index(self):
+        return self._tab_model.row_of(self._current_id)
+
+    def restore_session(self):
+        """Recreate the last session's sidebar; only the active tab gets a renderer."""
+        records, active = self.session.load() if self.settings_data.get("restore_session", True) else ([], 0)
+        if not records:
+            self.session.compact([], 0)
+            self.add_tab(self.home_url, "Start")
+            return
+        for rec in records:
+            self.add_tab(label=rec.get("title") or "Neuer Tab", restore=rec, activate=False)
+        self.session.compact(list(zip(self._tab_model.ids(), records)), active)
+        self.switch_tab(active)
+
+    def _compact_session(self):
+        if self.tab_count():
+            records = [(tab_id, self._session_record(tab_id)) for tab_id in self._tab_model.ids()]
+            self.session.compact(records, max(0, self.current_index()))
+
+    def _session_record(self, tab_id):
+        tab = self._tabs.get(tab_id)
+        if tab is None:
+            return self._pending_restore[tab_id]
+        return {"url": tab.url().toString(), "title": tab.title(),
+                "icon": tab.page().iconUrl().toString(), "history": serialize_history(tab.page())}
+
     def switch_tab(self, index):
-        if index < 0 or index >= len(self._tabs): return
-        if 0 <= self._current < len(self._entries):
-            self._entries[self._current].set_active(False)
-        self._current = index
-        self._entries[index].set_active(True)
-        self._stack.setCurrentWidget(self._tabs[index])
-        self.urlbar.setText(self._tabs[index].url().toString())
+        tab_id = self._tab_model.id_at(index)
+        if tab_id is None: return
+        previous = self.current_tab()
+        if previous is not None:
+            previous.last_active = time.monotonic()
+        self._current_id = tab_id
+        tab = self._tabs.get(tab_id) or self._materialize(tab_id)
+        tab.last_active = time.monotonic()
+        # Eingefrorene oder verworfene Tabs wieder aktivieren (verworfene laden neu)
+        if tab.page().lifecycleState() != QWebEnginePage.LifecycleState.Active:
+            tab.page().setLifecycleState(QWebEnginePage.LifecycleState.Active)
+        self._tab_model.set_active(tab_id)
+        self._tab_view.scrollTo(self._tab_model.index(index))
+        self._stack.setCurrentWidget(tab)
+        self.urlbar.setText(tab.url().toString())
+        self.session.append("active", tab_id)
 
     def close_tab(self, index):
-        if len(self._tabs) <= 1: return
-        tab   = self._tabs.pop(index)
-        entry = self._entries.pop(index)
-        self._stack.removeWidget(tab)
-        tab.setPage(QWebEnginePage())
-        tab.deleteLater()
-        entry.setParent(None)
-        entry.deleteLater()
-        self._rewire_entries()
-        self._current = -1
-        self.switch_tab(min(index, len(self._tabs) - 1))
-
-    def _rewire_entries(self):
-        for i, entry in enumerate(self._entries):
-            entry.on_click = lambda idx=i: self.switch_tab(idx)
-            close_btn = entry.findChildren(QPushButton)[0]
-            try: close_btn.clicked.disconnect()
-            except RuntimeError: pass
-            close_btn.clicked.connect(lambda _, idx=i: self.close_tab(idx))
+        tab_id = self._tab_model.id_at(index)
+        if tab_id is None or self.tab_count() <= 1: return
+        self._tab_model.remove(tab_id)
+        tab = self._tabs.pop(tab_id, None)
+        if tab is None:
+            self._pending_restore.pop(tab_id, None)
+        else:
+            self._stack.removeWidget(tab)
+            tab.setPage(QWebEnginePage())
+            tab.deleteLater()
+        self.session.append("close", tab_id)
+        if tab_id == self._current_id:
+            self._current_id = None
+            self.switch_tab(min(index, self.tab_count() - 1))
 
     def current_tab(self):
-        if 0 <= self._current < len(self._tabs):
-            return self._tabs[self._current]
-        return None
+        return self._tabs.get(self._current_id)
 
-    def _on_icon_changed(self, index, icon):
-        if index < len(self._entries):
-            self._entries[index].set_favicon(icon)
+    def _show_cached_favicon(self, tab_id, qurl):
+        cached = self.favicons.icon(qurl.host())
+        if cached is not None:
+            self._tab_model.set_icon(tab_id, cached)
+
+    def _on_icon_changed(self, tab, icon):
+        if tab.tab_id not in self._tabs:
+            return
+        if icon.isNull():
+            # Beim Navigieren setzt Qt das Icon zurück – Cache überbrückt bis zum neuen
+            self._show_cached_favicon(tab.tab_id, tab.url())
+            return
+        self._tab_model.set_icon(tab.tab_id, self.favicons.put(tab.url().host(), icon))
 
-    def _on_title_changed(self, index, title):
-        if index < len(self._entries):
-            self._entries[index].set_label(title or "Neuer Tab")
+    def _on_title_changed(self, tab, title):
+        if tab.tab_id in self._tabs:
+            self._tab_model.set_title(tab.tab_id, title or "Neuer Tab")
+            self.session.append("update", tab.tab_id, title=title)
+            self.history.set_title(tab.url().toString(), title)
+            self.omnibox.set_title(tab.url().toString(), title)
 
-    def _on_url_changed(self, index, qurl):
-        if index == self._current:
+    def _on_url_changed(self, tab, qurl):
+        if tab is self.current_tab():
             self.urlbar.setText(qurl.toString())
+        self._show_cached_favicon(tab.tab_id, qurl)
+        self._record_visit(tab, qurl)
+        self.session.append("update", tab.tab_id, url=qurl.toString())
+
+    def _on_load_finished(self, tab, ok):
+        if STARTUP.enabled and "first_load_finished" not in STARTUP.marks:
+            STARTUP.mark("first_load_finished")
+            STARTUP.watch_first_paint(tab.page())
+        if ok and tab.tab_id in self._tabs:
+            self.session.append("update", tab.tab_id, history=serialize_history(tab.page()))
+            self.history.set_title(tab.url().toString(), tab.title())
+        self.archive.loaded(tab.page(), ok)
+
+    def _on_loading_changed(self, tab, info):
+        if info.status() != QWebEngineLoadingInfo.LoadFailedStatus:
+            return
+        fallback = self.archive.failed(info)
+        if fallback is not None:
+            self.statusbar.showMessage("Offline – Archivkopie von " + info.url().toString(), 5000)
+            tab.setUrl(fallback)
+
+    def _record_visit(self, tab, qurl):
+        if qurl.scheme() not in ("http", "https", "file") or self.archive.is_snapshot(qurl):
+            return
+        url = qurl.toString()
+        # urlChanged kommt pro Navigation teils mehrfach; der Titel folgt über titleChanged
+        if tab.last_visit_url == url:
+            return
+        tab.last_visit_url = url
+        self.history.visit(url)
+        self.omnibox.visit(url)
+
+    def toggle_archive_pin(self):
+        """Add the current page to the offline archive, or take it out again."""
+        tab = self.current_tab()
+        if tab is None or tab.url().scheme() not in ("http", "https"):
+            return
+        url = url_without_fragment(tab.url())
+        pinned = list(self.settings_data.get("archive_pinned") or ())
+        if url in pinned:
+            pinned.remove(url)
+            self.statusbar.showMessage("Nicht mehr offline verfügbar: " + url, 3000)
+        else:
+            pinned.append(url)
+            self.statusbar.showMessage("Wird offline verfügbar gemacht: " + url, 3000)
+        self.settings_data.set("archive_pinned", pinned)
+        if url in pinned:
+            self.archive.loaded(tab.page(), True)
+
+    def toggle_lite_mode(self):
+        """Switch the current site between LITE_DEFAULT_RULE and no rule, then reload."""
+        tab = self.current_tab()
+        if tab is None or tab.url().scheme() not in ("http", "https"):
+            return
+        host = tab.url().host().lower()
+        rules = dict(self.settings_data.get("lite_rules") or {})
+        domain = host.removeprefix("www.")
+        if any(suffix in rules for suffix in host_suffixes(host)):
+            for suffix in host_suffixes(host):
+                rules.pop(suffix, None)
+            self.statusbar.showMessage("Lite-Modus aus: " + domain, 3000)
+        else:
+            rules[domain] = dict(LITE_DEFAULT_RULE)
+            self.statusbar.showMessage("Lite-Modus an: " + domain, 3000)
+        self.settings_data.set("lite_rules", rules)
+        tab.reload()
+
+    def show_history(self):
+        if self._history_viewer is None:
+            self._history_viewer = HistoryViewer(self.history, self)
+            self._history_viewer.openRequested.connect(lambda url: self.add_tab(url))
+        self._history_viewer.show()
+        self._history_viewer.raise_()
+        self._history_viewer.activateWindow()
+
+    def show_task_manager(self):
+        if self._task_manager is None:
+            self._task_manager = TaskManager(self)
+        self._task_manager.show()
+        self._task_manager.raise_()
+        self._task_manager.activateWindow()
+
+    # ---- Omnibox ----
+    def _load_omnibox(self):
+        """Build the history part of the index off the GUI thread; merged in _on_omnibox_loaded."""
+        history = self.history
+        def build():
+            index = OmniboxIndex()
+            try:
+                for url, title, visits, last_visit in history.pages():
+                    index.add(url, title, visits, last_visit)
+            except sqlite3.Error as e:
+                print(f"Verlauf für Vorschläge nicht lesbar: {e}", file=sys.stderr)
+            index.sort()
+            self.omniboxLoaded.emit(index)
+        threading.Thread(target=build, name="omnibox-index", daemon=True).start()
+
+    def _on_omnibox_loaded(self, index):
+        # Was seit dem Start dazukam, in den geladenen Index übernehmen
+        index.merge(self.omnibox)
+        self.omnibox = index
+
+    def _open_urls(self):
+        urls = {tab.url().toString() for tab in self.live_tabs()}
+        urls.update(rec.get("url") for rec in self._pending_restore.values())
+        return urls
+
+    def wiki_path(self):
+        return resolve_user_path(self.settings_data.get("wiki_file") or "")
+
+    def _refresh_wiki_index(self):
+        wiki = self.wiki_path()
+        self.wiki_index.refresh_async(wiki if wiki.is_file() else None)
+
+    def _wiki_hits(self, query, limit):
+        """(tiddler URL, title, snippet) for a ``wiki:`` query, without loading the wiki."""
+        wiki = self.wiki_path()
+        if self.wiki_index.is_stale(wiki):
+            # Treffer aus dem alten Stand zeigen, der neue kommt beim nächsten Tastendruck
+            self.wiki_index.refresh_async(wiki)
+        base = QUrl.fromLocalFile(str(wiki)).toString()
+        return [(f"{base}#{QUrl.toPercentEncoding(title).data().decode()}", title, snippet)
+                for title, snippet in self.wiki_index.search(wiki, query, limit)]
+
+    def _update_completions(self, text):
+        if text.startswith("wiki:"):
+            return self._show_wiki_completions(text[5:])
+        results = self.omnibox.search(text, self._completer.maxVisibleItems(), self._open_urls())
+        self._omni_model.clear()
+        for url, title, is_open, is_favorite in results:
+            mark = "⇥  " if is_open else "★  " if is_favorite else ""
+            item = QStandardItem(f"{mark}{title}  —  {url}" if title else mark + url)
+            item.setData(url, Qt.UserRole)
+            self._omni_model.appendRow(item)
+        if results:
+            self._completer.complete()
+        else:
+            self._completer.popup().hide()
+
+    def _show_wiki_completions(self, query):
+        self._omni_model.clear()
+        hits = self._wiki_hits(query, self._completer.maxVisibleItems())
+        for url, title, snippet in hits:
+            item = QStandardItem(f"📓  {title}  —  {snippet}" if snippet else f"📓  {title}")
+            item.setData(url, Qt.UserRole)
+            self._omni_model.appendRow(item)
+        if hits:
+            self._completer.complete()
+        else:
+            self._completer.popup().hide()
+
+    def _on_completion_activated(self, url):
+        # Enter löst danach noch returnPressed aus – das gehört zu dieser Auswahl
+        self._completion_taken = True
+        QTimer.singleShot(0, lambda: setattr(self, "_completion_taken", False))
+        current = self.current_tab()
+        for row, tab_id in enumerate(self._tab_model.ids()):
+            tab = self._tabs.get(tab_id)
+            tab_url = tab.url().toString() if tab else self._pending_restore.get(tab_id, {}).get("url")
+            if tab_url == url and tab is not current:
+                self.switch_tab(row)
+                return
+        self.urlbar.setText(url)
+        self._navigate(url)
 
     def navigate_to_url(self):
-        url = self.urlbar.text().strip()
+        if self._completion_taken:
+            return
+        text = self.urlbar.text().strip()
+        if text.startswith("wiki:"):
+            # Bester Treffer, sonst das Wiki selbst
+            hits = self._wiki_hits(text[5:], 1)
+            text = hits[0][0] if hits else QUrl.fromLocalFile(str(self.wiki_path())).toString()
+            self.urlbar.setText(text)
+        self._navigate(text)
+
+    def _navigate(self, url):
+        url = url.strip()
         if not url:
             return
-        if url.startswith("file://"):
+        if url.startswith("file://") or url.startswith("void://"):
             qurl = QUrl(url)
         elif url.startswith("/") or url.startswith("../") or url.startswith("./"):
             # Relativer lokaler Pfad → absolut auflösen
@@ -621,10 +4282,20 @@ class Browser(QMainWindow):
         if event.button() == Qt.LeftButton:
             edge = self._get_resize_edge(event.position().toPoint())
             if edge:
+                outline = self.settings_data.get("resize_outline", False)
+                # Wo der Fenstermanager es kann, macht er das Resize selbst
+                if not outline and self.windowHandle().startSystemResize(RESIZE_EDGES[edge]):
+                    event.accept(); return
                 self._resizing = True
                 self._resize_edge = edge
                 self._resize_start_pos = event.globalPosition().toPoint()
                 self._resize_start_geom = self.geometry()
+                self._begin_drag("resize")
+                if outline:
+                    if self._rubber_band is None:
+                        self._rubber_band = QRubberBand(QRubberBand.Rectangle)
+                    self._rubber_band.setGeometry(self.geometry())
+                    self._rubber_band.show()
                 event.accept(); return
         super().mousePressEvent(event)
 
@@ -633,13 +4304,25 @@ class Browser(QMainWindow):
             self._do_resize(event.globalPosition().toPoint())
             event.accept(); return
         edge = self._get_resize_edge(event.position().toPoint())
-        self.setCursor(QCursor(self._edge_to_cursor(edge) if edge else Qt.ArrowCursor))
+        if edge != self._hover_edge:
+            self._hover_edge = edge
+            self.setCursor(QCursor(self._edge_to_cursor(edge) if edge else Qt.ArrowCursor))
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
         if self._resizing:
             self._resizing = False
             self._resize_edge = None
+            self._geometry_timer.stop()
+            if self._rubber_band is not None and self._rubber_band.isVisible():
+                self._rubber_band.hide()
+                self._pending_geometry = self._rubber_band.geometry()
+            if self._pending_geometry is not None:
+                self.setGeometry(self._pending_geometry)
+                self._drag["updates"] += 1
+                self._pending_geometry = None
+            self._end_drag()
+            self._hover_edge = None
             self.setCursor(QCursor(Qt.ArrowCursor))
             event.accept(); return
         super().mouseReleaseEvent(event)
@@ -652,44 +4335,103 @@ class Browser(QMainWindow):
         if "bottom" in e: g.setBottom(max(g.top()+mh, g.bottom()+d.y()))
         if "left"   in e: g.setLeft(min(g.right()-mw, g.left()+d.x()))
         if "top"    in e: g.setTop(min(g.bottom()-mh, g.top()+d.y()))
-        self.setGeometry(g)
+        self._pending_geometry = g
+        self._schedule_geometry()
 
     def _titlebar_mouse_press(self, event):
         if event.button() == Qt.LeftButton:
+            if self.windowHandle().startSystemMove():
+                return
             self._drag_pos = event.globalPosition().toPoint()
+            self._drag_start_win = self.pos()
+            self._begin_drag("move")
 
     def _titlebar_mouse_move(self, event):
         if self._drag_pos and not self._resizing:
-            self.move(self.pos() + event.globalPosition().toPoint() - self._drag_pos)
-            self._drag_pos = event.globalPosition().toPoint()
+            self._pending_pos = self._drag_start_win + event.globalPosition().toPoint() - self._drag_pos
+            self._schedule_geometry()
+
+    def _titlebar_mouse_release(self, event):
+        if self._drag_pos:
+            self._drag_pos = None
+            self._geometry_timer.stop()
+            self._apply_pending_geometry()
+            self._end_drag()
+
+    def _schedule_geometry(self):
+        if self._drag is not None:
+            self._drag["events"] += 1
+        if not self._geometry_timer.isActive():
+            screen = self.screen()
+            rate = screen.refreshRate() if screen else 60
+            self._geometry_timer.start(max(1, int(1000 / (rate or 60))))
+
+    def _apply_pending_geometry(self):
+        if self._pending_geometry is not None:
+            if self._rubber_band is not None and self._rubber_band.isVisible():
+                # Umriss-Modus: nur das Gummiband folgt, das Fenster erst beim Loslassen
+                self._rubber_band.setGeometry(self._pending_geometry)
+                return
+            self.setGeometry(self._pending_geometry)
+            self._pending_geometry = None
+        elif self._pending_pos is not None:
+            self.move(self._pending_pos)
+            self._pending_pos = None
+        else:
+            return
+        if self._drag is not None:
+            self._drag["updates"] += 1
+
+    # ---- Drag instrumentation ----
+    def _begin_drag(self, kind):
+        self._drag = {"kind": kind, "start": time.perf_counter(), "events": 0, "updates": 0, "relayouts": 0}
+
+    def _end_drag(self):
+        drag, self._drag = self._drag, None
+        if drag is None:
+            return
+        seconds = max(time.perf_counter() - drag.pop("start"), 1e-6)
+        drag["duration_s"] = round(seconds, 3)
+        drag["relayouts_per_s"] = round(drag["relayouts"] / seconds, 1)
+        self.drag_stats.append(drag)
+
+    def resizeEvent(self, event):
+        # Jede Größenänderung heißt: ganzes Fenster samt Web-View neu layouten
+        if self._drag is not None:
+            self._drag["relayouts"] += 1
+        super().resizeEvent(event)
 
     def toggle_maximize(self):
         self.showNormal() if self.isMaximized() else self.showMaximized()
 
     @Slot(QWebEngineDownloadRequest)
     def handle_download(self, download):
+        if download.isSavePageDownload() and self.archive.track(download):
+            return
         path, _ = QFileDialog.getSaveFileName(self, "Save File", download.suggestedFileName())
         if path:
             download.setDownloadFileName(path)
             download.accept()
 
     def closeEvent(self, event):
-        for tab in self._tabs:
+        self.settings_data.flush()
+        self.archive.flush()
+        self.history.close()
+        self._compact_session()
+        for tab in self.live_tabs():
             tab.setPage(QWebEnginePage())
             tab.deleteLater()
         self._tabs.clear()
+        self.spares.clear()
         super().closeEvent(event)
 
 if __name__ == "__main__":
+    profile_path = startup_profile_arg(sys.argv)
     app = QApplication(sys.argv)
-    app.setStyleSheet("""
-        QScrollBar:vertical { background:#0a0a14; width:6px; }
-        QScrollBar::handle:vertical { background:#3d2a5a; border-radius:3px; }
-        QScrollBar::handle:vertical:hover { background:#7a4aaa; }
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height:0px; }
-        QTabBar::tab { background:#0d0d1a; color:#6a5080; padding:6px; }
-        QTabBar::tab:selected { background:#12101e; color:#c8a8e8; }
-    """)
+    if profile_path:
+        STARTUP.enable(profile_path, lambda: browser.close())
+    STARTUP.mark("qapplication")
     browser = Browser("Void Browser")
     browser.show()
+    STARTUP.mark("show")
     sys.exit(app.exec())